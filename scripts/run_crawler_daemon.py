@@ -32,7 +32,9 @@ import queue
 import threading
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Optional, List, Dict, Callable
 
@@ -106,6 +108,9 @@ class CrawlerDaemon:
         # 通知器（延迟初始化）
         self._notifier = None
 
+        # 即时推送后台线程（单线程保证推送顺序，延迟创建）
+        self._push_pool: Optional[ThreadPoolExecutor] = None
+
     def _init_notifier(self):
         """初始化通知器"""
         if not self.enable_push:
@@ -249,46 +254,7 @@ class CrawlerDaemon:
             subject = "AI 分析报告"
 
             # 发送到各渠道
-            pushed = False
-            notif = self.cfg.notification  # 类型安全的通知配置
-
-            # 飞书推送
-            if notif.feishu_webhook_url:
-                if send_simple_feishu(
-                    notif.feishu_webhook_url,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # 钉钉推送
-            if notif.dingtalk_webhook_url:
-                if send_simple_dingtalk(
-                    notif.dingtalk_webhook_url,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # 企业微信推送
-            if notif.wework_webhook_url:
-                if send_simple_wework(
-                    notif.wework_webhook_url,
-                    subject, text_content,
-                    msg_type=notif.wework_msg_type,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # Telegram 推送
-            if notif.telegram_bot_token and notif.telegram_chat_id:
-                if send_simple_telegram(
-                    notif.telegram_bot_token,
-                    notif.telegram_chat_id,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
+            pushed = self._push_to_webhooks(subject, text_content)
 
             # 写入推送队列供 LangBot 读取
             self._write_push_queue(
@@ -307,6 +273,47 @@ class CrawlerDaemon:
         except Exception as e:
             logger.error("AI 增强推送失败: %s", e)
 
+    def _push_to_webhooks(self, subject: str, text_content: str) -> bool:
+        """并发推送到已配置的 webhook 渠道
+
+        各渠道互不依赖，并发发送后总耗时取决于最慢的渠道，而非各渠道之和。
+
+        Returns:
+            是否至少有一个渠道发送成功
+        """
+        notif = self.cfg.notification  # 类型安全的通知配置
+        sends = []
+
+        if notif.feishu_webhook_url:
+            sends.append(partial(
+                send_simple_feishu, notif.feishu_webhook_url,
+                subject, text_content, verbose=self.verbose,
+            ))
+        if notif.dingtalk_webhook_url:
+            sends.append(partial(
+                send_simple_dingtalk, notif.dingtalk_webhook_url,
+                subject, text_content, verbose=self.verbose,
+            ))
+        if notif.wework_webhook_url:
+            sends.append(partial(
+                send_simple_wework, notif.wework_webhook_url,
+                subject, text_content, msg_type=notif.wework_msg_type, verbose=self.verbose,
+            ))
+        if notif.telegram_bot_token and notif.telegram_chat_id:
+            sends.append(partial(
+                send_simple_telegram, notif.telegram_bot_token, notif.telegram_chat_id,
+                subject, text_content, verbose=self.verbose,
+            ))
+
+        if not sends:
+            return False
+        if len(sends) == 1:
+            return sends[0]()
+
+        with ThreadPoolExecutor(max_workers=len(sends), thread_name_prefix="push") as pool:
+            results = list(pool.map(lambda send: send(), sends))
+        return any(results)
+
     def _write_push_queue(self, push_type: str, subject: str, text_content: str,
                           html_content: str = None, items: list = None, ai_result=None):
         """写入推送队列供 LangBot 读取"""
@@ -397,6 +404,21 @@ class CrawlerDaemon:
         if self.verbose:
             logger.debug("AI 分析线程已启动（预留）")
 
+    def _schedule_notification(self, new_items: list):
+        """将即时推送交给后台线程发送
+
+        webhook 往返耗时不再计入轮询周期；单线程依次发送，推送顺序与发现顺序一致。
+        """
+        if self._push_pool is None:
+            self._push_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="push-dispatch")
+        self._push_pool.submit(self._send_notification, new_items)
+
+    def wait_pushes(self):
+        """等待已提交的即时推送发送完毕"""
+        if self._push_pool is not None:
+            self._push_pool.shutdown(wait=True)
+            self._push_pool = None
+
     def _send_notification(self, new_items: list):
         """发送即时通知（支持多渠道、多账号）"""
         if not new_items:
@@ -429,43 +451,9 @@ class CrawlerDaemon:
                 except Exception as e:
                     logger.error("邮件推送失败: %s", e)
 
-            # 飞书推送
-            if notif.feishu_webhook_url:
-                if send_simple_feishu(
-                    notif.feishu_webhook_url,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # 钉钉推送
-            if notif.dingtalk_webhook_url:
-                if send_simple_dingtalk(
-                    notif.dingtalk_webhook_url,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # 企业微信推送
-            if notif.wework_webhook_url:
-                if send_simple_wework(
-                    notif.wework_webhook_url,
-                    subject, text_content,
-                    msg_type=notif.wework_msg_type,
-                    verbose=self.verbose
-                ):
-                    pushed = True
-
-            # Telegram 推送
-            if notif.telegram_bot_token and notif.telegram_chat_id:
-                if send_simple_telegram(
-                    notif.telegram_bot_token,
-                    notif.telegram_chat_id,
-                    subject, text_content,
-                    verbose=self.verbose
-                ):
-                    pushed = True
+            # Webhook 渠道推送
+            if self._push_to_webhooks(subject, text_content):
+                pushed = True
 
             # 写入推送队列供 LangBot 读取
             self._write_push_queue(
@@ -612,9 +600,9 @@ class CrawlerDaemon:
                 if self.verbose:
                     logger.debug("发现 %d 条新消息", len(new_items))
 
-                # 即时推送
+                # 即时推送（后台发送，不阻塞本轮 AI 入队和下一次轮询）
                 if self.enable_push:
-                    self._send_notification(new_items)
+                    self._schedule_notification(new_items)
 
                 # 加入 AI 分析队列
                 if self.enable_ai and self._ai_queue:
@@ -686,6 +674,7 @@ class CrawlerDaemon:
 
         # 清理
         self._running = False
+        self.wait_pushes()
         self.runner.cleanup()
 
         # 停止 AI 队列
@@ -752,6 +741,7 @@ def main():
     if args.once:
         # 单次运行模式
         result = daemon.run_once()
+        daemon.wait_pushes()
         logger.info("单次运行完成: %s", result)
     else:
         # 守护进程模式
@@ -0,0 +1,75 @@
+# coding=utf-8
+"""
+配置管理器单元测试
+
+测试 config_manager.py 中的类型安全配置访问和缓存行为
+"""
+
+import pytest
+
+from trendradar.core.config_manager import (
+    AIConfig,
+    ConfigManager,
+    StorageConfig,
+)
+
+
+@pytest.fixture
+def raw_config():
+    """最小原始配置"""
+    return {
+        "FEISHU_WEBHOOK_URL": "https://open.feishu.cn/test",
+        "AI": {"MODEL": "openai/gpt-4o", "QUEUE": {"WORKERS": 4}},
+        "STORAGE": {"LOCAL": {"DATA_DIR": "data"}},
+    }
+
+
+class TestConfigManagerAccess:
+    """类型安全访问测试"""
+
+    def test_sections_are_parsed(self, raw_config):
+        """测试配置段解析为 dataclass"""
+        manager = ConfigManager(raw_config)
+        assert manager.ai.model == "openai/gpt-4o"
+        assert manager.ai.queue.workers == 4
+        assert manager.ai.queue.max_size == 100
+        assert manager.storage.local.data_dir == "data"
+
+    def test_sections_are_cached(self, raw_config):
+        """测试配置段只构建一次"""
+        manager = ConfigManager(raw_config)
+        assert manager.ai is manager.ai
+        assert manager.notification is manager.notification
+        # 缓存后作为实例属性直接读取，不再经过描述符
+        assert vars(manager)["ai"] is manager.ai
+
+    def test_missing_sections_use_defaults(self):
+        """测试缺失或为空的配置段使用默认值"""
+        manager = ConfigManager({"AI": None})
+        assert manager.ai == AIConfig()
+        assert manager.storage == StorageConfig()
+
+    def test_dict_access(self, raw_config):
+        """测试向后兼容的字典访问"""
+        manager = ConfigManager(raw_config)
+        assert manager.get("MISSING", 1) == 1
+        assert manager.get("AI") is raw_config["AI"]
+        assert manager["FEISHU_WEBHOOK_URL"] == "https://open.feishu.cn/test"
+        assert "AI" in manager
+        assert "MISSING" not in manager
+
+
+class TestConfigManagerValidate:
+    """配置验证测试"""
+
+    def test_warns_when_no_channel(self, caplog):
+        """测试启用通知但无渠道时记录警告"""
+        with caplog.at_level("WARNING"):
+            ConfigManager({"ENABLE_NOTIFICATION": True})
+        assert "未配置任何推送渠道" in caplog.text
+
+    def test_no_warning_with_channel(self, raw_config, caplog):
+        """测试配置了渠道时不警告"""
+        with caplog.at_level("WARNING"):
+            ConfigManager(raw_config)
+        assert "未配置任何推送渠道" not in caplog.text
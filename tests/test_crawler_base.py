@@ -0,0 +1,112 @@
+# coding=utf-8
+"""
+爬虫基类单元测试
+
+测试 base.py 中的批量获取完整内容
+"""
+
+import threading
+import time
+from typing import Tuple
+
+from trendradar.crawler.custom.base import (
+    BaseCrawler,
+    CrawlerNewsItem,
+    CrawlResult,
+    FetchStatus,
+)
+
+
+class ContentCrawler(BaseCrawler):
+    """记录请求开始时间的测试爬虫"""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.starts = {}
+        self.lock = threading.Lock()
+
+    def get_source_id(self) -> str:
+        return "content"
+
+    def get_source_name(self) -> str:
+        return "content-name"
+
+    def fetch_news_list(self) -> CrawlResult:
+        return CrawlResult(source_id="content", source_name="content-name")
+
+    def fetch_full_content(self, item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
+        with self.lock:
+            self.starts[item.seq] = time.monotonic()
+        time.sleep(0.05)
+        if item.seq == "bad":
+            raise RuntimeError("boom")
+        return f"full:{item.seq}", FetchStatus.SUCCESS
+
+
+def _item(seq, host):
+    return CrawlerNewsItem(seq=seq, title="t", url=f"http://{host}/{seq}")
+
+
+class TestFetchFullContentBatch:
+    """批量获取完整内容测试"""
+
+    def test_results_in_item_order_and_items_updated(self):
+        """测试结果按条目顺序返回，跳过已获取和无 URL 的条目"""
+        crawler = ContentCrawler()
+        done = CrawlerNewsItem(seq="done", title="t", full_content="old", content_fetched=True)
+        no_url = CrawlerNewsItem(seq="nourl", title="t")
+        items = [_item("a", "x.example"), done, no_url, _item("bad", "y.example")]
+        called = []
+
+        results = crawler.fetch_full_content_batch(
+            items, delay=0, callback=lambda item, content, status: called.append(item.seq)
+        )
+
+        assert list(results) == ["a", "done", "nourl", "bad"]
+        assert results["a"] == ("full:a", FetchStatus.SUCCESS)
+        assert results["done"] == ("old", FetchStatus.SUCCESS)
+        assert results["nourl"][1] == FetchStatus.EMPTY_RESULT
+        assert results["bad"][1] == FetchStatus.UNKNOWN_ERROR
+        assert items[0].content_fetched and not items[3].content_fetched
+        assert sorted(called) == ["a", "bad"]
+
+    def test_hosts_paced_independently(self):
+        """测试同一主机按间隔请求，不同主机并发请求"""
+        crawler = ContentCrawler()
+        items = [_item("a1", "a.example"), _item("a2", "a.example"), _item("b1", "b.example")]
+
+        crawler.fetch_full_content_batch(items, delay=0.2, max_workers=3)
+
+        starts = crawler.starts
+        assert starts["a2"] - starts["a1"] >= 0.19
+        assert abs(starts["b1"] - starts["a1"]) < 0.1
+
+    def test_single_worker_runs_sequentially_in_caller_thread(self):
+        """测试 max_workers=1 时在调用线程中按条目顺序获取"""
+        crawler = ContentCrawler()
+        threads, order = set(), []
+
+        def callback(item, content, status):
+            threads.add(threading.current_thread())
+            order.append(item.seq)
+
+        items = [_item("a", "a.example"), _item("b", "b.example")]
+        crawler.fetch_full_content_batch(items, delay=0, callback=callback, max_workers=1)
+
+        assert order == ["a", "b"]
+        assert crawler.starts["a"] < crawler.starts["b"]
+        assert threads == {threading.current_thread()}
+
+
+class TestCreateSession:
+    """请求会话测试"""
+
+    def test_session_uses_pooled_adapter(self):
+        """测试会话挂载带重试的连接池，并带上爬虫请求头"""
+        crawler = ContentCrawler({"pool_maxsize": 12})
+        session = crawler.create_session()
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 12
+        assert adapter.max_retries.total == 2
+        assert session.headers["User-Agent"] == crawler.get_request_headers()["User-Agent"]
+        session.close()
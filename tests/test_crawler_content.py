@@ -0,0 +1,152 @@
+# coding=utf-8
+"""
+文章正文提取单元测试
+
+测试 content.py 中的正文容器查找、段落过滤和去重
+"""
+
+import pytest
+
+from trendradar.crawler.custom.base import FetchStatus
+from trendradar.crawler.custom import content
+from trendradar.crawler.custom.content import (
+    HAS_HTML_PARSER,
+    decode_html,
+    extract_article_text,
+    read_article_bytes,
+)
+
+pytestmark = pytest.mark.skipif(not HAS_HTML_PARSER, reason="未安装 HTML 解析库")
+
+
+def test_paragraphs_filtered_and_deduplicated():
+    """测试段落去掉脚本、广告和过短文本，并按首次出现顺序去重"""
+    html = """
+    <html><body>
+      <div class="nav"><p>导航栏里的链接文字</p></div>
+      <div class="main-text article">
+        <script>var x = "脚本里的文字不应出现";</script>
+        <p>第一段正文内容比较长</p>
+        <p>短句</p>
+        <p>关注同花顺财经微信公众号获取更多</p>
+        <p>第二段正文内容也很长</p>
+        <p>第一段正文内容比较长</p>
+      </div>
+    </body></html>
+    """
+    text, status = extract_article_text(html)
+    assert status == FetchStatus.SUCCESS
+    assert text == "第一段正文内容比较长\n第二段正文内容也很长"
+
+
+def test_fallback_container_and_plain_text():
+    """测试 atc-content 容器且无段落时返回容器全部文本"""
+    html = '<div class="atc-content"><span>甲</span><span>乙</span><style>.a{}</style></div>'
+    text, status = extract_article_text(html)
+    assert status == FetchStatus.SUCCESS
+    assert text.split("\n") == ["甲", "乙"]
+
+
+def test_missing_or_empty_container():
+    """测试找不到容器为解析错误，容器为空为空结果"""
+    assert extract_article_text("<div class='other'>x</div>") == ("", FetchStatus.PARSE_ERROR)
+    assert extract_article_text("<div class='main-text'> </div>") == ("", FetchStatus.EMPTY_RESULT)
+
+
+def test_decode_html_charset_detection():
+    """测试按响应头或页面头部声明选择 GBK，否则按 UTF-8 解码"""
+    gbk_page = '<meta charset=gb2312><p>同花顺</p>'.encode("gbk")
+    assert "同花顺" in decode_html(gbk_page)
+    assert "同花顺" in decode_html("<p>同花顺</p>".encode("gbk"), "text/html; charset=GBK")
+    assert decode_html("<p>同花顺</p>".encode("utf-8"), "text/html") == "<p>同花顺</p>"
+
+
+def test_read_article_bytes_stops_after_container():
+    """测试首选容器闭合后停止读取，嵌套 div 正确计数"""
+    chunks = [
+        b'<html><div class="nav"><div>x</div></div><div class="a main-text"><di',
+        b'v><p>\xe6\xad\xa3\xe6\x96\x87</p></div><br/></div>',
+        b"<div class='ads'>AD</div>",
+        b"<script>never read</script>",
+    ]
+    consumed = []
+
+    def iterate():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    data = read_article_bytes(iterate())
+    assert data.endswith(b"<br/></div>")
+    assert len(consumed) == 2
+    text, status = extract_article_text(data.decode("utf-8"))
+    assert (text, status) == ("正文", FetchStatus.SUCCESS)
+
+
+def test_read_article_bytes_reads_all_without_primary_container():
+    """测试没有首选容器时读取完整页面"""
+    chunks = [b'<div class="atc-content"><p>a</p></div>', b"<p>tail</p>"]
+    assert read_article_bytes(iter(chunks)) == b"".join(chunks)
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+
+class _FakeSession:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _FakeResponse(self.body)
+
+    def close(self):
+        pass
+
+
+def test_ths_crawlers_share_content_cache():
+    """测试两个同花顺爬虫共用按 URL 缓存的正文，重复文章不再请求"""
+    from trendradar.crawler.custom import THSCrawler, THSTappCrawler
+    from trendradar.crawler.custom.base import CrawlerNewsItem
+    from trendradar.crawler.custom.content import _content_cache
+
+    _content_cache.clear()
+    body = '<div class="main-text"><p>这是一段足够长的正文</p></div>'.encode("utf-8")
+    tapp, ths = THSTappCrawler(), THSCrawler()
+    tapp.session = _FakeSession(body)
+    ths.session = _FakeSession(body)
+    item = CrawlerNewsItem(seq="1", title="t", url="https://news.example/1.shtml")
+
+    assert tapp.fetch_full_content(item) == ("这是一段足够长的正文", FetchStatus.SUCCESS)
+    assert ths.fetch_full_content(item) == ("这是一段足够长的正文", FetchStatus.SUCCESS)
+    assert len(tapp.session.urls) == 1
+    assert ths.session.urls == []
+    _content_cache.clear()
+
+
+@pytest.mark.skipif(
+    not (content.LXML_AVAILABLE and content.HAS_BS4), reason="需要同时安装 lxml 和 BeautifulSoup"
+)
+def test_lxml_matches_bs4():
+    """测试 lxml 直接解析与 BeautifulSoup 提取结果一致"""
+    pages = [
+        '<div class="x main-text"><p> 第一段 <b>加粗</b> 正文 </p><style>p{}</style>'
+        '<!-- 注释 --><p>第二段正文内容</p></div>',
+        '<div class="atc-content">没有段落的<span>正文</span><script>x()</script></div>',
+        '<div class="nav"><p>没有正文容器</p></div>',
+    ]
+    for html in pages:
+        assert content._extract_with_lxml(html) == content._extract_with_bs4(html)
@@ -0,0 +1,369 @@
+# coding=utf-8
+"""
+爬虫新闻过滤器单元测试
+
+测试 filter.py 中的关键词组加载和三层过滤逻辑
+"""
+
+import os
+
+import pytest
+
+from trendradar.crawler.custom.base import CrawlerNewsItem
+from trendradar.crawler.custom.filter import (
+    filter_news_item,
+    filter_news_items,
+    load_frequency_words_for_crawler,
+)
+
+
+FREQUENCY_WORDS = """\
+# 注释
+[GLOBAL_FILTER]
+广告
+
+[WORD_GROUPS]
+[能源]
+石油
+原油
+!谣言
+
+[央行政策]
++央行
++降息
+
+[芯片]
+/GPU|NPU/
+"""
+
+
+@pytest.fixture
+def word_config(tmp_path):
+    """从临时 frequency_words.txt 加载关键词配置"""
+    path = tmp_path / "frequency_words.txt"
+    path.write_text(FREQUENCY_WORDS, encoding="utf-8")
+    return load_frequency_words_for_crawler(str(path))
+
+
+def _item(title: str, summary: str = "", full_content: str = "") -> CrawlerNewsItem:
+    return CrawlerNewsItem(seq="1", title=title, summary=summary, full_content=full_content)
+
+
+class TestLoadFrequencyWords:
+    """关键词配置加载测试"""
+
+    def test_groups_parsed(self, word_config):
+        """测试关键词组、过滤词和全局过滤词解析"""
+        word_groups, filter_words, global_filters = word_config
+        names = [g["display_name"] for g in word_groups]
+        assert names == ["WORD_GROUPS", "能源", "央行政策", "芯片"]
+        assert filter_words == ("谣言",)
+        assert global_filters == ("广告",)
+
+    def test_missing_file(self, tmp_path):
+        """测试文件不存在时返回空配置"""
+        groups, filters, global_filters = load_frequency_words_for_crawler(
+            str(tmp_path / "missing.txt")
+        )
+        assert (groups, filters, global_filters) == ((), (), ())
+
+    def test_cached_until_file_changes(self, tmp_path):
+        """测试文件未变化时复用缓存，修改后重新解析"""
+        path = tmp_path / "frequency_words.txt"
+        path.write_text("[A]\n石油\n", encoding="utf-8")
+        first = load_frequency_words_for_crawler(str(path))
+        assert load_frequency_words_for_crawler(str(path)) is first
+
+        path.write_text("[A]\n石油\n[B]\n芯片\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = load_frequency_words_for_crawler(str(path))
+        assert [g["name"] for g in second[0]] == ["A", "B"]
+
+    def test_rewrite_with_same_mtime_detected(self, tmp_path):
+        """测试修改时间不变但内容长度变化时重新解析"""
+        path = tmp_path / "frequency_words.txt"
+        path.write_text("[A]\n石油\n", encoding="utf-8")
+        mtime_ns = path.stat().st_mtime_ns
+        load_frequency_words_for_crawler(str(path))
+
+        path.write_text("[A]\n石油\n天然气\n", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        groups, _, _ = load_frequency_words_for_crawler(str(path))
+        assert groups[0]["words"] == ["石油", "天然气"]
+
+
+class TestFilterNewsItem:
+    """单条过滤测试"""
+
+    def test_word_match(self, word_config):
+        """测试普通词匹配"""
+        passed, keywords, reason = filter_news_item(_item("国际原油价格上涨"), *word_config)
+        assert passed
+        assert keywords == ["能源"]
+        assert reason == ""
+
+    def test_excluded_word(self, word_config):
+        """测试组内排除词"""
+        passed, keywords, _ = filter_news_item(_item("石油谣言"), *word_config)
+        assert not passed
+        assert keywords == []
+
+    def test_required_words(self, word_config):
+        """测试必须词需全部匹配"""
+        assert not filter_news_item(_item("央行发布公告"), *word_config)[0]
+        passed, keywords, _ = filter_news_item(_item("央行宣布降息"), *word_config)
+        assert passed
+        assert keywords == ["央行政策"]
+
+    def test_pattern_case_insensitive(self, word_config):
+        """测试正则表达式忽略大小写"""
+        passed, keywords, _ = filter_news_item(_item("新款 gpu 发布"), *word_config)
+        assert passed
+        assert keywords == ["芯片"]
+
+    def test_global_filter(self, word_config):
+        """测试全局过滤词匹配任一层内容"""
+        passed, keywords, reason = filter_news_item(
+            _item("原油", full_content="这是一条广告"), *word_config
+        )
+        assert not passed
+        assert keywords == []
+        assert "广告" in reason
+
+    def test_match_in_later_layer(self, word_config):
+        """测试摘要或全文中的关键词也能匹配"""
+        passed, keywords, _ = filter_news_item(
+            _item("今日要闻", summary="石油", full_content="NPU 芯片"), *word_config
+        )
+        assert passed
+        assert keywords == ["能源", "芯片"]
+
+    def test_no_match(self, word_config):
+        """测试无匹配关键词"""
+        passed, keywords, reason = filter_news_item(_item("体育新闻"), *word_config)
+        assert not passed
+        assert reason == "无匹配关键词"
+
+
+class TestFilterNewsItems:
+    """批量过滤测试"""
+
+    def test_split_and_mark(self, word_config):
+        """测试批量过滤拆分结果并回写条目状态"""
+        items = [_item("原油大涨"), _item("体育新闻")]
+        passed, filtered = filter_news_items(items, *word_config)
+        assert passed == [items[0]]
+        assert filtered == [items[1]]
+        assert items[0].matched_keywords == ["能源"]
+        assert items[1].filtered_out
+        assert items[1].filter_reason == "无匹配关键词"
+
+
+class TestHandBuiltGroups:
+    """手工构造关键词组测试"""
+
+    def test_unprepared_group_is_prepared_on_first_use(self):
+        """测试未经加载器预处理的组首次匹配时自动补齐"""
+        group = {"display_name": "AI", "words": ["OpenAI"], "required": ["+Model"]}
+        passed, keywords, _ = filter_news_item(_item("openai new model"), [group], [], [])
+        assert passed
+        assert keywords == ["AI"]
+        assert group["_words_lc"] == ["openai"]
+        assert group["_required_lc"] == ["model"]
+
+
+class TestKeywordIndex:
+    """多模式匹配索引测试"""
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_index_matches_per_group_scan(self, word_config, monkeypatch, use_automaton):
+        """测试索引判定结果与逐组匹配一致（自动机与正则两种实现）"""
+        from trendradar.crawler.custom import filter as filter_module
+
+        if use_automaton and not filter_module.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick 未安装")
+        monkeypatch.setattr(filter_module, "AHOCORASICK_AVAILABLE", use_automaton)
+
+        word_groups, filter_words, _ = word_config
+        index = filter_module._KeywordIndex(word_groups)
+        texts = ["石油谣言", "原油", "央行降息", "央行", "GPU", "npu 石油", "无关"]
+        for text in texts:
+            expected = [
+                g for g in word_groups
+                if filter_module._matches_word_group(text, g, filter_words)
+            ]
+            assert index.match(text) == expected, text
+
+    def test_regex_index_reports_overlapping_keywords(self, monkeypatch):
+        """测试正则实现能命中同一位置开始的较短关键词"""
+        from trendradar.crawler.custom import filter as filter_module
+
+        monkeypatch.setattr(filter_module, "AHOCORASICK_AVAILABLE", False)
+        groups = [
+            {"display_name": "短", "words": ["石"]},
+            {"display_name": "长", "words": ["石油"]},
+            {"display_name": "后缀", "words": ["油价"]},
+        ]
+        index = filter_module._KeywordIndex(groups)
+        assert index.find_keywords("石油价格") == {"石", "石油", "油价"}
+        assert [g["display_name"] for g in index.match("石油价格")] == ["短", "长", "后缀"]
+
+
+class TestCrawlerNewsItemSerialization:
+    """新闻条目序列化测试"""
+
+    def test_round_trip(self):
+        """测试 to_dict/from_dict 往返一致"""
+        item = CrawlerNewsItem(seq="7", title="标题", extra={"code": "600000"})
+        item.matched_keywords = ["能源"]
+        data = item.to_dict()
+        assert list(data)[:2] == ["seq", "title"]
+        assert len(data) == 17
+        assert CrawlerNewsItem.from_dict(data) == item
+
+    def test_from_dict_defaults(self):
+        """测试缺失字段使用默认值且可变默认值不共享"""
+        first = CrawlerNewsItem.from_dict({})
+        second = CrawlerNewsItem.from_dict({"title": "t"})
+        assert first.seq == "" and first.title == ""
+        assert second.title == "t"
+        first.extra["k"] = 1
+        assert second.extra == {}
+
+
+class TestGlobalFilterOrdering:
+    """全局过滤词命中排序测试"""
+
+    def test_frequent_filter_checked_first(self, monkeypatch):
+        """测试批量过滤时命中多的过滤词先检查"""
+        from collections import Counter
+        from trendradar.crawler.custom import filter as filter_module
+
+        monkeypatch.setattr(filter_module, "_global_filter_hits", Counter())
+        group = {"display_name": "G", "words": ["新闻"]}
+        global_filters = ["推广", "广告"]
+
+        filter_news_items([_item("广告新闻")], [group], [], global_filters)
+        assert filter_module._global_filter_hits["广告"] == 1
+
+        # 同时命中两个过滤词时，报告先检查的（命中更多的）那个
+        _, filtered = filter_news_items([_item("推广广告新闻")], [group], [], global_filters)
+        assert filtered[0].filter_reason == "全局过滤词匹配: 广告"
+
+    def test_counts_decay(self, monkeypatch):
+        """测试计数达到阈值后整体减半"""
+        from collections import Counter
+        from trendradar.crawler.custom import filter as filter_module
+
+        hits = Counter({"a": filter_module._GLOBAL_FILTER_DECAY_AT - 1, "b": 10})
+        monkeypatch.setattr(filter_module, "_global_filter_hits", hits)
+        filter_module._record_global_filter_hit("a")
+        assert hits["a"] == filter_module._GLOBAL_FILTER_DECAY_AT // 2
+        assert hits["b"] == 5
+
+
+class TestFilterIndexReuse:
+    """过滤索引复用测试"""
+
+    def test_tuple_config_reuses_keyword_index(self):
+        """测试元组形式的关键词配置跨批次复用索引，列表配置每次重建"""
+        from trendradar.crawler.custom import filter as filter_module
+
+        groups = ({"display_name": "G", "words": ["新闻"]},)
+        assert filter_module._get_keyword_index(groups) is filter_module._get_keyword_index(groups)
+        as_list = list(groups)
+        assert filter_module._get_keyword_index(as_list) is not filter_module._get_keyword_index(as_list)
+
+    def test_global_filter_nested_words(self, monkeypatch):
+        """测试全局过滤词互相包含时仍按配置顺序报告"""
+        from collections import Counter
+        from trendradar.crawler.custom import filter as filter_module
+
+        monkeypatch.setattr(filter_module, "_global_filter_hits", Counter())
+        group = {"display_name": "G", "words": ["新闻"]}
+        _, filtered = filter_news_items([_item("软广告新闻")], [group], [], ["软广告", "广告"])
+        assert filtered[0].filter_reason == "全局过滤词匹配: 软广告"
+        passed, _ = filter_news_items([_item("普通新闻")], [group], [], ["软广告", "广告"])
+        assert len(passed) == 1
+
+
+class TestCrawlTimestamps:
+    """爬取结果与异常时间戳测试"""
+
+    def test_default_timestamps(self):
+        """测试未指定时自动填充 ISO 格式时间"""
+        from datetime import datetime
+        from trendradar.crawler.custom.base import CrawlerError, CrawlResult, FetchStatus
+
+        result = CrawlResult(source_id="s", source_name="n", items=[], status=FetchStatus.SUCCESS)
+        error = CrawlerError("boom")
+        for value in (result.fetch_time, error.timestamp):
+            assert datetime.fromisoformat(value).year >= 2024
+
+
+class TestLayerIndependence:
+    """分层判定测试"""
+
+    def test_required_words_must_share_a_layer(self, word_config):
+        """测试必须词分散在不同层时不匹配"""
+        passed, _, _ = filter_news_item(_item("央行发布", summary="降息预期"), *word_config)
+        assert not passed
+
+
+class TestFormatFilterResult:
+    """过滤结果格式化测试"""
+
+    def test_format(self):
+        """测试输出格式与截断提示"""
+        from trendradar.crawler.custom.filter import format_filter_result
+
+        passed = [_item(f"通过{i}") for i in range(11)]
+        passed[0].matched_keywords = ["能源", "芯片"]
+        filtered = [_item("过滤")]
+        filtered[0].filter_reason = "无匹配关键词"
+
+        lines = format_filter_result(passed, filtered).split("\n")
+        assert lines[:4] == ["=== 过滤结果 ===", "通过: 11 条", "过滤: 1 条", ""]
+        assert lines[5] == "  [1] 通过0... | 关键词: 能源, 芯片"
+        assert lines[6] == "  [1] 通过1... | 关键词: 无"
+        assert lines[15] == "  ... 还有 1 条"
+        assert lines[-1] == "  [1] 过滤... | 原因: 无匹配关键词"
+
+    def test_generated_matcher_edge_cases(self):
+        """测试生成的判定函数处理特殊字符、无效正则和空组"""
+        from trendradar.crawler.custom import filter as filter_module
+
+        groups = [
+            {"display_name": "引号", "words": ["it's", 'say "hi"', "a\\b"]},
+            {"display_name": "无效正则", "patterns": ["/(/"]},
+            {"display_name": "空组"},
+            {"display_name": "必须词", "required": ["+x"], "excluded": ["!y"]},
+        ]
+        index = filter_module._KeywordIndex(groups)
+        for text in ["IT'S here", 'they say "hi"', "a\\b", "(", "x", "x y", "none"]:
+            expected = [g for g in groups if filter_module._matches_word_group(text, g, [])]
+            assert index.match(text) == expected, text
+
+
+class TestPatternCaseFolding:
+    """正则大小写处理测试"""
+
+    def test_lowercase_pattern_skips_ignorecase(self):
+        """测试小写表达式不带 IGNORECASE，含大写的表达式保留"""
+        import re
+        from trendradar.crawler.custom.filter import _compile_patterns
+
+        lower, upper = _compile_patterns(["/gpu\\d+/", "/[A-Z]{3}/"])
+        assert not lower.flags & re.IGNORECASE
+        assert upper.flags & re.IGNORECASE
+
+    @pytest.mark.parametrize("pattern, text", [
+        ("/gpu\\d+/", "New GPU4090"),
+        ("/[A-Z]{3}/", "abc"),
+        ("/\\D{2}x/", "ABX"),
+    ])
+    def test_patterns_still_case_insensitive(self, pattern, text):
+        """测试匹配结果保持忽略大小写"""
+        group = {"display_name": "P", "patterns": [pattern]}
+        assert filter_news_item(_item(text), [group], [], [])[0]
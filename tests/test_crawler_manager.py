@@ -0,0 +1,454 @@
+# coding=utf-8
+"""
+爬虫管理器单元测试
+
+测试 manager.py 中的增量检测、SQLite 持久化和错误日志
+"""
+
+import queue
+import threading
+from typing import Tuple
+
+import pytest
+
+from trendradar.crawler.custom.base import (
+    BaseCrawler,
+    CrawlerNewsItem,
+    CrawlResult,
+    FetchStatus,
+)
+from trendradar.crawler.custom.manager import CrawlerManager
+
+
+class FakeCrawler(BaseCrawler):
+    """返回固定条目的测试爬虫"""
+
+    def __init__(self, source_id: str = "fake", items=None):
+        super().__init__()
+        self.source_id = source_id
+        self.items = items or []
+
+    def get_source_id(self) -> str:
+        return self.source_id
+
+    def get_source_name(self) -> str:
+        return f"{self.source_id}-name"
+
+    def fetch_news_list(self) -> CrawlResult:
+        items = [CrawlerNewsItem.from_dict(item.to_dict()) for item in self.items]
+        return CrawlResult(
+            source_id=self.source_id,
+            source_name=self.get_source_name(),
+            items=items,
+            status=FetchStatus.SUCCESS,
+        )
+
+    def fetch_full_content(self, item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
+        return f"full:{item.seq}", FetchStatus.SUCCESS
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """使用临时数据库的爬虫管理器"""
+    mgr = CrawlerManager(
+        config={"full_content": {"fetch_delay": 0}},
+        db_path=str(tmp_path / "crawler.db"),
+    )
+    yield mgr
+    mgr.cleanup()
+
+
+def _items(*seqs):
+    return [CrawlerNewsItem(seq=seq, title=f"title-{seq}") for seq in seqs]
+
+
+class TestPersistence:
+    """持久化测试"""
+
+    def test_crawl_saves_and_detects_new(self, manager):
+        """测试爬取后保存条目，再次爬取只有新条目计入新增"""
+        crawler = FakeCrawler(items=_items("1", "2"))
+        manager.register(crawler)
+
+        first = manager.crawl_all()["fake"]
+        assert first.new_count == 2
+
+        crawler.items = _items("1", "2", "3")
+        second = manager.crawl_all()["fake"]
+        assert second.new_count == 1
+
+        saved = manager.get_items(source_id="fake")
+        assert sorted(item.seq for item in saved) == ["1", "2", "3"]
+
+    def test_seen_items_loaded_on_register(self, tmp_path):
+        """测试重新注册时从数据库加载已见条目"""
+        db_path = str(tmp_path / "crawler.db")
+        first = CrawlerManager(db_path=db_path)
+        first.register(FakeCrawler(items=_items("1")))
+        first.crawl_all()
+        first.cleanup()
+
+        second = CrawlerManager(db_path=db_path)
+        try:
+            second.register(FakeCrawler(items=_items("1", "2")))
+            assert list(second.seen_items["fake"]) == ["1"]
+            assert second.crawl_all()["fake"].new_count == 1
+        finally:
+            second.cleanup()
+
+    def test_seen_cache_is_bounded(self, tmp_path):
+        """测试已见条目 LRU 有上限，淘汰后由数据库确认不重复计为新增"""
+        mgr = CrawlerManager(config={"seen_cache_size": 2}, db_path=str(tmp_path / "crawler.db"))
+        try:
+            crawler = FakeCrawler(items=_items("1", "2", "3"))
+            mgr.register(crawler)
+            assert mgr.crawl_all()["fake"].new_count == 3
+            assert list(mgr.seen_items["fake"]) == ["2", "3"]
+
+            crawler.items = _items("1", "4")
+            assert mgr.crawl_all()["fake"].new_count == 1
+            assert len(mgr.seen_items["fake"]) == 2
+        finally:
+            mgr.cleanup()
+
+    def test_duplicate_seq_in_batch_counted_once(self, manager):
+        """测试同一批次内重复的 seq 只计为一次新增"""
+        manager.register(FakeCrawler(items=_items("1", "1")))
+        assert manager.crawl_all()["fake"].new_count == 1
+
+    def test_full_content_update(self, manager):
+        """测试同步获取完整内容后写回数据库"""
+        crawler = FakeCrawler(items=_items("1"))
+        manager.register(crawler)
+        items = manager.crawl_all()["fake"].items
+
+        manager.fetch_full_content("fake", items, async_mode=False)
+
+        saved = manager.get_items(source_id="fake")[0]
+        assert saved.full_content == "full:1"
+        assert saved.content_fetched
+
+    def test_extra_round_trip(self, manager):
+        """测试 extra 字段序列化后可原样读回（含中文）"""
+        manager.register(FakeCrawler())
+        item = CrawlerNewsItem(seq="1", title="t", extra={"板块": "科技", "rank": 3})
+        manager._save_items("fake", "fake-name", [item])
+
+        stored = manager._query("SELECT extra_data FROM crawler_raw")[0][0]
+        assert isinstance(stored, str) and "科技" in stored
+        assert manager.get_items(source_id="fake")[0].extra == {"板块": "科技", "rank": 3}
+
+    def test_get_items_selected_fields(self, manager):
+        """测试 get_items 只读取指定字段，未选字段保持默认值"""
+        manager.register(FakeCrawler())
+        item = CrawlerNewsItem(seq="1", title="t", url="http://x", full_content="body")
+        manager._save_items("fake", "fake-name", [item])
+
+        full = manager.get_items(source_id="fake")[0]
+        assert (full.url, full.full_content) == ("http://x", "body")
+
+        light = manager.get_items(source_id="fake", fields=["url"])[0]
+        assert (light.seq, light.title, light.url) == ("1", "t", "http://x")
+        assert light.full_content == ""
+
+        with pytest.raises(ValueError):
+            manager.get_items(fields=["nope"])
+
+    def test_concurrent_writes(self, manager):
+        """测试多线程共享连接写入不丢数据"""
+        manager.register(FakeCrawler())
+
+        def save(prefix):
+            manager._save_items("fake", "fake-name", _items(*[f"{prefix}-{i}" for i in range(20)]))
+
+        threads = [threading.Thread(target=save, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(manager.get_items(source_id="fake", limit=1000)) == 80
+
+
+class TestErrorLog:
+    """错误日志测试"""
+
+    def test_log_error_persisted(self, manager):
+        """测试错误写入数据库并可查询"""
+        manager.log_error("fake", "fetch_list", "http://x", "boom")
+        errors = manager.get_errors(source_id="fake")
+        assert len(errors) == 1
+        assert errors[0].error_message == "boom"
+
+    def test_memory_fallback_without_db(self):
+        """测试无数据库时从内存返回错误日志"""
+        mgr = CrawlerManager(config={"max_error_log": 2})
+        for i in range(3):
+            mgr.log_error("s", "op", "", f"e{i}")
+        assert [e.error_message for e in mgr.get_errors()] == ["e1", "e2"]
+
+    def test_error_storm_multi_row_insert(self, manager):
+        """测试多行 INSERT 写入整块与余下的错误日志均不丢失"""
+        rows = [(f"2025-01-01T00:00:{i:02}.{i:06}", "s", "op", "", "unknown", f"e{i}", "")
+                for i in range(230)]
+        with manager._transaction() as conn:
+            manager._insert_errors(conn, rows)
+        messages = {e.error_message for e in manager.get_errors(limit=500)}
+        assert messages == {f"e{i}" for i in range(230)}
+
+    def test_background_writes_flushed_on_cleanup(self, tmp_path):
+        """测试后台写线程在 cleanup 时提交完剩余写操作并退出"""
+        db_path = str(tmp_path / "crawler.db")
+        mgr = CrawlerManager(db_path=db_path)
+        for i in range(50):
+            mgr.log_error("fake", "op", "", f"e{i}")
+        writer = mgr._writer
+        mgr.cleanup()
+        assert not writer.is_alive()
+
+        reopened = CrawlerManager(db_path=db_path)
+        try:
+            assert len(reopened.get_errors(limit=100)) == 50
+        finally:
+            reopened.cleanup()
+
+
+class TestConnectionSettings:
+    """数据库连接设置测试"""
+
+    def test_wal_mode_enabled(self, manager):
+        """测试数据库使用 WAL 模式"""
+        assert manager._query("PRAGMA journal_mode")[0][0] == "wal"
+
+    def test_source_queries_use_composite_index(self, manager):
+        """测试按数据源查询最新条目与错误时走复合索引"""
+        plan = manager._query(
+            "EXPLAIN QUERY PLAN SELECT * FROM crawler_raw WHERE source_id = ? "
+            "ORDER BY first_seen DESC LIMIT 10", ("fake",)
+        )
+        assert "idx_crawler_raw_src_first_seen" in plan[0][3]
+        plan = manager._query(
+            "EXPLAIN QUERY PLAN SELECT * FROM crawler_errors WHERE source_id = ? "
+            "ORDER BY timestamp DESC LIMIT 10", ("fake",)
+        )
+        assert "idx_crawler_errors_src_time" in plan[0][3]
+        assert manager._query("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+
+    def test_cleanup_old_data(self, manager):
+        """测试按数量清理旧数据后仍可正常读写"""
+        manager.register(FakeCrawler())
+        manager._save_items("fake", "fake-name", _items("1", "2", "3"))
+        assert manager.cleanup_old_data(max_items=2, max_days=0) == 1
+        assert sorted(item.seq for item in manager.get_items(source_id="fake")) == ["2", "3"]
+        assert manager.cleanup_old_data(max_items=2, max_days=0) == 0
+
+
+    def test_crawler_sessions_share_adapter(self):
+        """测试注册的爬虫会话共用管理器的连接池，各自的请求头不变"""
+        from trendradar.crawler.custom.ths import THSCrawler
+        from trendradar.crawler.custom.ths_tapp import THSTappCrawler
+
+        mgr = CrawlerManager()
+        ths, tapp = THSCrawler(), THSTappCrawler()
+        tapp.get_source_id = lambda: "ths-tapp"
+        mgr.register(ths)
+        mgr.register(tapp)
+        try:
+            adapter = ths.session.get_adapter("https://example.com")
+            assert adapter is mgr._http_adapter
+            assert tapp.session.get_adapter("http://example.com") is adapter
+            assert ths.session.headers["Referer"] != tapp.session.headers.get("Referer")
+        finally:
+            mgr.cleanup()
+
+
+class TestParallelCrawl:
+    """多数据源并发爬取测试"""
+
+    def test_sources_fetched_concurrently(self, manager):
+        """测试多个数据源的列表请求并发执行且结果按注册顺序返回"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingCrawler(FakeCrawler):
+            def fetch_news_list(self):
+                barrier.wait()  # 两个请求必须同时进行才能通过
+                return super().fetch_news_list()
+
+        manager.register(BlockingCrawler("a", _items("1")))
+        manager.register(BlockingCrawler("b", _items("2")))
+
+        saved_before_callback = []
+        manager.on_new_items(
+            lambda sid, items: saved_before_callback.append(len(manager.get_items(source_id=sid)))
+        )
+
+        results = manager.crawl_all()
+        assert list(results) == ["a", "b"]
+        assert all(r.status == FetchStatus.SUCCESS for r in results.values())
+        assert saved_before_callback == [1, 1]
+
+    def test_failed_source_does_not_block_others(self, manager):
+        """测试单个数据源异常不影响其他数据源"""
+        class BrokenCrawler(FakeCrawler):
+            def fetch_news_list(self):
+                raise RuntimeError("down")
+
+        manager.register(BrokenCrawler("broken"))
+        manager.register(FakeCrawler("ok", _items("1")))
+
+        results = manager.crawl_all()
+        assert results["broken"].status == FetchStatus.UNKNOWN_ERROR
+        assert results["ok"].new_count == 1
+        assert manager.stats["broken"].last_error == "down"
+
+    def test_crawl_single_fetches_only_that_source(self, manager):
+        """测试 crawl_single 只请求指定数据源"""
+        manager.register(FakeCrawler("a", _items("1")))
+        manager.register(FakeCrawler("b", _items("2")))
+
+        result = manager.crawl_single("a")
+        assert result.new_count == 1
+        assert manager.stats["a"].total_fetches == 1
+        assert manager.stats["b"].total_fetches == 0
+        assert [item.seq for item in manager.get_items(source_id="a")] == ["1"]
+        assert manager.crawl_single("missing") is None
+
+
+class TestFullContentFetch:
+    """完整内容获取测试"""
+
+    def test_hosts_fetched_concurrently(self, manager):
+        """测试不同主机并发获取，同一主机顺序获取"""
+        barrier = threading.Barrier(2, timeout=5)
+        active = {}
+        overlaps = []
+        lock = threading.Lock()
+
+        class HostCrawler(FakeCrawler):
+            def fetch_full_content(self, item):
+                host = item.url.split("/")[2]
+                with lock:
+                    overlaps.append(active.get(host, 0))
+                    active[host] = active.get(host, 0) + 1
+                if item.seq in ("a1", "b1"):
+                    barrier.wait()  # 两个主机的首个请求必须同时进行
+                with lock:
+                    active[host] -= 1
+                return super().fetch_full_content(item)
+
+        manager.register(HostCrawler())
+        items = [
+            CrawlerNewsItem(seq="a1", title="t", url="http://a.example/1"),
+            CrawlerNewsItem(seq="a2", title="t", url="http://a.example/2"),
+            CrawlerNewsItem(seq="b1", title="t", url="http://b.example/1"),
+        ]
+        manager.fetch_full_content("fake", items, async_mode=False)
+
+        assert all(item.content_fetched for item in items)
+        assert overlaps == [0, 0, 0]
+
+    def test_async_fetch_reuses_content_pool(self, manager):
+        """测试异步获取提交到常驻线程池，多次调用复用同一线程池"""
+        manager.register(FakeCrawler())
+        done = threading.Event()
+        manager.on_content_fetched(lambda source_id, item: done.set())
+
+        items = [CrawlerNewsItem(seq="1", title="t", url="http://a.example/1")]
+        manager.fetch_full_content("fake", items, async_mode=True)
+        pool = manager._content_pool
+        assert done.wait(5)
+
+        manager.fetch_full_content("fake", [CrawlerNewsItem(seq="2", title="t")], async_mode=True)
+        assert manager._content_pool is pool
+
+    def test_cleanup_drains_inflight_fetch_without_reopening(self, tmp_path):
+        """测试 cleanup 等待进行中的内容获取，之后不再重启写线程或重新打开连接"""
+        started = threading.Event()
+        release = threading.Event()
+        fetched = []
+
+        class BlockingCrawler(FakeCrawler):
+            def fetch_full_content(self, item):
+                started.set()
+                release.wait(5)
+                fetched.append(item.seq)
+                return super().fetch_full_content(item)
+
+        db_path = str(tmp_path / "crawler.db")
+        mgr = CrawlerManager(config={"full_content": {"fetch_delay": 0}}, db_path=db_path)
+        crawler = BlockingCrawler(items=_items("1", "2"))
+        mgr.register(crawler)
+        items = mgr.crawl_all()["fake"].items
+        for item in items:
+            item.url = f"http://a.example/{item.seq}"
+
+        mgr.fetch_full_content("fake", items, async_mode=True)
+        assert started.wait(5)
+        cleaner = threading.Thread(target=mgr.cleanup)
+        cleaner.start()
+        release.set()
+        cleaner.join(5)
+
+        assert not cleaner.is_alive()
+        assert fetched == [items[0].seq]
+        assert mgr._writer is None and mgr._conn is None
+        mgr.log_error("fake", "op", "", "after cleanup")
+        assert mgr._writer is None and mgr._conn is None
+
+        reopened = CrawlerManager(db_path=db_path)
+        try:
+            saved = {item.seq: item for item in reopened.get_items(source_id="fake")}
+            assert saved[items[0].seq].content_fetched
+            assert not saved[items[1].seq].content_fetched
+        finally:
+            reopened.cleanup()
+
+    def test_write_failure_with_full_queue_does_not_deadlock(self, tmp_path):
+        """测试队列已满、生产者持锁阻塞时写入失败，写线程记录错误不会死锁"""
+        mgr = CrawlerManager(db_path=str(tmp_path / "crawler.db"))
+        mgr._write_q = queue.Queue(maxsize=2)
+
+        def produce():
+            for i in range(200):
+                mgr._enqueue_write("INSERT INTO missing_table VALUES (?)", (i,))
+
+        producers = [threading.Thread(target=produce, daemon=True) for _ in range(4)]
+        for thread in producers:
+            thread.start()
+        for thread in producers:
+            thread.join(10)
+        assert not any(thread.is_alive() for thread in producers)
+
+        cleaner = threading.Thread(target=mgr.cleanup, daemon=True)
+        cleaner.start()
+        cleaner.join(10)
+        assert not cleaner.is_alive()
+        assert any(e.operation == "db_write" for e in mgr.error_log)
+
+    def test_failed_write_only_drops_bad_op(self, manager):
+        """测试批量写入中单条失败时，其余写操作逐条重试后仍然提交"""
+        manager.register(FakeCrawler(items=_items("1", "2")))
+        items = manager.crawl_all()["fake"].items
+        for item in items:
+            item.full_content = f"full:{item.seq}"
+            item.content_fetched = True
+
+        manager._update_item_content("fake", items[0])
+        manager._enqueue_write("INSERT INTO missing_table VALUES (?)", (1,))
+        manager._update_item_content("fake", items[1])
+        manager.flush()
+
+        saved = manager.get_items(source_id="fake")
+        assert all(item.content_fetched for item in saved)
+        assert any(e.operation == "db_write" for e in manager.error_log)
+
+    def test_db_error_log_trimmed_on_cleanup(self, tmp_path):
+        """测试清理时数据库错误日志只保留最新的 max_error_log 条"""
+        mgr = CrawlerManager(config={"max_error_log": 2}, db_path=str(tmp_path / "crawler.db"))
+        try:
+            for i in range(4):
+                mgr.log_error("s", "op", "", f"e{i}")
+            mgr.cleanup_old_data(max_items=0, max_days=0)
+            assert [e.error_message for e in mgr.get_errors(limit=10)] == ["e3", "e2"]
+        finally:
+            mgr.cleanup()
@@ -0,0 +1,113 @@
+# coding=utf-8
+"""
+爬虫运行器单元测试
+
+测试 runner.py 中的轮询启停和新增标记
+"""
+
+import time
+
+from trendradar.crawler.custom.base import CrawlerNewsItem, CrawlResult, FetchStatus
+from trendradar.crawler.runner import CrawlerRunner
+
+
+def _runner(tmp_path, **crawler_config):
+    config = {
+        "CRAWLER_CUSTOM": {"POLL_INTERVAL": 60, **crawler_config},
+        "STORAGE": {"LOCAL": {"DATA_DIR": str(tmp_path)}},
+    }
+    return CrawlerRunner(config)
+
+
+def test_stop_polling_interrupts_wait(tmp_path):
+    """测试停止轮询时立即唤醒等待中的轮询线程，不必等满间隔"""
+    runner = _runner(tmp_path, ENABLED=False)
+    polls = []
+    runner.start_polling(callback=polls.append)
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    runner.stop_polling()
+    assert time.monotonic() - start < 1.0
+    assert polls == [{}]
+    assert runner._poll_thread is None
+
+    # 停止后可再次启动
+    runner.start_polling(callback=polls.append)
+    time.sleep(0.1)
+    runner.stop_polling()
+    assert len(polls) == 2
+    runner.manager.cleanup()
+
+
+def test_new_seqs_computed_once_per_crawl(tmp_path):
+    """测试新增序号在每轮爬取时计算，展示时直接复用"""
+    runner = _runner(tmp_path, FILTER={"ENABLED": False}, FULL_CONTENT={"ENABLED": False})
+    items = [CrawlerNewsItem(seq=seq, title=seq) for seq in ("3", "2", "1")]
+    result = CrawlResult(
+        source_id="s", source_name="n", items=items, status=FetchStatus.SUCCESS, new_count=2
+    )
+    runner.manager.crawl_all = lambda: {"s": result}
+
+    runner.crawl_once()
+    assert runner._get_new_seqs() == {"3", "2"}
+    display = runner.get_items_for_display()
+    assert [item["is_new"] for item in display] == [True, True, False]
+    runner.manager.cleanup()
+
+
+def test_crawl_once_saves_all_sources_in_one_batch(tmp_path):
+    """测试各数据源过滤后的条目在一次批量保存中写入"""
+    runner = _runner(tmp_path, FILTER={"ENABLED": False}, FULL_CONTENT={"ENABLED": False})
+    results = {
+        source_id: CrawlResult(
+            source_id=source_id, source_name=source_id, status=FetchStatus.SUCCESS,
+            items=[CrawlerNewsItem(seq=f"{source_id}-1", title="t")],
+        )
+        for source_id in ("a", "b")
+    }
+    runner.manager.crawl_all = lambda: results
+    batches = []
+    runner.manager._save_batches = batches.append
+
+    runner.crawl_once()
+    assert [[source_id for source_id, _, _ in batch] for batch in batches] == [["a", "b"]]
+    runner.manager.cleanup()
+
+
+def test_display_cache_invalidated_by_crawl_and_content(tmp_path):
+    """测试展示列表在两轮爬取之间复用，新一轮爬取或补全正文后重新生成"""
+    runner = _runner(tmp_path, FILTER={"ENABLED": False}, FULL_CONTENT={"ENABLED": False})
+    item = CrawlerNewsItem(seq="1", title="t")
+    result = CrawlResult(source_id="s", source_name="n", items=[item], status=FetchStatus.SUCCESS)
+    runner.manager.crawl_all = lambda: {"s": result}
+    runner.crawl_once()
+
+    first = runner.get_items_for_display()
+    first[0]["title"] = "modified by caller"
+    assert runner.get_items_for_display()[0]["title"] == "t"
+    assert ("s", True, runner.max_display_items) not in runner._display_cache
+    assert (None, True, runner.max_display_items) in runner._display_cache
+
+    item.full_content = "正文"
+    for callback in runner.manager._on_content_fetched_callbacks:
+        callback("s", item)
+    assert runner.get_items_for_display()[0]["full_content"] == "正文"
+
+    item.title = "t2"
+    runner.crawl_once()
+    assert runner.get_items_for_display()[0]["title"] == "t2"
+    runner.manager.cleanup()
+
+
+def test_rss_summary_falls_back_to_content(tmp_path):
+    """测试 RSS 摘要优先用摘要，无摘要时取正文前 200 字"""
+    runner = _runner(tmp_path, ENABLED=False)
+    items = [
+        CrawlerNewsItem(seq="1", title="t", summary="摘要"),
+        CrawlerNewsItem(seq="2", title="t", full_content="正" * 300),
+        CrawlerNewsItem(seq="3", title="t"),
+    ]
+    summaries = [rss["summary"] for rss in runner.convert_to_rss_format(items)]
+    assert summaries == ["摘要", "正" * 200, ""]
+    runner.manager.cleanup()
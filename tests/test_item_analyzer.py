@@ -0,0 +1,30 @@
+# coding=utf-8
+"""
+新闻条目 AI 分析器单元测试
+
+测试 item_analyzer.py 中批量分析线程池的复用与关闭
+"""
+
+import asyncio
+
+from trendradar.ai.item_analyzer import NewsItemAnalyzer
+from trendradar.crawler.custom.base import CrawlerNewsItem
+
+
+def _items(count):
+    return [CrawlerNewsItem(seq=str(i), title="t") for i in range(count)]
+
+
+def test_batch_pool_grows_with_max_concurrent():
+    """测试后续批次并发上限更大时重建线程池，更小时复用"""
+    with NewsItemAnalyzer() as analyzer:
+        asyncio.run(analyzer.analyze_batch(_items(2), max_concurrent=2))
+        first = analyzer._executor
+        asyncio.run(analyzer.analyze_batch(_items(2), max_concurrent=1))
+        assert analyzer._executor is first
+
+        results = asyncio.run(analyzer.analyze_batch(_items(5), max_concurrent=5))
+        assert analyzer._executor is not first
+        assert analyzer._executor._max_workers == 5
+        assert [r.error for r in results] == ["AI 分析未启用"] * 5
+    assert analyzer._executor is None
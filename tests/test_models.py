@@ -0,0 +1,77 @@
+# coding=utf-8
+"""
+数据模型单元测试
+
+测试 models/base.py 中 ToDictMixin 的嵌套转换
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+import pytest
+
+from trendradar.models import ToDictMixin
+from trendradar.models.analysis import BatchTranslationResult, TranslationResult
+
+
+@dataclass
+class _Holder(ToDictMixin):
+    name: str = ""
+    mapping: Dict[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class _SubHolder(_Holder):
+    extra: int = 0
+
+
+def test_to_dict_converts_nested_objects():
+    """测试列表和字典中的嵌套对象递归转换，标量原样保留"""
+    batch = BatchTranslationResult()
+    batch.add_result(TranslationResult(translated_text="t", success=True))
+    data = batch.to_dict()
+    assert data["results"] == [TranslationResult(translated_text="t", success=True).to_dict()]
+    assert data["success_count"] == 1 and data["total_count"] == 1
+
+    holder = _Holder(name="h", mapping={"r": TranslationResult(error="e"), "n": 1})
+    assert holder.to_dict()["mapping"]["r"]["error"] == "e"
+    assert holder.to_dict()["mapping"]["n"] == 1
+
+
+def test_to_dict_field_cache_per_subclass():
+    """测试子类使用自己的字段列表，不复用父类缓存"""
+    assert list(_Holder().to_dict()) == ["name", "mapping"]
+    assert list(_SubHolder(extra=2).to_dict()) == ["name", "mapping", "extra"]
+
+
+def test_normalize_news_item_both_directions():
+    """测试字段名双向转换，目标字段已存在时不覆盖，且不修改原字典"""
+    from trendradar.models.base import normalize_news_item
+
+    data = {"mobileUrl": "m", "crawlTime": "c", "crawl_time": "keep", "title": "t"}
+    snake = normalize_news_item(data)
+    assert snake == {"mobile_url": "m", "crawlTime": "c", "crawl_time": "keep", "title": "t"}
+    assert "mobileUrl" in data
+    assert normalize_news_item(snake, to_snake_case=False)["mobileUrl"] == "m"
+
+
+def test_models_use_slots():
+    """测试数据模型实例不带 __dict__，拼错字段名赋值会报错"""
+    from trendradar.models import QueueTask
+
+    result = TranslationResult()
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(AttributeError):
+        result.succes = True
+    assert not hasattr(QueueTask(id="t", data=None), "__dict__")
+
+
+def test_base_news_item_default_crawl_time():
+    """测试未指定抓取时间时填充当前本地时间 HH:MM"""
+    import time
+    from trendradar.models.base import BaseNewsItem
+
+    before = time.strftime("%H:%M")
+    crawl_time = BaseNewsItem(title="t").crawl_time
+    assert crawl_time in (before, time.strftime("%H:%M"))
+    assert BaseNewsItem(title="t", crawl_time="08:00").crawl_time == "08:00"
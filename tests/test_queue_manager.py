@@ -0,0 +1,261 @@
+# coding=utf-8
+"""
+AI 队列管理器单元测试
+
+测试 manager.py 中的任务状态统计和已完成任务淘汰
+"""
+
+import threading
+import time
+
+import pytest
+
+from trendradar.ai.queue import AIQueueManager, QueueTask, TaskStatus
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    """轮询等待条件成立"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def manager():
+    """已设置处理函数的队列管理器"""
+    mgr = AIQueueManager(max_size=2, max_workers=1, retry_delay=0.01)
+    mgr.set_processor(lambda data: data * 2)
+    yield mgr
+    mgr.stop(wait=True, timeout=2.0)
+
+
+class TestQueueStats:
+    """队列统计测试"""
+
+    def test_pending_count_before_start(self, manager):
+        """测试未启动时任务计入 pending"""
+        manager.enqueue(1)
+        manager.enqueue(2)
+        stats = manager.get_stats()
+        assert stats["pending_tasks"] == 2
+        assert stats["processing_tasks"] == 0
+
+    def test_counts_after_processing(self, manager):
+        """测试处理完成后计数归零"""
+        task_id = manager.enqueue(21)
+        manager.start()
+        assert _wait_until(lambda: manager.get_status(task_id) == TaskStatus.COMPLETED)
+        stats = manager.get_stats()
+        assert stats["pending_tasks"] == 0
+        assert stats["processing_tasks"] == 0
+        assert manager.get_result(task_id) == 42
+
+
+    def test_tasks_kept_until_processor_set(self):
+        """测试未设置处理器时任务留在队列中，设置后照常处理"""
+        mgr = AIQueueManager(max_size=10, max_workers=1)
+        task_ids = [mgr.enqueue(i) for i in range(3)]
+        mgr.start()
+        try:
+            time.sleep(0.1)
+            stats = mgr.get_stats()
+            assert stats["queue_size"] == 3
+            assert stats["pending_tasks"] == 3
+
+            mgr.set_processor(lambda data: data)
+            assert _wait_until(lambda: all(
+                mgr.get_status(task_id) == TaskStatus.COMPLETED for task_id in task_ids
+            ))
+            assert mgr.get_stats()["pending_tasks"] == 0
+        finally:
+            mgr.stop(wait=True, timeout=2.0)
+
+
+class TestClear:
+    """清空队列测试"""
+
+    def test_clear_discards_queued_tasks(self, manager):
+        """测试清空后队列、任务记录和计数归零"""
+        task_id = manager.enqueue(1)
+        manager.enqueue(2)
+        manager.clear()
+
+        stats = manager.get_stats()
+        assert manager.queue_size == 0
+        assert manager.get_task(task_id) is None
+        assert stats["pending_tasks"] == 0
+        # 清空后可以重新入队到满
+        manager.enqueue(3)
+        manager.enqueue(4)
+        assert manager.queue_size == 2
+
+    def test_clear_discards_tasks_drained_by_running_worker(self):
+        """测试工作线程已批量取出的任务在清空后不再执行，计数不为负"""
+        release = threading.Event()
+        started = threading.Event()
+        processed = []
+
+        def processor(data):
+            started.set()
+            release.wait(5)
+            processed.append(data)
+            return data
+
+        mgr = AIQueueManager(max_size=20, max_workers=1)
+        mgr.set_processor(processor)
+        for i in range(10):
+            mgr.enqueue(i)
+        mgr.start()
+        try:
+            assert started.wait(5)
+            mgr.clear()
+            release.set()
+            assert _wait_until(lambda: mgr.get_stats()["processing_tasks"] == 0)
+            time.sleep(0.05)
+            assert processed == [0]
+            assert mgr.get_stats()["pending_tasks"] == 0
+        finally:
+            release.set()
+            mgr.stop(wait=True, timeout=2.0)
+
+
+class TestQueueTaskTimestamps:
+    """任务时间戳测试"""
+
+    def test_timestamps_formatted_on_read(self):
+        """测试时间戳按需格式化，未设置时为空"""
+        task = QueueTask(id="t1", data=None)
+        assert task.created_at.startswith(time.strftime("%Y-"))
+        assert task.started_at == ""
+        assert task.completed_at == ""
+
+        task.start()
+        task.complete("ok")
+        assert "T" in task.started_at
+        assert task.to_dict()["completed_at"] == task.completed_at
+
+    def test_result_object_serialized(self):
+        """测试结果为数据类时 to_dict 递归转换"""
+        from trendradar.models import NewsAnalysisResult
+
+        task = QueueTask(id="t2", data=None)
+        task.complete(NewsAnalysisResult(news_id="n1", keywords=["k"]))
+        result = task.to_dict()["result"]
+        assert result["news_id"] == "n1" and result["keywords"] == ["k"]
+
+
+class TestCompletedTaskEviction:
+    """已完成任务淘汰测试"""
+
+    def test_tasks_dict_is_bounded(self, manager):
+        """测试任务记录数不超过上限，最早完成的任务被淘汰"""
+        manager.start()
+        ids = []
+        for i in range(manager._task_cap + 3):
+            ids.append(manager.enqueue(i))
+            assert _wait_until(lambda: manager.get_status(ids[-1]) == TaskStatus.COMPLETED)
+
+        assert len(manager._tasks) == manager._task_cap
+        assert manager.get_task(ids[0]) is None
+        assert manager.get_status(ids[-1]) == TaskStatus.COMPLETED
+
+    def test_unfinished_tasks_are_not_evicted(self):
+        """测试未结束的任务不会被淘汰"""
+        mgr = AIQueueManager(max_size=1, max_workers=1)
+        mgr.set_processor(lambda data: data)
+        pending_id = mgr.enqueue("pending")
+        mgr._queue.clear()
+
+        for i in range(mgr._task_cap + 2):
+            task_id = mgr.enqueue(i)
+            mgr._queue.clear()
+            mgr._tasks[task_id].status = TaskStatus.COMPLETED
+
+        assert mgr.get_status(pending_id) == TaskStatus.PENDING
+        assert len(mgr._tasks) == mgr._task_cap
+
+
+class TestRetryScheduling:
+    """失败重试调度测试"""
+
+    def test_failed_task_is_retried(self):
+        """测试失败任务经延迟后重新处理成功"""
+        attempts = []
+
+        def flaky(data):
+            attempts.append(data)
+            if len(attempts) < 2:
+                raise ValueError("transient")
+            return data
+
+        mgr = AIQueueManager(max_size=4, max_workers=1, retry_delay=0.01)
+        mgr.set_processor(flaky)
+        mgr.start()
+        try:
+            task_id = mgr.enqueue("x")
+            assert _wait_until(lambda: mgr.get_status(task_id) == TaskStatus.COMPLETED)
+            assert mgr.get_task(task_id).retry_count == 1
+            assert len(attempts) == 2
+        finally:
+            mgr.stop(wait=True, timeout=2.0)
+
+    def test_retry_does_not_block_worker(self):
+        """测试退避期间工作线程继续处理其他任务"""
+        def processor(data):
+            if data == "bad":
+                raise ValueError("fail")
+            return data
+
+        mgr = AIQueueManager(max_size=4, max_workers=1, max_retries=2, retry_delay=10.0)
+        mgr.set_processor(processor)
+        mgr.start()
+        try:
+            bad_id = mgr.enqueue("bad")
+            good_id = mgr.enqueue("good")
+            assert _wait_until(lambda: mgr.get_status(good_id) == TaskStatus.COMPLETED, timeout=2.0)
+            assert mgr.get_status(bad_id) == TaskStatus.PENDING
+        finally:
+            mgr.stop(wait=True, timeout=2.0)
+
+    def test_counts_during_retry_backoff(self):
+        """测试退避等待中的任务计入 pending 而非 processing"""
+        mgr = AIQueueManager(max_size=4, max_workers=1, max_retries=2, retry_delay=10.0)
+        mgr.set_processor(lambda data: 1 / 0)
+        mgr.start()
+        try:
+            task_id = mgr.enqueue("x")
+            assert _wait_until(lambda: mgr.get_task(task_id).retry_count == 1)
+            assert _wait_until(lambda: mgr.get_stats()["processing_tasks"] == 0)
+            stats = mgr.get_stats()
+            assert stats["pending_tasks"] == 1
+            assert stats["queue_size"] == 0
+        finally:
+            mgr.stop(wait=True, timeout=2.0)
+
+
+class TestStop:
+    """停止流程测试"""
+
+    def test_stop_returns_unstarted_tasks_to_queue(self):
+        """测试停止后批次中未开始的任务回到队列"""
+        started = []
+
+        def slow(data):
+            started.append(data)
+            time.sleep(0.2)
+            return data
+
+        mgr = AIQueueManager(max_size=8, max_workers=1)
+        mgr.set_processor(slow)
+        for i in range(4):
+            mgr.enqueue(i)
+        mgr.start()
+        assert _wait_until(lambda: started)
+        mgr.stop(wait=True, timeout=2.0)
+
+        assert len(started) == 1
+        assert mgr.queue_size == 3
+        assert mgr.get_stats()["total_processed"] == 1
@@ -19,7 +19,7 @@ from trendradar.notification.senders import (
     send_to_ntfy,
     send_to_bark,
 )
-from trendradar.constants import Timeouts
+from trendradar.constants import BatchSizes, Timeouts, normalize_config_key
 
 
 # === 测试 Timeouts 常量 ===
@@ -29,6 +29,25 @@ def test_timeouts_http_request_value():
     assert Timeouts.HTTP_REQUEST == 30
 
 
+# === 测试 BatchSizes 常量 ===
+
+def test_batch_sizes_get_known_and_unknown_channels():
+    """测试按渠道名获取批次大小（大小写不敏感，未知渠道返回默认值）"""
+    assert BatchSizes.get("feishu") == BatchSizes.FEISHU
+    assert BatchSizes.get("Telegram") == BatchSizes.TELEGRAM
+    assert BatchSizes.get("unknown") == BatchSizes.DEFAULT
+    assert BatchSizes.get("get") == BatchSizes.DEFAULT
+
+
+# === 测试配置键名标准化 ===
+
+def test_normalize_config_key():
+    """测试配置键名标准化"""
+    assert normalize_config_key("max_tokens") == "MAX_TOKENS"
+    assert normalize_config_key("MODEL") == "MODEL"
+    assert normalize_config_key("api_base") == "API_BASE"
+
+
 # === 飞书发送器测试 ===
 
 class TestSendToFeishu:
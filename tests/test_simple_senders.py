@@ -0,0 +1,214 @@
+# coding=utf-8
+"""
+简化消息发送器单元测试
+
+测试 simple_senders.py 中的多账号发送和连接复用
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from trendradar.constants import Limits
+from trendradar.notification import simple_senders
+from trendradar.notification.simple_senders import (
+    send_simple_dingtalk,
+    send_simple_feishu,
+    send_simple_telegram,
+    send_simple_wework,
+)
+
+
+def _response(status_code=200, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(body or {}).encode()
+    return response
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_accounts_share_module_session(mock_post):
+    """测试多账号通过同一会话发送，任一成功即返回 True"""
+    bodies = {
+        "https://a.example/hook": {"code": 1, "msg": "bad"},
+        "https://b.example/hook": {"StatusCode": 0},
+    }
+    mock_post.side_effect = lambda url, **kwargs: _response(body=bodies[url])
+    assert send_simple_feishu("https://a.example/hook; https://b.example/hook", "s", "c")
+    assert {call.args[0] for call in mock_post.call_args_list} == set(bodies)
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_network_error_returns_false(mock_post):
+    """测试网络异常时返回 False"""
+    mock_post.side_effect = requests.ConnectionError("down")
+    assert not send_simple_feishu("https://a.example/hook", "s", "c")
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_telegram_token_chat_id_mismatch(mock_post):
+    """测试 Telegram token 与 chat_id 数量不一致时不发送"""
+    assert not send_simple_telegram("t1;t2", "c1", "s", "c")
+    mock_post.assert_not_called()
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_accounts_sent_concurrently(mock_post):
+    """测试多账号并发发送：所有账号同时处于请求中"""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def post(url, **kwargs):
+        barrier.wait()
+        return _response(body={"errcode": 0})
+
+    mock_post.side_effect = post
+    assert send_simple_dingtalk("https://a.example;https://b.example;https://c.example", "s", "c")
+    assert mock_post.call_count == 3
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_body_serialized_once_per_channel(mock_post):
+    """测试请求体只序列化一次，各账号发送同一份字节串"""
+    mock_post.return_value = _response(body={"errcode": 0})
+    assert send_simple_wework("https://a.example;https://b.example", "标题", "内容")
+
+    bodies = [call.kwargs["data"] for call in mock_post.call_args_list]
+    assert bodies[0] is bodies[1]
+    assert json.loads(bodies[0]) == {"msgtype": "markdown", "markdown": {"content": "## 标题\n\n内容"}}
+    assert mock_post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_split_urls_cached_per_config():
+    """测试多账号配置拆分结果按配置字符串缓存"""
+    simple_senders._split_urls.cache_clear()
+    assert simple_senders._split_urls(" a ;; b;") == ("a", "b")
+    assert simple_senders._split_urls(" a ;; b;") is simple_senders._split_urls(" a ;; b;")
+    assert simple_senders._split_urls.cache_info().misses == 1
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_empty_response_body_is_failure(mock_post):
+    """测试 200 空响应体按失败处理，不抛出解析异常"""
+    response = _response()
+    response.content = b""
+    mock_post.return_value = response
+    assert not send_simple_dingtalk("https://a.example", "s", "c")
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_invalid_json_response_is_failure(mock_post):
+    """测试响应不是有效 JSON 时按失败处理"""
+    response = _response()
+    response.content = b"<html>bad gateway</html>"
+    mock_post.return_value = response
+    assert not send_simple_telegram("t1", "c1", "s", "c")
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_non_object_json_response_is_failure(mock_post):
+    """测试响应 JSON 不是对象时按失败处理，不影响同渠道其他账号"""
+    def post(url, **kwargs):
+        response = _response(body={"StatusCode": 0})
+        if url == "https://bad.example":
+            response.content = b"[1]"
+        return response
+
+    mock_post.side_effect = post
+    assert not send_simple_feishu("https://bad.example", "s", "c")
+    assert send_simple_feishu("https://bad.example;https://good.example", "s", "c")
+
+
+def test_session_retries_rate_limited_posts():
+    """测试共享会话只对 POST 的限流/服务不可用按退避重试，网关错误和读超时不重试"""
+    retry = simple_senders._SESSION.get_adapter("https://open.feishu.cn").max_retries
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("POST", 503)
+    for status in (500, 502, 504):
+        assert not retry.is_retry("POST", status)
+    assert retry.read == 0
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_first_success_only_stops_after_first_success(mock_post):
+    """测试 first_success_only 时按顺序发送，首个成功后不再发送备用账号"""
+    bodies = {
+        "https://a.example": {"errcode": 1, "errmsg": "bad"},
+        "https://b.example": {"errcode": 0},
+        "https://c.example": {"errcode": 0},
+    }
+    mock_post.side_effect = lambda url, **kwargs: _response(body=bodies[url])
+    assert send_simple_dingtalk(";".join(bodies), "s", "c", first_success_only=True)
+    assert [call.args[0] for call in mock_post.call_args_list] == [
+        "https://a.example", "https://b.example",
+    ]
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_fan_out_deadline_returns_completed_accounts(mock_post, monkeypatch):
+    """测试某个账号卡住时，超过总时限后按已完成的账号返回"""
+    monkeypatch.setattr(simple_senders, "_FAN_OUT_DEADLINE", 0.2)
+    release = threading.Event()
+
+    def post(url, **kwargs):
+        if url == "https://slow.example":
+            release.wait(5)
+        return _response(body={"StatusCode": 0})
+
+    mock_post.side_effect = post
+    start = time.monotonic()
+    try:
+        assert send_simple_feishu("https://slow.example;https://fast.example", "s", "c")
+        assert time.monotonic() - start < 2
+    finally:
+        release.set()
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_fan_out_deadline_applies_to_single_account(mock_post, monkeypatch, caplog):
+    """测试单账号同样受总时限约束，超时后实际送达时单独记录"""
+    monkeypatch.setattr(simple_senders, "_FAN_OUT_DEADLINE", 0.2)
+    release = threading.Event()
+
+    def post(url, **kwargs):
+        release.wait(5)
+        return _response(body={"StatusCode": 0})
+
+    mock_post.side_effect = post
+    with caplog.at_level("INFO"):
+        start = time.monotonic()
+        try:
+            assert not send_simple_feishu("https://slow.example", "s", "c")
+            assert time.monotonic() - start < 2
+        finally:
+            release.set()
+
+        deadline = time.monotonic() + 5
+        while "超时后完成" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert "账号推送在超时后完成，实际已送达" in caplog.text
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_telegram_pairs_tokens_with_chat_ids(mock_post):
+    """测试 Telegram 按顺序配对 token 和 chat_id"""
+    mock_post.return_value = _response(body={"ok": True})
+    assert send_simple_telegram("t1;t2", "c1;c2", "s", "c")
+    sent = {call.args[0]: json.loads(call.kwargs["data"])["chat_id"] for call in mock_post.call_args_list}
+    assert sent == {
+        "https://api.telegram.org/bott1/sendMessage": "c1",
+        "https://api.telegram.org/bott2/sendMessage": "c2",
+    }
+
+
+@patch.object(simple_senders._SESSION, "post")
+def test_webhook_accounts_capped_at_limit(mock_post):
+    """测试超过每渠道账号上限的配置只取前几个"""
+    mock_post.return_value = _response(body={"errcode": 0})
+    urls = [f"https://{i}.example" for i in range(10)]
+    assert simple_senders._split_urls(";".join(urls), 3) == tuple(urls[:3])
+
+    assert send_simple_dingtalk(";".join(urls), "s", "c")
+    assert mock_post.call_count == Limits.MAX_ACCOUNTS_PER_CHANNEL
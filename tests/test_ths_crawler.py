@@ -0,0 +1,122 @@
+# coding=utf-8
+"""
+同花顺爬虫单元测试
+
+测试 ths.py 中的 JSONP 解析
+"""
+
+from trendradar.crawler.custom.base import FetchStatus
+from trendradar.crawler.custom.ths import THSCrawler
+
+
+def test_parse_jsonp_quotes_bare_keys():
+    """测试 JSONP 顶层未加引号的属性名被修复后可解析"""
+    raw = (
+        'var thsRss = {pubDate:"2025-01-01 10:00", latestNewsSeq:"123",'
+        ' counter:2, item:[{"seq":"1","title":"a"}]};'
+    )
+    data, status, error = THSCrawler()._parse_jsonp(raw)
+    assert status == FetchStatus.SUCCESS, error
+    assert data["pubDate"] == "2025-01-01 10:00"
+    assert data["latestNewsSeq"] == "123"
+    assert data["counter"] == 2
+    assert data["item"][0]["seq"] == "1"
+
+
+def test_parse_jsonp_without_object():
+    """测试找不到 JSON 对象时返回解析错误"""
+    _, status, _ = THSCrawler()._parse_jsonp("var x = null;")
+    assert status == FetchStatus.PARSE_ERROR
+
+
+def test_parse_jsonp_ignores_trailing_script():
+    """测试对象结束后的尾部脚本不影响解析"""
+    raw = 'var thsRss = {pubDate:"d", counter:0, item:[]};\nfoo({"x": 1});'
+    data, status, _ = THSCrawler()._parse_jsonp(raw)
+    assert status == FetchStatus.SUCCESS
+    assert data == {"pubDate": "d", "counter": 0, "item": []}
+
+
+def test_extract_news_items_extra_fields():
+    """测试扩展字段按映射写入 extra，空值跳过"""
+    data = {"item": [
+        {"seq": 1, "title": " t ", "content": "c", "stockCode": "600000", "stocks": [], "implevel": "2"},
+        {"title": "no seq"},
+    ]}
+    items = THSCrawler()._extract_news_items(data)
+    assert len(items) == 1
+    assert items[0].title == "t"
+    assert items[0].extra == {"stock_code": "600000", "importance_level": "2"}
+
+
+def test_tapp_extract_news_items():
+    """测试 TAPP 条目的摘要回退、股票信息和按时间降序排序"""
+    from trendradar.crawler.custom.ths_tapp import THSTappCrawler
+
+    data = {"data": {"list": [
+        {"seq": "1", "title": "a", "short": "s1", "ctime": "1700000000",
+         "stock": [{"name": "N", "stockCode": "C", "stockMarket": "M"}]},
+        {"seq": "2", "title": "b", "digest": "d2", "ctime": "1700000100", "import": "2"},
+    ]}}
+    items = THSTappCrawler()._extract_news_items(data)
+    assert [item.seq for item in items] == ["2", "1"]
+    assert items[0].summary == "d2" and items[1].summary == "s1"
+    assert items[1].extra["stocks"] == [{"name": "N", "code": "C", "market": "M"}]
+    assert items[0].extra["importance"] == 2
+    assert items[0].published_at == "2023-11-15 06:15:00"
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers))
+        return self.responses.pop(0)
+
+
+def test_fetch_news_list_conditional_request():
+    """测试不再附加时间戳参数，304 时复用上次结果"""
+    body = 'var thsRss = {pubDate:"d1", counter:1, item:[{"seq":"1","title":"a"}]};'
+    crawler = THSCrawler()
+    crawler.session = _FakeSession([
+        _FakeResponse(200, body.encode("gbk"), {"ETag": '"abc"', "Last-Modified": "Mon"}),
+        _FakeResponse(304),
+    ])
+
+    first = crawler.fetch_news_list()
+    second = crawler.fetch_news_list()
+
+    (url1, headers1), (url2, headers2) = crawler.session.calls
+    assert url1 == url2 == THSCrawler.BASE_URL
+    assert headers1 is None
+    assert headers2 == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"}
+    assert second.status == FetchStatus.SUCCESS
+    assert [item.seq for item in second.items] == [item.seq for item in first.items] == ["1"]
+    assert second.data_time == "d1"
+
+
+def test_tapp_reuses_items_from_previous_poll():
+    """测试相邻两轮中已构建过的 seq 复用原条目，新条目正常构建并排序"""
+    from trendradar.crawler.custom.ths_tapp import THSTappCrawler
+
+    crawler = THSTappCrawler()
+    old = {"seq": "1", "title": "a", "ctime": "1700000000"}
+    first = crawler._extract_news_items({"data": {"list": [old]}})
+    second = crawler._extract_news_items({"data": {"list": [
+        {"seq": "2", "title": "b", "ctime": "1700000100"}, old,
+    ]}})
+    assert [item.seq for item in second] == ["2", "1"]
+    assert second[1] is first[0]
+    # 从列表中消失的条目不再保留
+    third = crawler._extract_news_items({"data": {"list": [old]}})
+    assert third[0] is first[0]
+    assert set(crawler._recent_items) == {"1"}
@@ -156,7 +156,7 @@ class CrewAnalyzer:
             prompt_template = self._get_prompt(prompt_name)
             description = prompt_template.format(
                 title=title,
-                content=content[:1500] if len(content) > 1500 else content
+                content=content[:1500]
             )
 
             # 创建分析任务
@@ -306,7 +306,7 @@ class MultiAgentCrewAnalyzer(CrewAnalyzer):
             包含多维度分析结果的字典
         """
         try:
-            truncated_content = content[:1500] if len(content) > 1500 else content
+            truncated_content = content[:1500]
 
             # 创建任务链
             basic_analysis_task = Task(
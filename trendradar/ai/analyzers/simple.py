@@ -15,7 +15,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-from trendradar.ai.client import AIClient
+from trendradar.ai.client import AIClient, get_shared_client
 from trendradar.logging import get_logger
 from trendradar.models import NewsAnalysisResult
 
@@ -86,6 +86,11 @@ class SimpleAnalyzer:
             except Exception as e:
                 logger.error("加载 Prompt 失败 %s: %s", file, e)
 
+    @staticmethod
+    def _prep_content(content: str, limit: int = 1500) -> str:
+        """截断内容用于 Prompt（切片本身已处理短文本）"""
+        return content[:limit]
+
     def _get_prompt(self, name: str) -> str:
         """获取 Prompt 模板"""
         return self._prompts.get(name, self.DEFAULT_PROMPT)
@@ -95,7 +100,7 @@ class SimpleAnalyzer:
         if self._client is not None:
             return
 
-        self._client = AIClient(self.ai_config)
+        self._client = get_shared_client(self.ai_config)
 
     def analyze(
         self,
@@ -128,7 +133,7 @@ class SimpleAnalyzer:
             prompt_template = self._get_prompt(prompt_name)
             prompt = prompt_template.format(
                 title=title,
-                content=content[:1500] if len(content) > 1500 else content
+                content=self._prep_content(content)
             )
 
             # 调用 AI
@@ -194,7 +199,7 @@ class SimpleAnalyzer:
             prompt_template = self._get_prompt("summarize")
             prompt = prompt_template.format(
                 title=title,
-                content=content[:1500] if len(content) > 1500 else content
+                content=self._prep_content(content)
             )
 
             messages = [{"role": "user", "content": prompt}]
@@ -224,7 +229,7 @@ class SimpleAnalyzer:
             prompt_template = self._get_prompt("keywords")
             prompt = prompt_template.format(
                 title=title,
-                content=content[:1500] if len(content) > 1500 else content
+                content=self._prep_content(content)
             )
 
             messages = [{"role": "user", "content": prompt}]
@@ -7,10 +7,15 @@ AI 客户端模块
 """
 
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from litellm import completion
 
+# 进程级共享客户端池：相同配置的分析器复用同一个 AIClient
+_CLIENT_POOL: Dict[Tuple, "AIClient"] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
 
 class AIClient:
     """统一的 AI 客户端（基于 LiteLLM）"""
@@ -112,3 +117,40 @@ class AIClient:
             return False, f"模型格式错误: {self.model}，应为 'provider/model' 格式（如 'deepseek/deepseek-chat'）"
 
         return True, ""
+
+
+def _client_key(config: Dict[str, Any]) -> Tuple:
+    """根据影响请求行为的配置项生成客户端池键"""
+    return (
+        config.get("API_BASE", ""),
+        config.get("API_KEY") or os.environ.get("AI_API_KEY", ""),
+        config.get("MODEL", ""),
+        config.get("TEMPERATURE"),
+        config.get("MAX_TOKENS"),
+        config.get("TIMEOUT"),
+        config.get("NUM_RETRIES"),
+        tuple(config.get("FALLBACK_MODELS") or ()),
+    )
+
+
+def get_shared_client(config: Dict[str, Any]) -> AIClient:
+    """
+    获取进程内共享的 AI 客户端
+
+    相同配置返回同一个 AIClient 实例，避免多个分析器各自创建客户端。
+
+    Args:
+        config: AI 配置字典（同 AIClient）
+
+    Returns:
+        AIClient 实例
+    """
+    key = _client_key(config)
+    client = _CLIENT_POOL.get(key)
+    if client is None:
+        with _CLIENT_POOL_LOCK:
+            client = _CLIENT_POOL.get(key)
+            if client is None:
+                client = AIClient(config)
+                _CLIENT_POOL[key] = client
+    return client
@@ -9,14 +9,22 @@
 - 简短摘要生成
 
 使用方式:
-    analyzer = NewsItemAnalyzer(ai_config)
-    result = await analyzer.analyze_item(item)
+    with NewsItemAnalyzer(ai_config) as analyzer:
+        results = await analyzer.analyze_batch(items)
 """
 
 import asyncio
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 from trendradar.crawler.custom.base import CrawlerNewsItem
 from trendradar.logging import get_logger
@@ -60,6 +68,8 @@ class NewsItemAnalyzer:
         self.ai_config = ai_config or {}
         self._client = None
         self._enabled = ai_config.get("ENABLED", False) if ai_config else False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_size = 0
 
     def _init_client(self):
         """延迟初始化 AI 客户端"""
@@ -70,12 +80,19 @@ class NewsItemAnalyzer:
             return
 
         try:
-            from trendradar.ai.client import AIClient
-            self._client = AIClient(self.ai_config)
+            from trendradar.ai.client import get_shared_client
+            self._client = get_shared_client(self.ai_config)
         except Exception as e:
             logger.error("初始化 AI 客户端失败: %s", e)
             self._client = None
 
+    @staticmethod
+    def _prep_content(content: str, limit: int = 1000) -> str:
+        """截断内容用于 Prompt，超长时追加省略号"""
+        if len(content) > limit:
+            return content[:limit] + "..."
+        return content
+
     def analyze_item_sync(self, item: CrawlerNewsItem) -> ItemAnalysisResult:
         """同步分析单条新闻
 
@@ -104,14 +121,10 @@ class NewsItemAnalyzer:
                 result.error = "无可分析内容"
                 return result
 
-            # 截断过长内容
-            if len(content) > 1000:
-                content = content[:1000] + "..."
-
-            # 构建提示词
+            # 构建提示词（截断过长内容）
             prompt = self.DEFAULT_PROMPT.format(
                 title=item.title,
-                content=content,
+                content=self._prep_content(content),
             )
 
             # 调用 AI
@@ -119,10 +132,10 @@ class NewsItemAnalyzer:
             response = self._client.chat(messages)
 
             # 解析响应
-            result = self._parse_response(item.seq, response)
+            result, normalized_json = self._parse_response(item.seq, response)
 
-            # 更新原始条目
-            item.ai_analysis = json.dumps(result.to_dict(), ensure_ascii=False)
+            # 更新原始条目（优先复用模型输出的 JSON，避免再次序列化）
+            item.ai_analysis = normalized_json or self._dumps(result.to_dict())
             item.ai_analysis_time = result.analyzed_at
 
             return result
@@ -141,8 +154,9 @@ class NewsItemAnalyzer:
             ItemAnalysisResult: 分析结果
         """
         # 当前使用同步实现，后续可改为真正的异步
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.analyze_item_sync, item)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.analyze_item_sync, item
+        )
 
     async def analyze_batch(
         self,
@@ -161,6 +175,14 @@ class NewsItemAnalyzer:
         if not items:
             return []
 
+        # 并发上限超过现有线程池时重建，旧池中进行中的任务继续执行完毕
+        if max_concurrent > self._executor_size:
+            self.close()
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_concurrent, thread_name_prefix="item-ai"
+            )
+            self._executor_size = max_concurrent
+
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def analyze_with_limit(item):
@@ -170,10 +192,22 @@ class NewsItemAnalyzer:
         tasks = [analyze_with_limit(item) for item in items]
         return await asyncio.gather(*tasks)
 
-    def _parse_response(self, news_id: str, response: str) -> ItemAnalysisResult:
-        """解析 AI 响应"""
+    @staticmethod
+    def _dumps(data: Dict[str, Any]) -> str:
+        """序列化为 JSON 字符串（优先使用 orjson）"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(data, ensure_ascii=False)
+
+    def _parse_response(self, news_id: str, response: str) -> Tuple[ItemAnalysisResult, str]:
+        """解析 AI 响应
+
+        Returns:
+            (分析结果, 去除代码块后的 JSON 字符串)，解析失败时 JSON 字符串为空
+        """
         result = ItemAnalysisResult(news_id=news_id, raw_response=response)
         result.success = False  # 默认失败
+        normalized_json = ""
 
         try:
             # 提取 JSON
@@ -185,7 +219,8 @@ class NewsItemAnalyzer:
             elif "```" in json_str:
                 json_str = json_str.split("```")[1].split("```")[0]
 
-            data = json.loads(json_str.strip())
+            json_str = json_str.strip()
+            data = json.loads(json_str)
 
             result.sentiment = data.get("sentiment", "neutral")
             result.importance = int(data.get("importance", 5))
@@ -193,11 +228,29 @@ class NewsItemAnalyzer:
             result.summary = data.get("summary", "")
             result.tags = data.get("tags", [])
             result.success = True
+            normalized_json = json_str
 
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             result.error = f"解析响应失败: {str(e)[:50]}"
 
-        return result
+        return result, normalized_json
+
+    def close(self) -> None:
+        """关闭分析线程池
+
+        使用方不再分析时调用，或通过 with 语句自动调用。
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
     @property
     def enabled(self) -> bool:
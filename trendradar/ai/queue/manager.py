@@ -9,13 +9,13 @@ AI 队列管理器
 - 失败重试
 """
 
-import asyncio
-import uuid
+import heapq
+import itertools
+import random
+import time
 import threading
-from datetime import datetime
 from typing import Dict, List, Optional, Callable, Any
-from collections import deque
-import queue
+from collections import OrderedDict, deque
 
 from trendradar.logging import get_logger
 from trendradar.models import TaskStatus, QueueTask
@@ -27,8 +27,15 @@ class AIQueueManager:
     """AI 队列管理器
 
     提供基于线程的异步队列处理。
+
+    任务记录上限为 max_size * 8：超出时按完成先后淘汰最早结束
+    （COMPLETED/FAILED）的任务，未结束的任务不会被淘汰，因此
+    get_task/get_result 只保证能查询到最近的任务。
     """
 
+    # 工作线程每次唤醒最多取出的任务数
+    DRAIN_BATCH_SIZE = 32
+
     def __init__(
         self,
         max_size: int = 100,
@@ -50,13 +57,29 @@ class AIQueueManager:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
-        self._tasks: Dict[str, QueueTask] = {}
+        self._queue: deque = deque()
+        # 任务 ID：进程启动时间前缀 + 单调递增计数
+        self._id_prefix = format(int(time.time()) & 0xFFFF, "04x")
+        self._id_counter = itertools.count(1)
+        self._tasks: "OrderedDict[str, QueueTask]" = OrderedDict()
+        self._task_cap = max_size * 8
         self._workers: List[threading.Thread] = []
+        self._scheduler: Optional[threading.Thread] = None
         self._running = False
         self._processor: Optional[Callable] = None
         self._result_callback: Optional[Callable] = None
         self._lock = threading.Lock()
+        # 队列条件变量与 _lock 共用一把锁，入队/出队/计数只需一次加锁
+        self._cv = threading.Condition(self._lock)
+
+        # 重试延迟堆：(就绪时间, 序号, 任务)，由调度线程按时重新入队
+        self._delayed: List[tuple] = []
+        self._delay_seq = itertools.count()
+        self._delay_cond = threading.Condition()
+
+        # 状态计数（O(1) 统计）
+        self._pending_count = 0
+        self._processing_count = 0
 
         # 统计
         self.stats = {
@@ -91,37 +114,37 @@ class AIQueueManager:
         Returns:
             任务 ID
         """
-        task_id = str(uuid.uuid4())[:8]
+        task_id = f"{self._id_prefix}{next(self._id_counter):08x}"
         task = QueueTask(id=task_id, data=data)
 
-        with self._lock:
+        with self._cv:
+            if len(self._queue) >= self.max_size:
+                raise RuntimeError("队列已满")
             self._tasks[task_id] = task
+            if len(self._tasks) > self._task_cap:
+                self._evict_finished()
+            self._pending_count += 1
+            self._queue.append(task)
+            self._cv.notify()
 
-        try:
-            self._queue.put_nowait(task)
-            self.stats["total_enqueued"] += 1
-            return task_id
-        except queue.Full:
-            with self._lock:
-                del self._tasks[task_id]
-            raise RuntimeError("队列已满")
+        self.stats["total_enqueued"] += 1
+        return task_id
+
+    # 只读查询不加锁：dict.get 与单属性读取在 GIL 下是原子的
 
     def get_status(self, task_id: str) -> Optional[TaskStatus]:
         """获取任务状态"""
-        with self._lock:
-            task = self._tasks.get(task_id)
-            return task.status if task else None
+        task = self._tasks.get(task_id)
+        return task.status if task else None
 
     def get_result(self, task_id: str) -> Optional[Any]:
         """获取任务结果"""
-        with self._lock:
-            task = self._tasks.get(task_id)
-            return task.result if task else None
+        task = self._tasks.get(task_id)
+        return task.result if task else None
 
     def get_task(self, task_id: str) -> Optional[QueueTask]:
         """获取任务详情"""
-        with self._lock:
-            return self._tasks.get(task_id)
+        return self._tasks.get(task_id)
 
     def start(self):
         """启动工作线程"""
@@ -138,98 +161,212 @@ class AIQueueManager:
             )
             worker.start()
             self._workers.append(worker)
+
+        self._scheduler = threading.Thread(
+            target=self._scheduler_loop,
+            daemon=True,
+            name="ai-retry-scheduler"
+        )
+        self._scheduler.start()
         logger.info("启动 %d 个工作线程", self.max_workers)
 
     def stop(self, wait: bool = True, timeout: float = 5.0):
-        """停止工作线程"""
+        """停止工作线程
+
+        工作线程处理完当前任务后退出，批次中未开始的任务放回队首。
+
+        Args:
+            wait: 是否等待线程退出
+            timeout: 等待所有线程退出的总超时（秒）
+        """
         self._running = False
+        with self._cv:
+            self._cv.notify_all()
+        with self._delay_cond:
+            self._delay_cond.notify_all()
 
         if wait:
-            for worker in self._workers:
-                worker.join(timeout=timeout)
+            deadline = time.monotonic() + timeout
+            threads = self._workers + ([self._scheduler] if self._scheduler else [])
+            for thread in threads:
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            alive = sum(1 for thread in threads if thread.is_alive())
+            if alive:
+                logger.warning("%d 个工作线程未在 %.1f 秒内退出", alive, timeout)
 
         self._workers.clear()
+        self._scheduler = None
         logger.info("工作线程已停止")
 
+    def _schedule_retry(self, task: QueueTask):
+        """按指数退避（附加随机抖动）延迟重新入队，不占用工作线程"""
+        delay = self.retry_delay * (2 ** (task.retry_count - 1))
+        delay += random.uniform(0, self.retry_delay)
+        with self._delay_cond:
+            heapq.heappush(
+                self._delayed,
+                (time.monotonic() + delay, next(self._delay_seq), task)
+            )
+            self._delay_cond.notify()
+
+    def _scheduler_loop(self):
+        """调度循环：将到期的重试任务放回队列"""
+        while self._running:
+            with self._delay_cond:
+                if not self._delayed:
+                    self._delay_cond.wait()
+                    continue
+                wait_time = self._delayed[0][0] - time.monotonic()
+                if wait_time > 0:
+                    self._delay_cond.wait(wait_time)
+                    continue
+                _, _, task = heapq.heappop(self._delayed)
+            with self._cv:
+                self._queue.append(task)
+                self._cv.notify()
+
     def _worker_loop(self, worker_id: int):
-        """工作循环"""
+        """工作循环
+
+        每次唤醒在同一次加锁内批量取出任务，减少队列锁竞争和
+        条件变量唤醒次数。
+        """
         while self._running:
             try:
-                # 非阻塞获取任务
-                try:
-                    task = self._queue.get(timeout=1.0)
-                except queue.Empty:
-                    continue
+                # 等待任务，再按公平份额批量取出（避免单个工作线程独占积压任务）
+                with self._cv:
+                    while self._running and not self._queue:
+                        self._cv.wait(timeout=1.0)
+                    if not self._queue:
+                        continue
+                    if not self._processor:
+                        # 未设置处理器时任务留在队列中，设置后继续处理
+                        logger.warning("Worker %d: 未设置处理器", worker_id)
+                        self._cv.wait(timeout=1.0)
+                        continue
+                    fair_share = -(-len(self._queue) // self.max_workers)
+                    limit = min(self.DRAIN_BATCH_SIZE, fair_share)
+                    popleft = self._queue.popleft
+                    batch = [popleft() for _ in range(limit)]
+
+                # 批内使用局部计数，批次结束后一次性合并到 stats
+                succeeded = failed = processed = 0
+                for index, task in enumerate(batch):
+                    if not self._running:
+                        # 停止时将未开始的任务放回队首
+                        with self._cv:
+                            self._queue.extendleft(reversed(batch[index:]))
+                        break
+                    with self._lock:
+                        if task.id not in self._tasks:
+                            # 取出后被 clear() 丢弃，不再执行
+                            continue
+                        self._pending_count -= 1
+                        self._processing_count += 1
+                    outcome = self._process_task(worker_id, task)
+                    processed += 1
+                    if outcome is True:
+                        succeeded += 1
+                    elif outcome is False:
+                        failed += 1
+
+                with self._lock:
+                    stats = self.stats
+                    stats["total_processed"] += processed
+                    stats["total_succeeded"] += succeeded
+                    stats["total_failed"] += failed
 
-                if not self._processor:
-                    logger.warning("Worker %d: 未设置处理器", worker_id)
-                    continue
+            except Exception as e:
+                logger.exception("Worker %d: 未预期异常", worker_id)
 
-                # 更新状态
-                task.status = TaskStatus.PROCESSING
-                task.started_at = datetime.now().isoformat()
+    def _process_task(self, worker_id: int, task: QueueTask) -> Optional[bool]:
+        """处理单个任务（含状态更新、重试与回调）
 
-                try:
-                    # 执行处理
-                    result = self._processor(task.data)
+        调用方已在锁内将任务从待处理计入处理中。
+
+        Returns:
+            True 成功，False 最终失败，None 已安排重试（或任务已被清空丢弃）
+        """
+        task.start()
 
-                    task.result = result
-                    task.status = TaskStatus.COMPLETED
-                    task.completed_at = datetime.now().isoformat()
-                    self.stats["total_succeeded"] += 1
+        try:
+            # 执行处理
+            result = self._processor(task.data)
 
-                    if self._result_callback:
-                        try:
-                            self._result_callback(task.id, result, True)
-                        except Exception as e:
-                            logger.error("Worker %d: 回调错误: %s", worker_id, e)
+            task.complete(result)
+            self._mark_finished(task)
 
+            if self._result_callback:
+                try:
+                    self._result_callback(task.id, result, True)
                 except Exception as e:
-                    task.retry_count += 1
-                    task.error = str(e)
-
-                    if task.retry_count < self.max_retries:
-                        # 重试
-                        task.status = TaskStatus.PENDING
-                        import time
-                        time.sleep(self.retry_delay)
-                        self._queue.put(task)
-                    else:
-                        # 放弃
-                        task.status = TaskStatus.FAILED
-                        task.completed_at = datetime.now().isoformat()
-                        self.stats["total_failed"] += 1
-
-                        if self._result_callback:
-                            try:
-                                self._result_callback(task.id, None, False)
-                            except Exception as cb_e:
-                                logger.error("Worker %d: 回调错误: %s", worker_id, cb_e)
-
-                self.stats["total_processed"] += 1
-                self._queue.task_done()
-
-            except Exception as e:
-                logger.exception("Worker %d: 未预期异常", worker_id)
+                    logger.error("Worker %d: 回调错误: %s", worker_id, e)
+            return True
+
+        except Exception as e:
+            task.retry_count += 1
+            task.error = str(e)
+
+            if task.retry_count < self.max_retries:
+                # 重试
+                with self._lock:
+                    self._processing_count -= 1
+                    if task.id not in self._tasks:
+                        # 处理期间被 clear() 丢弃，不再重试
+                        return None
+                    self._pending_count += 1
+                task.status = TaskStatus.PENDING
+                self._schedule_retry(task)
+                return None
+            else:
+                # 放弃
+                task.fail(task.error)
+                self._mark_finished(task)
+
+                if self._result_callback:
+                    try:
+                        self._result_callback(task.id, None, False)
+                    except Exception as cb_e:
+                        logger.error("Worker %d: 回调错误: %s", worker_id, cb_e)
+                return False
+
+    def _mark_finished(self, task: QueueTask):
+        """记录任务结束，移到淘汰顺序末尾"""
+        with self._lock:
+            self._processing_count -= 1
+            if task.id in self._tasks:
+                self._tasks.move_to_end(task.id)
+
+    def _evict_finished(self):
+        """淘汰最早结束的一条任务记录（调用方需持有锁）"""
+        completed, failed = TaskStatus.COMPLETED, TaskStatus.FAILED
+        for task_id, task in self._tasks.items():
+            status = task.status
+            if status is completed or status is failed:
+                del self._tasks[task_id]
+                return
 
     def get_stats(self) -> Dict:
         """获取统计信息"""
         return {
             **self.stats,
-            "queue_size": self._queue.qsize(),
-            "pending_tasks": len([t for t in self._tasks.values() if t.status == TaskStatus.PENDING]),
-            "processing_tasks": len([t for t in self._tasks.values() if t.status == TaskStatus.PROCESSING]),
+            "queue_size": len(self._queue),
+            "pending_tasks": self._pending_count,
+            "processing_tasks": self._processing_count,
         }
 
     def clear(self):
-        """清空队列"""
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
-        with self._lock:
+        """清空队列
+
+        已被工作线程批量取出但尚未开始的任务也一并丢弃（按任务记录是否存在判断），
+        正在处理的任务会执行完毕。
+        """
+        with self._delay_cond:
+            self._delayed.clear()
+        with self._cv:
+            self._queue.clear()
             self._tasks.clear()
+            self._pending_count = 0
 
     @property
     def is_running(self) -> bool:
@@ -237,4 +374,4 @@ class AIQueueManager:
 
     @property
     def queue_size(self) -> int:
-        return self._queue.qsize()
+        return len(self._queue)
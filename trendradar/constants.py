@@ -5,6 +5,7 @@ TrendRadar 常量定义
 集中管理所有魔法数字和字符串常量，便于维护和修改。
 """
 
+from functools import lru_cache
 from typing import Dict
 
 
@@ -21,10 +22,21 @@ class BatchSizes:
     SLACK = 4000         # Slack 消息限制
     DEFAULT = 4000       # 默认安全值
 
+    # 渠道名 → 批次大小查找表
+    _TABLE: Dict[str, int] = {
+        "FEISHU": FEISHU,
+        "DINGTALK": DINGTALK,
+        "WEWORK": WEWORK,
+        "TELEGRAM": TELEGRAM,
+        "BARK": BARK,
+        "NTFY": NTFY,
+        "SLACK": SLACK,
+    }
+
     @classmethod
     def get(cls, channel: str) -> int:
         """获取指定渠道的批次大小"""
-        return getattr(cls, channel.upper(), cls.DEFAULT)
+        return cls._TABLE.get(channel.upper(), cls.DEFAULT)
 
 
 # === 分隔符 ===
@@ -35,6 +47,12 @@ class Separators:
     LINE = "─" * 40
     SECTION = "═" * 40
 
+    # UTF-8 编码版本，供直接拼装字节负载的发送器使用
+    FEISHU_BYTES = FEISHU.encode("utf-8")
+    DEFAULT_BYTES = DEFAULT.encode("utf-8")
+    LINE_BYTES = LINE.encode("utf-8")
+    SECTION_BYTES = SECTION.encode("utf-8")
+
 
 # === 超时设置（秒）===
 class Timeouts:
@@ -85,9 +103,14 @@ CONFIG_KEY_ALIASES: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def normalize_config_key(key: str) -> str:
     """标准化配置键名为大写"""
-    return CONFIG_KEY_ALIASES.get(key, key.upper())
+    mapped = CONFIG_KEY_ALIASES.get(key)
+    if mapped is not None:
+        return mapped
+    # 已是大写键名（常见情况）时直接返回，避免 upper() 复制字符串
+    return key if key.isupper() else key.upper()
 
 
 # === 日志前缀 ===
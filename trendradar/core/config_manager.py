@@ -20,18 +20,23 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 from trendradar.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 缺失配置段的只读占位，避免每次 .get(key, {}) 都新建空字典
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+
 
 # ============================================================
 # AI 配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AIQueueConfig:
     """AI 队列配置"""
     max_size: int = 100
@@ -39,7 +44,11 @@ class AIQueueConfig:
     retry_count: int = 3
 
 
-@dataclass(frozen=True)
+# 冻结 dataclass 不可变，默认子配置共享模块级单例，避免每次构造都新建
+_DEFAULT_AI_QUEUE = AIQueueConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class AIConfig:
     """AI 模型配置（LiteLLM 格式）"""
     model: str = "deepseek/deepseek-chat"
@@ -51,12 +60,12 @@ class AIConfig:
     num_retries: int = 2
     fallback_models: List[str] = field(default_factory=list)
     extra_params: Dict[str, Any] = field(default_factory=dict)
-    queue: AIQueueConfig = field(default_factory=AIQueueConfig)
+    queue: AIQueueConfig = _DEFAULT_AI_QUEUE
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AIConfig":
         """从字典创建 AIConfig"""
-        queue_data = data.get("QUEUE", {})
+        queue_data = data.get("QUEUE") or _EMPTY_DICT
         queue = AIQueueConfig(
             max_size=queue_data.get("MAX_SIZE", 100),
             workers=queue_data.get("WORKERS", 2),
@@ -76,7 +85,7 @@ class AIConfig:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AIAnalysisWindowConfig:
     """AI 分析窗口配置"""
     enabled: bool = False
@@ -85,7 +94,10 @@ class AIAnalysisWindowConfig:
     once_per_day: bool = False
 
 
-@dataclass(frozen=True)
+_DEFAULT_AI_ANALYSIS_WINDOW = AIAnalysisWindowConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class AIAnalysisConfig:
     """AI 分析功能配置"""
     enabled: bool = False
@@ -95,13 +107,15 @@ class AIAnalysisConfig:
     max_news_for_analysis: int = 50
     include_rss: bool = True
     include_rank_timeline: bool = False
-    analysis_window: AIAnalysisWindowConfig = field(default_factory=AIAnalysisWindowConfig)
+    analysis_window: AIAnalysisWindowConfig = _DEFAULT_AI_ANALYSIS_WINDOW
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AIAnalysisConfig":
         """从字典创建 AIAnalysisConfig"""
-        window_data = data.get("ANALYSIS_WINDOW", {})
-        time_range = window_data.get("TIME_RANGE", {})
+        if not data:
+            return _EMPTY_AI_ANALYSIS
+        window_data = data.get("ANALYSIS_WINDOW") or _EMPTY_DICT
+        time_range = window_data.get("TIME_RANGE") or _EMPTY_DICT
         window = AIAnalysisWindowConfig(
             enabled=window_data.get("ENABLED", False),
             start=time_range.get("START", "09:00"),
@@ -120,7 +134,10 @@ class AIAnalysisConfig:
         )
 
 
-@dataclass(frozen=True)
+_EMPTY_AI_ANALYSIS = AIAnalysisConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class AITranslationConfig:
     """AI 翻译功能配置"""
     enabled: bool = False
@@ -130,6 +147,8 @@ class AITranslationConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AITranslationConfig":
         """从字典创建 AITranslationConfig"""
+        if not data:
+            return _EMPTY_AI_TRANSLATION
         return cls(
             enabled=data.get("ENABLED", False),
             language=data.get("LANGUAGE", "English"),
@@ -137,11 +156,14 @@ class AITranslationConfig:
         )
 
 
+_EMPTY_AI_TRANSLATION = AITranslationConfig()
+
+
 # ============================================================
 # 通知配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PushWindowConfig:
     """推送窗口配置"""
     enabled: bool = False
@@ -152,7 +174,9 @@ class PushWindowConfig:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PushWindowConfig":
         """从字典创建 PushWindowConfig"""
-        time_range = data.get("TIME_RANGE", {})
+        if not data:
+            return _DEFAULT_PUSH_WINDOW
+        time_range = data.get("TIME_RANGE") or _EMPTY_DICT
         return cls(
             enabled=data.get("ENABLED", False),
             start=time_range.get("START", "08:00"),
@@ -161,7 +185,10 @@ class PushWindowConfig:
         )
 
 
-@dataclass(frozen=True)
+_DEFAULT_PUSH_WINDOW = PushWindowConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     """通知配置"""
     enabled: bool = True
@@ -210,12 +237,12 @@ class NotificationConfig:
     generic_webhook_template: str = ""
 
     # 推送窗口
-    push_window: PushWindowConfig = field(default_factory=PushWindowConfig)
+    push_window: PushWindowConfig = _DEFAULT_PUSH_WINDOW
 
     @classmethod
     def from_raw_config(cls, config: Dict[str, Any]) -> "NotificationConfig":
         """从原始配置字典创建 NotificationConfig"""
-        push_window_data = config.get("PUSH_WINDOW", {})
+        push_window_data = config.get("PUSH_WINDOW") or _EMPTY_DICT
         push_window = PushWindowConfig.from_dict(push_window_data)
 
         return cls(
@@ -255,7 +282,7 @@ class NotificationConfig:
 # 报告配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportConfig:
     """报告配置"""
     mode: str = "daily"
@@ -280,7 +307,7 @@ class ReportConfig:
 # 存储配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageFormatsConfig:
     """存储格式配置"""
     sqlite: bool = True
@@ -288,14 +315,20 @@ class StorageFormatsConfig:
     html: bool = True
 
 
-@dataclass(frozen=True)
+_DEFAULT_STORAGE_FORMATS = StorageFormatsConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class StorageLocalConfig:
     """本地存储配置"""
     data_dir: str = "output"
     retention_days: int = 0
 
 
-@dataclass(frozen=True)
+_DEFAULT_STORAGE_LOCAL = StorageLocalConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class StorageRemoteConfig:
     """远程存储配置"""
     endpoint_url: str = ""
@@ -306,29 +339,37 @@ class StorageRemoteConfig:
     retention_days: int = 0
 
 
-@dataclass(frozen=True)
+_DEFAULT_STORAGE_REMOTE = StorageRemoteConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class StoragePullConfig:
     """存储拉取配置"""
     enabled: bool = False
     days: int = 7
 
 
-@dataclass(frozen=True)
+_DEFAULT_STORAGE_PULL = StoragePullConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     """存储配置"""
     backend: str = "auto"
-    formats: StorageFormatsConfig = field(default_factory=StorageFormatsConfig)
-    local: StorageLocalConfig = field(default_factory=StorageLocalConfig)
-    remote: StorageRemoteConfig = field(default_factory=StorageRemoteConfig)
-    pull: StoragePullConfig = field(default_factory=StoragePullConfig)
+    formats: StorageFormatsConfig = _DEFAULT_STORAGE_FORMATS
+    local: StorageLocalConfig = _DEFAULT_STORAGE_LOCAL
+    remote: StorageRemoteConfig = _DEFAULT_STORAGE_REMOTE
+    pull: StoragePullConfig = _DEFAULT_STORAGE_PULL
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StorageConfig":
         """从字典创建 StorageConfig"""
-        formats_data = data.get("FORMATS", {})
-        local_data = data.get("LOCAL", {})
-        remote_data = data.get("REMOTE", {})
-        pull_data = data.get("PULL", {})
+        if not data:
+            return _EMPTY_STORAGE
+        formats_data = data.get("FORMATS") or _EMPTY_DICT
+        local_data = data.get("LOCAL") or _EMPTY_DICT
+        remote_data = data.get("REMOTE") or _EMPTY_DICT
+        pull_data = data.get("PULL") or _EMPTY_DICT
 
         return cls(
             backend=data.get("BACKEND", "auto"),
@@ -356,18 +397,24 @@ class StorageConfig:
         )
 
 
+_EMPTY_STORAGE = StorageConfig()
+
+
 # ============================================================
 # RSS 配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSSFreshnessConfig:
     """RSS 新鲜度过滤配置"""
     enabled: bool = True
     max_age_days: int = 3
 
 
-@dataclass(frozen=True)
+_DEFAULT_RSS_FRESHNESS = RSSFreshnessConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class RSSConfig:
     """RSS 配置"""
     enabled: bool = False
@@ -376,12 +423,12 @@ class RSSConfig:
     use_proxy: bool = False
     proxy_url: str = ""
     feeds: List[Dict[str, Any]] = field(default_factory=list)
-    freshness_filter: RSSFreshnessConfig = field(default_factory=RSSFreshnessConfig)
+    freshness_filter: RSSFreshnessConfig = _DEFAULT_RSS_FRESHNESS
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RSSConfig":
         """从字典创建 RSSConfig"""
-        freshness_data = data.get("FRESHNESS_FILTER", {})
+        freshness_data = data.get("FRESHNESS_FILTER") or _EMPTY_DICT
         return cls(
             enabled=data.get("ENABLED", False),
             request_interval=data.get("REQUEST_INTERVAL", 2000),
@@ -400,7 +447,7 @@ class RSSConfig:
 # 自定义爬虫配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CrawlerCustomFullContentConfig:
     """自定义爬虫全文抓取配置"""
     enabled: bool = True
@@ -409,7 +456,10 @@ class CrawlerCustomFullContentConfig:
     timeout: int = 10
 
 
-@dataclass(frozen=True)
+_DEFAULT_CRAWLER_FULL_CONTENT = CrawlerCustomFullContentConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class CrawlerCustomStorageConfig:
     """自定义爬虫存储配置"""
     max_items: int = 10000
@@ -417,30 +467,36 @@ class CrawlerCustomStorageConfig:
     max_display_items: int = 100
 
 
-@dataclass(frozen=True)
+_DEFAULT_CRAWLER_STORAGE = CrawlerCustomStorageConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class CrawlerCustomFilterConfig:
     """自定义爬虫过滤配置"""
     enabled: bool = True
     show_tag: bool = True
 
 
-@dataclass(frozen=True)
+_DEFAULT_CRAWLER_FILTER = CrawlerCustomFilterConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class CrawlerCustomConfig:
     """自定义爬虫配置"""
     enabled: bool = False
     poll_interval: int = 10
     api_type: str = "tapp"
-    full_content: CrawlerCustomFullContentConfig = field(default_factory=CrawlerCustomFullContentConfig)
+    full_content: CrawlerCustomFullContentConfig = _DEFAULT_CRAWLER_FULL_CONTENT
     sources: List[Dict[str, Any]] = field(default_factory=list)
-    storage: CrawlerCustomStorageConfig = field(default_factory=CrawlerCustomStorageConfig)
-    filter: CrawlerCustomFilterConfig = field(default_factory=CrawlerCustomFilterConfig)
+    storage: CrawlerCustomStorageConfig = _DEFAULT_CRAWLER_STORAGE
+    filter: CrawlerCustomFilterConfig = _DEFAULT_CRAWLER_FILTER
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CrawlerCustomConfig":
         """从字典创建 CrawlerCustomConfig"""
-        full_content_data = data.get("FULL_CONTENT", {})
-        storage_data = data.get("STORAGE", {})
-        filter_data = data.get("FILTER", {})
+        full_content_data = data.get("FULL_CONTENT") or _EMPTY_DICT
+        storage_data = data.get("STORAGE") or _EMPTY_DICT
+        filter_data = data.get("FILTER") or _EMPTY_DICT
 
         return cls(
             enabled=data.get("ENABLED", False),
@@ -469,7 +525,7 @@ class CrawlerCustomConfig:
 # 显示配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DisplayRegionsConfig:
     """显示区域开关配置"""
     hotlist: bool = True
@@ -479,7 +535,10 @@ class DisplayRegionsConfig:
     ai_analysis: bool = True
 
 
-@dataclass(frozen=True)
+_DEFAULT_DISPLAY_REGIONS = DisplayRegionsConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class DisplayStandaloneConfig:
     """独立展示区配置"""
     platforms: List[str] = field(default_factory=list)
@@ -487,18 +546,18 @@ class DisplayStandaloneConfig:
     max_items: int = 20
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DisplayConfig:
     """显示配置"""
     region_order: List[str] = field(default_factory=lambda: ["hotlist", "rss", "new_items", "standalone", "ai_analysis"])
-    regions: DisplayRegionsConfig = field(default_factory=DisplayRegionsConfig)
+    regions: DisplayRegionsConfig = _DEFAULT_DISPLAY_REGIONS
     standalone: DisplayStandaloneConfig = field(default_factory=DisplayStandaloneConfig)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DisplayConfig":
         """从字典创建 DisplayConfig"""
-        regions_data = data.get("REGIONS", {})
-        standalone_data = data.get("STANDALONE", {})
+        regions_data = data.get("REGIONS") or _EMPTY_DICT
+        standalone_data = data.get("STANDALONE") or _EMPTY_DICT
 
         return cls(
             region_order=data.get("REGION_ORDER", ["hotlist", "rss", "new_items", "standalone", "ai_analysis"]),
@@ -521,7 +580,7 @@ class DisplayConfig:
 # 应用配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """应用基础配置"""
     timezone: str = "Asia/Shanghai"
@@ -546,7 +605,7 @@ class AppConfig:
 # 爬虫配置
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CrawlerConfig:
     """爬虫基础配置"""
     request_interval: int = 100
@@ -569,6 +628,19 @@ class CrawlerConfig:
 # 配置管理器
 # ============================================================
 
+# 通知渠道配置键（任一非空即视为已配置推送渠道）
+_NOTIFICATION_CHANNEL_KEYS = (
+    "FEISHU_WEBHOOK_URL",
+    "DINGTALK_WEBHOOK_URL",
+    "WEWORK_WEBHOOK_URL",
+    "TELEGRAM_BOT_TOKEN",
+    "EMAIL_FROM",
+    "NTFY_TOPIC",
+    "BARK_URL",
+    "SLACK_WEBHOOK_URL",
+)
+
+
 class ConfigManager:
     """
     统一的配置管理器
@@ -582,6 +654,9 @@ class ConfigManager:
         120
         >>> manager.get("AI")  # 原始字典访问
         {'MODEL': 'deepseek/deepseek-chat', ...}
+
+    注意：不使用 __slots__。配置段由 cached_property 缓存到实例 __dict__，
+    首次访问后即为普通属性读取；改为槽位需要每次经过 property 函数调用，反而更慢。
     """
 
     def __init__(self, raw_config: Dict[str, Any]):
@@ -592,42 +667,24 @@ class ConfigManager:
             raw_config: 由 load_config() 返回的原始配置字典
         """
         self._raw_config = raw_config
+        # 实例属性遮蔽同名方法：get() 直接调用 dict.get，省去一层 Python 调用
+        self.get = raw_config.get
         self._validate()
 
-        # 懒加载缓存
-        self._ai: Optional[AIConfig] = None
-        self._ai_analysis: Optional[AIAnalysisConfig] = None
-        self._ai_translation: Optional[AITranslationConfig] = None
-        self._notification: Optional[NotificationConfig] = None
-        self._report: Optional[ReportConfig] = None
-        self._storage: Optional[StorageConfig] = None
-        self._rss: Optional[RSSConfig] = None
-        self._crawler_custom: Optional[CrawlerCustomConfig] = None
-        self._display: Optional[DisplayConfig] = None
-        self._app: Optional[AppConfig] = None
-        self._crawler: Optional[CrawlerConfig] = None
-
     def _validate(self) -> None:
         """验证配置，记录警告信息"""
         warnings = []
 
+        get = self._raw_config.get
+
         # 检查 AI 配置
-        ai_config = self._raw_config.get("AI", {})
+        ai_config = get("AI") or _EMPTY_DICT
         if ai_config.get("API_KEY") and not ai_config.get("MODEL"):
             warnings.append("配置了 AI_API_KEY 但未设置 AI_MODEL")
 
-        # 检查通知配置
-        if self._raw_config.get("ENABLE_NOTIFICATION", True):
-            has_channel = any([
-                self._raw_config.get("FEISHU_WEBHOOK_URL"),
-                self._raw_config.get("DINGTALK_WEBHOOK_URL"),
-                self._raw_config.get("WEWORK_WEBHOOK_URL"),
-                self._raw_config.get("TELEGRAM_BOT_TOKEN"),
-                self._raw_config.get("EMAIL_FROM"),
-                self._raw_config.get("NTFY_TOPIC"),
-                self._raw_config.get("BARK_URL"),
-                self._raw_config.get("SLACK_WEBHOOK_URL"),
-            ])
+        # 检查通知配置（遇到第一个已配置的渠道即停止）
+        if get("ENABLE_NOTIFICATION", True):
+            has_channel = any(get(key) for key in _NOTIFICATION_CHANNEL_KEYS)
             if not has_channel:
                 warnings.append("通知已启用但未配置任何推送渠道")
 
@@ -639,82 +696,60 @@ class ConfigManager:
     # 类型安全的配置属性
     # ============================================================
 
-    @property
+    @cached_property
     def ai(self) -> AIConfig:
         """获取 AI 模型配置"""
-        if self._ai is None:
-            self._ai = AIConfig.from_dict(self._raw_config.get("AI", {}))
-        return self._ai
+        return AIConfig.from_dict(self._raw_config.get("AI") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def ai_analysis(self) -> AIAnalysisConfig:
         """获取 AI 分析功能配置"""
-        if self._ai_analysis is None:
-            self._ai_analysis = AIAnalysisConfig.from_dict(self._raw_config.get("AI_ANALYSIS", {}))
-        return self._ai_analysis
+        return AIAnalysisConfig.from_dict(self._raw_config.get("AI_ANALYSIS") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def ai_translation(self) -> AITranslationConfig:
         """获取 AI 翻译功能配置"""
-        if self._ai_translation is None:
-            self._ai_translation = AITranslationConfig.from_dict(self._raw_config.get("AI_TRANSLATION", {}))
-        return self._ai_translation
+        return AITranslationConfig.from_dict(self._raw_config.get("AI_TRANSLATION") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def notification(self) -> NotificationConfig:
         """获取通知配置"""
-        if self._notification is None:
-            self._notification = NotificationConfig.from_raw_config(self._raw_config)
-        return self._notification
+        return NotificationConfig.from_raw_config(self._raw_config)
 
-    @property
+    @cached_property
     def report(self) -> ReportConfig:
         """获取报告配置"""
-        if self._report is None:
-            self._report = ReportConfig.from_raw_config(self._raw_config)
-        return self._report
+        return ReportConfig.from_raw_config(self._raw_config)
 
-    @property
+    @cached_property
     def storage(self) -> StorageConfig:
         """获取存储配置"""
-        if self._storage is None:
-            self._storage = StorageConfig.from_dict(self._raw_config.get("STORAGE", {}))
-        return self._storage
+        return StorageConfig.from_dict(self._raw_config.get("STORAGE") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def rss(self) -> RSSConfig:
         """获取 RSS 配置"""
-        if self._rss is None:
-            self._rss = RSSConfig.from_dict(self._raw_config.get("RSS", {}))
-        return self._rss
+        return RSSConfig.from_dict(self._raw_config.get("RSS") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def crawler_custom(self) -> CrawlerCustomConfig:
         """获取自定义爬虫配置"""
-        if self._crawler_custom is None:
-            self._crawler_custom = CrawlerCustomConfig.from_dict(self._raw_config.get("CRAWLER_CUSTOM", {}))
-        return self._crawler_custom
+        return CrawlerCustomConfig.from_dict(self._raw_config.get("CRAWLER_CUSTOM") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def display(self) -> DisplayConfig:
         """获取显示配置"""
-        if self._display is None:
-            self._display = DisplayConfig.from_dict(self._raw_config.get("DISPLAY", {}))
-        return self._display
+        return DisplayConfig.from_dict(self._raw_config.get("DISPLAY") or _EMPTY_DICT)
 
-    @property
+    @cached_property
     def app(self) -> AppConfig:
         """获取应用基础配置"""
-        if self._app is None:
-            self._app = AppConfig.from_raw_config(self._raw_config)
-        return self._app
+        return AppConfig.from_raw_config(self._raw_config)
 
-    @property
+    @cached_property
     def crawler(self) -> CrawlerConfig:
         """获取爬虫基础配置"""
-        if self._crawler is None:
-            self._crawler = CrawlerConfig.from_raw_config(self._raw_config)
-        return self._crawler
+        return CrawlerConfig.from_raw_config(self._raw_config)
 
     # ============================================================
     # 向后兼容的字典访问
@@ -724,6 +759,8 @@ class ConfigManager:
         """
         获取原始配置值（向后兼容）
 
+        实例上已绑定为 raw_config.get，此方法仅作接口说明和兜底。
+
         Args:
             key: 配置键名
             default: 默认值
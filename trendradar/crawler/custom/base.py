@@ -6,12 +6,22 @@
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from typing import Callable, List, Optional, Dict, Any, Mapping, Tuple
 from enum import Enum
-from datetime import datetime
+from types import MappingProxyType
+from urllib.parse import urlparse
+import threading
+import time
 import traceback
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from trendradar.utils.time import fast_isoformat
+
 
 class FetchStatus(Enum):
     """获取状态枚举"""
@@ -31,7 +41,7 @@ class CrawlerError(Exception):
         self.message = message
         self.source_id = source_id
         self.url = url
-        self.timestamp = datetime.now().isoformat()
+        self.timestamp = fast_isoformat()
 
 
 class NetworkError(CrawlerError):
@@ -49,7 +59,7 @@ class ContentFetchError(CrawlerError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlerNewsItem:
     """爬虫新闻条目
 
@@ -83,51 +93,22 @@ class CrawlerNewsItem:
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
-        return {
-            "seq": self.seq,
-            "title": self.title,
-            "summary": self.summary,
-            "full_content": self.full_content,
-            "url": self.url,
-            "published_at": self.published_at,
-            "source": self.source,
-            "author": self.author,
-            "extra": self.extra,
-            "content_fetched": self.content_fetched,
-            "content_fetch_error": self.content_fetch_error,
-            "content_fetch_time": self.content_fetch_time,
-            "matched_keywords": self.matched_keywords,
-            "filtered_out": self.filtered_out,
-            "filter_reason": self.filter_reason,
-            "ai_analysis": self.ai_analysis,
-            "ai_analysis_time": self.ai_analysis_time,
-        }
+        return {name: getattr(self, name) for name in _NEWS_ITEM_FIELDS}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CrawlerNewsItem":
-        """从字典创建"""
-        return cls(
-            seq=data.get("seq", ""),
-            title=data.get("title", ""),
-            summary=data.get("summary", ""),
-            full_content=data.get("full_content", ""),
-            url=data.get("url", ""),
-            published_at=data.get("published_at", ""),
-            source=data.get("source", ""),
-            author=data.get("author", ""),
-            extra=data.get("extra", {}),
-            content_fetched=data.get("content_fetched", False),
-            content_fetch_error=data.get("content_fetch_error", ""),
-            content_fetch_time=data.get("content_fetch_time", ""),
-            matched_keywords=data.get("matched_keywords", []),
-            filtered_out=data.get("filtered_out", False),
-            filter_reason=data.get("filter_reason", ""),
-            ai_analysis=data.get("ai_analysis", ""),
-            ai_analysis_time=data.get("ai_analysis_time", ""),
-        )
-
-
-@dataclass
+        """从字典创建（缺失字段使用默认值）"""
+        kwargs = {name: data[name] for name in _NEWS_ITEM_FIELDS if name in data}
+        kwargs.setdefault("seq", "")
+        kwargs.setdefault("title", "")
+        return cls(**kwargs)
+
+
+# 字段名元组，供 to_dict/from_dict 按字段顺序遍历
+_NEWS_ITEM_FIELDS = tuple(f.name for f in fields(CrawlerNewsItem))
+
+
+@dataclass(slots=True)
 class CrawlResult:
     """爬取结果
 
@@ -145,12 +126,12 @@ class CrawlResult:
 
     def __post_init__(self):
         if not self.fetch_time:
-            self.fetch_time = datetime.now().isoformat()
+            self.fetch_time = fast_isoformat()
         if self.total_count == 0:
             self.total_count = len(self.items)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorLogEntry:
     """错误日志条目"""
     timestamp: str
@@ -164,17 +145,69 @@ class ErrorLogEntry:
     resolve_note: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "source_id": self.source_id,
-            "operation": self.operation,
-            "url": self.url,
-            "error_type": self.error_type,
-            "error_message": self.error_message,
-            "stack_trace": self.stack_trace,
-            "resolved": self.resolved,
-            "resolve_note": self.resolve_note,
-        }
+        return {name: getattr(self, name) for name in _ERROR_LOG_FIELDS}
+
+
+_ERROR_LOG_FIELDS = tuple(f.name for f in fields(ErrorLogEntry))
+
+
+# 默认请求头（只读，所有爬虫共享）
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+})
+
+
+# 连接重试：只重试连接失败和限流/网关类状态码，读超时不重试以免拉长轮询周期
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+def create_http_adapter(pool_maxsize: int = 32) -> HTTPAdapter:
+    """创建带连接池和重试的 HTTPAdapter
+
+    适配器内的连接池线程安全，可同时挂载到多个会话上共享连接。
+
+    Args:
+        pool_maxsize: 每个主机的连接池大小
+
+    Returns:
+        HTTPAdapter 实例
+    """
+    return HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUS,
+            raise_on_status=False,
+        ),
+    )
+
+
+class _HostPacer:
+    """按主机限速：同一主机相邻两次请求的开始时间至少间隔 interval 秒
+
+    各线程先在锁内预约时间槽，再在锁外等待，不同主机互不阻塞。
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class BaseCrawler(ABC):
@@ -257,20 +290,122 @@ class BaseCrawler(ABC):
         """
         return True
 
-    def get_request_headers(self) -> Dict[str, str]:
+    def fetch_full_content_batch(
+        self,
+        items: List[CrawlerNewsItem],
+        delay: Optional[float] = None,
+        callback: Optional[Callable] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Tuple[str, FetchStatus]]:
+        """批量获取完整内容
+
+        请求在线程池中并发执行，同一主机的请求开始时间至少间隔 delay 秒，
+        不同主机之间不互相等待。回调在调用线程中按完成顺序执行。
+
+        Args:
+            items: 新闻条目列表
+            delay: 同一主机的请求间隔（秒），默认取配置 content_fetch_delay
+            callback: 每获取一条后的回调函数，接收 (item, content, status) 参数
+            max_workers: 并发请求数，默认取配置 content_fetch_workers（8），<=1 时顺序执行
+
+        Returns:
+            {seq: (content, status)} 字典，按 items 顺序排列
+        """
+        if not self.supports_full_content():
+            return {item.seq: ("", FetchStatus.UNKNOWN_ERROR) for item in items}
+
+        if delay is None:
+            delay = self.config.get("content_fetch_delay", 0.3)
+        if max_workers is None:
+            max_workers = self.config.get("content_fetch_workers", 8)
+
+        results: Dict[str, Tuple[str, FetchStatus]] = {}
+        pending = []
+        for item in items:
+            if item.content_fetched:
+                results[item.seq] = (item.full_content, FetchStatus.SUCCESS)
+            elif not item.url:
+                results[item.seq] = ("", FetchStatus.EMPTY_RESULT)
+            else:
+                results[item.seq] = ("", FetchStatus.UNKNOWN_ERROR)  # 占位，保持顺序
+                pending.append(item)
+
+        if not pending:
+            return results
+
+        pacer = _HostPacer(delay)
+
+        def fetch(item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
+            pacer.wait(urlparse(item.url).netloc)
+            try:
+                return self.fetch_full_content(item)
+            except Exception:
+                return "", FetchStatus.UNKNOWN_ERROR
+
+        def record(item: CrawlerNewsItem, content: str, status: FetchStatus) -> None:
+            results[item.seq] = (content, status)
+
+            # 更新 item
+            item.full_content = content
+            item.content_fetched = status == FetchStatus.SUCCESS
+            item.content_fetch_time = fast_isoformat()
+            if status != FetchStatus.SUCCESS:
+                item.content_fetch_error = status.value
+
+            if callback:
+                callback(item, content, status)
+
+        workers = max(1, min(max_workers, len(pending)))
+        if workers == 1:
+            # 单并发（max_workers<=1 或只有一条）时在调用线程中顺序执行，不创建线程池
+            for item in pending:
+                record(item, *fetch(item))
+            return results
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="content-batch") as pool:
+            futures = {pool.submit(fetch, item): item for item in pending}
+            for future in as_completed(futures):
+                record(futures[future], *future.result())
+
+        return results
+
+    def create_session(self) -> requests.Session:
+        """创建带连接池和重试的请求会话
+
+        挂载 HTTPAdapter：连接保持复用，连接池大小取配置
+        pool_maxsize（默认 32），足够容纳批量获取内容时的并发请求。
+        注册到 CrawlerManager 后改用管理器共享的适配器。
+
+        Returns:
+            已设置请求头的 requests.Session
+        """
+        session = requests.Session()
+        session.headers.update(self.get_request_headers())
+        adapter = create_http_adapter(self.config.get("pool_maxsize", 32))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def use_http_adapter(self, adapter: HTTPAdapter) -> None:
+        """将会话的 http/https 请求改走指定适配器（如管理器共享的连接池）
+
+        请求头仍保留在各自的会话上；没有 requests.Session 会话的爬虫忽略。
+        """
+        session = getattr(self, "session", None)
+        if isinstance(session, requests.Session):
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+    def get_request_headers(self) -> Mapping[str, str]:
         """获取请求头
 
-        子类可重写此方法以自定义请求头。
+        子类可重写此方法以自定义请求头。返回的是只读映射，
+        需要修改时请先复制：dict(super().get_request_headers())。
 
         Returns:
-            HTTP 请求头字典
+            HTTP 请求头映射
         """
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-            "Cache-Control": "no-cache",
-        }
+        return _DEFAULT_HEADERS
 
     def cleanup(self) -> None:
         """清理资源
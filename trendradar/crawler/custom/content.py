@@ -0,0 +1,351 @@
+# coding=utf-8
+"""
+文章正文提取
+
+同花顺各爬虫共用的文章获取与 HTML 正文解析。优先使用 selectolax（Lexbor
+引擎），其次直接用 lxml.html + 预编译 XPath，都未安装时回退到 BeautifulSoup
+（用 SoupStrainer 只解析正文容器）；均未安装时 HAS_HTML_PARSER 为 False。
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import requests
+
+from .base import CrawlerNewsItem, FetchStatus
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+_BS4_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+HAS_HTML_PARSER = SELECTOLAX_AVAILABLE or LXML_AVAILABLE or HAS_BS4
+
+# 正文容器（按优先级）
+_CONTAINER_CLASSES = ("main-text", "atc-content")
+
+# GBK 编码声明及嗅探范围
+_GBK_CHARSETS = ("charset=gbk", "charset=gb2312")
+_CHARSET_SNIFF_BYTES = 2048
+
+# 流式读取：div 开/闭标签与 class 属性（只匹配 ASCII，GBK/UTF-8 字节流均适用）
+_DIV_TAG_RE = re.compile(rb"<div\b([^>]*)>|</div\s*>", re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(rb"""class\s*=\s*["']?([^"'>]*)""", re.IGNORECASE)
+_PRIMARY_CONTAINER = _CONTAINER_CLASSES[0].encode()
+
+# 文章页流式读取的分块大小
+_CHUNK_SIZE = 8192
+
+# 文章正文缓存条数（按 URL，各爬虫共享）
+_CONTENT_CACHE_SIZE = 512
+
+# 提取正文前移除的标签
+_STRIP_TAGS = frozenset(("script", "style"))
+
+# 段落广告前缀与最短长度
+_AD_PREFIX = "关注同花顺财经"
+_MIN_PARAGRAPH_LEN = 5
+
+
+def _is_container_class(value) -> bool:
+    """class 属性是否包含正文容器类名（解析阶段可能拿到未拆分的原始字符串）"""
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else value
+    return any(name in _CONTAINER_CLASSES for name in classes)
+
+
+def _class_xpath(class_name: str) -> str:
+    return f"//div[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')][1]"
+
+
+if LXML_AVAILABLE:
+    # 按优先级排列的容器查找、需移除的标签、段落与文本节点（预编译，避免每页重复解析 XPath）
+    _LXML_CONTAINERS = tuple(etree.XPath(_class_xpath(name)) for name in _CONTAINER_CLASSES)
+    _LXML_STRIP = etree.XPath(".//script | .//style")
+    _LXML_PARAGRAPHS = etree.XPath(".//p")
+    _LXML_TEXTS = etree.XPath(".//text()")
+
+
+# BeautifulSoup 只构建正文容器子树，页面其余部分不进入解析树
+_CONTAINER_STRAINER = SoupStrainer("div", class_=_is_container_class) if HAS_BS4 else None
+
+
+def read_article_bytes(chunks: Iterable[bytes]) -> bytes:
+    """流式读取文章页，首选正文容器（div.main-text）闭合后即停止
+
+    按 div 开/闭标签计数跟踪容器嵌套深度，容器结束后不再读取后续的
+    广告、脚本等内容；调用方随后关闭响应即可中断剩余传输。未出现
+    首选容器时（如只有 div.atc-content）读取完整页面，保证容器优先级不变。
+
+    Args:
+        chunks: 响应体分块（如 resp.iter_content(8192)）
+
+    Returns:
+        截至容器闭合处（或完整）的响应体字节
+    """
+    buf = bytearray()
+    pos = 0       # 下次扫描起点（上一个完整标签之后）
+    depth = 0     # 容器内 div 嵌套深度，0 表示尚未进入容器
+    for chunk in chunks:
+        buf += chunk
+        for match in _DIV_TAG_RE.finditer(buf, pos):
+            pos = match.end()
+            attrs = match.group(1)
+            if depth:
+                if attrs is None:
+                    depth -= 1
+                    if not depth:
+                        return bytes(buf[:pos])
+                elif not attrs.rstrip().endswith(b"/"):
+                    depth += 1
+            elif attrs is not None:
+                class_attr = _CLASS_ATTR_RE.search(attrs)
+                if class_attr and _PRIMARY_CONTAINER in class_attr.group(1).split():
+                    depth = 1
+    return bytes(buf)
+
+
+def decode_html(content: bytes, content_type: str = "") -> str:
+    """按 GBK/UTF-8 解码页面
+
+    先看响应头 Content-Type 的 charset，没有声明 GBK 时只在前 2 KB
+    （meta 标签所在的 head 部分）中查找 charset=gbk / charset=gb2312，
+    不对整个页面做小写复制和全文扫描。
+
+    Args:
+        content: 响应体字节
+        content_type: 响应头 Content-Type
+
+    Returns:
+        解码后的 HTML（无法解码的字节替换为占位符）
+    """
+    header = content_type.lower()
+    head = content[:_CHARSET_SNIFF_BYTES].lower()
+    if any(charset in header for charset in _GBK_CHARSETS) or any(
+        charset.encode() in head for charset in _GBK_CHARSETS
+    ):
+        return content.decode("gbk", errors="replace")
+    return content.decode("utf-8", errors="replace")
+
+
+def extract_article_text(html: str) -> Tuple[str, FetchStatus]:
+    """从文章页 HTML 中提取正文
+
+    依次查找 div.main-text、div.atc-content 作为正文容器，去掉其中的
+    script/style 后按段落提取文本（过滤广告、过短段落并去重）；
+    没有有效段落时退回容器的全部文本。
+
+    Args:
+        html: 页面 HTML
+
+    Returns:
+        (正文, 状态) 元组：找不到容器为 PARSE_ERROR，容器为空为 EMPTY_RESULT
+    """
+    if SELECTOLAX_AVAILABLE:
+        return _extract_with_selectolax(html)
+    if LXML_AVAILABLE:
+        return _extract_with_lxml(html)
+    if HAS_BS4:
+        return _extract_with_bs4(html)
+    return "", FetchStatus.UNKNOWN_ERROR
+
+
+def _extract_with_selectolax(html: str) -> Tuple[str, FetchStatus]:
+    tree = LexborHTMLParser(html)
+    container = None
+    for class_name in _CONTAINER_CLASSES:
+        container = tree.css_first(f"div.{class_name}")
+        if container is not None:
+            break
+    if container is None:
+        return "", FetchStatus.PARSE_ERROR
+
+    for node in container.css("script, style"):
+        node.decompose()
+
+    text = _join_paragraphs(p.text(strip=True) for p in container.css("p"))
+    if not text:
+        text = container.text(separator="\n", strip=True)
+    return (text, FetchStatus.SUCCESS) if text else ("", FetchStatus.EMPTY_RESULT)
+
+
+def _extract_with_lxml(html: str) -> Tuple[str, FetchStatus]:
+    try:
+        tree = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return "", FetchStatus.PARSE_ERROR
+
+    container = None
+    for find_container in _LXML_CONTAINERS:
+        found = find_container(tree)
+        if found:
+            container = found[0]
+            break
+    if container is None:
+        return "", FetchStatus.PARSE_ERROR
+
+    for node in _LXML_STRIP(container):
+        node.drop_tree()
+
+    # 与 get_text(strip=True) 一致：各文本节点去空白后拼接
+    text = _join_paragraphs(
+        "".join(t.strip() for t in _LXML_TEXTS(p)) for p in _LXML_PARAGRAPHS(container)
+    )
+    if not text:
+        text = "\n".join(t for t in (t.strip() for t in _LXML_TEXTS(container)) if t)
+    return (text, FetchStatus.SUCCESS) if text else ("", FetchStatus.EMPTY_RESULT)
+
+
+def _extract_with_bs4(html: str) -> Tuple[str, FetchStatus]:
+    soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_CONTAINER_STRAINER)
+    # 两类容器都可能被保留，仍按优先级查找
+    container = None
+    for class_name in _CONTAINER_CLASSES:
+        container = soup.find("div", class_=class_name)
+        if container:
+            break
+    if not container:
+        return "", FetchStatus.PARSE_ERROR
+
+    # 一次遍历子孙节点同时收集 script/style 和段落，代替两次通用 find_all 匹配
+    removed, paragraphs = [], []
+    for node in container.descendants:
+        name = node.name
+        if name == "p":
+            paragraphs.append(node)
+        elif name in _STRIP_TAGS:
+            removed.append(node)
+    for tag in removed:
+        tag.decompose()
+
+    text = _join_paragraphs(p.get_text(strip=True) for p in paragraphs)
+    if not text:
+        text = container.get_text(separator="\n", strip=True)
+    return (text, FetchStatus.SUCCESS) if text else ("", FetchStatus.EMPTY_RESULT)
+
+
+def _join_paragraphs(paragraphs: Iterable[str]) -> str:
+    """过滤广告和过短段落，按首次出现顺序去重后用换行拼接"""
+    return "\n".join(dict.fromkeys(
+        text for text in paragraphs
+        if text and not text.startswith(_AD_PREFIX) and len(text) > _MIN_PARAGRAPH_LEN
+    ))
+
+
+class _ContentCache:
+    """按 URL 缓存已成功提取的正文（线程安全的 LRU）"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[str]:
+        with self._lock:
+            content = self._data.get(url)
+            if content is not None:
+                self._data.move_to_end(url)
+            return content
+
+    def put(self, url: str, content: str) -> None:
+        with self._lock:
+            self._data[url] = content
+            self._data.move_to_end(url)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_content_cache = _ContentCache(_CONTENT_CACHE_SIZE)
+
+
+class THSContentMixin:
+    """同花顺爬虫共用的完整内容获取
+
+    使用方需提供 session（requests.Session）和 timeout 属性，并放在
+    BaseCrawler 之前继承。成功提取的正文按 URL 缓存，同一文章在多轮
+    轮询中重复出现时不再请求。子类可重写 _decode_article 指定页面编码。
+    """
+
+    def fetch_full_content(self, item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
+        """获取新闻完整内容"""
+        if not HAS_HTML_PARSER:
+            return "", FetchStatus.UNKNOWN_ERROR
+
+        if not item.url:
+            return "", FetchStatus.EMPTY_RESULT
+
+        cached = _content_cache.get(item.url)
+        if cached is not None:
+            return cached, FetchStatus.SUCCESS
+
+        # 尝试的 URL 列表
+        urls_to_try = [item.url]
+
+        # 如果是 news.10jqka.com.cn 域名，尝试转换为 stock.10jqka.com.cn
+        if 'news.10jqka.com.cn' in item.url:
+            alt_url = item.url.replace('news.10jqka.com.cn', 'stock.10jqka.com.cn')
+            urls_to_try.append(alt_url)
+
+        for try_url in urls_to_try:
+            content, status = self._fetch_content_from_url(try_url)
+            if status == FetchStatus.SUCCESS and content:
+                _content_cache.put(item.url, content)
+                return content, status
+
+        return "", FetchStatus.EMPTY_RESULT
+
+    def _fetch_content_from_url(self, url: str) -> Tuple[str, FetchStatus]:
+        """从指定 URL 获取内容"""
+        try:
+            # 流式读取，正文容器结束后关闭响应，不再下载页面其余部分
+            with self.session.get(url, timeout=self.timeout, stream=True) as resp:
+                content = read_article_bytes(resp.iter_content(_CHUNK_SIZE))
+                content_type = resp.headers.get('Content-Type', '')
+            return extract_article_text(self._decode_article(content, content_type))
+
+        except requests.exceptions.Timeout:
+            return "", FetchStatus.TIMEOUT
+        except requests.exceptions.ConnectionError:
+            return "", FetchStatus.NETWORK_ERROR
+        except Exception:
+            return "", FetchStatus.UNKNOWN_ERROR
+
+    def _decode_article(self, content: bytes, content_type: str) -> str:
+        """解码文章页（默认按响应头/页面声明识别 GBK 或 UTF-8）"""
+        return decode_html(content, content_type)
+
+    def supports_full_content(self) -> bool:
+        """解析正文依赖 selectolax、lxml 或 BeautifulSoup，均未安装时不获取完整内容"""
+        return HAS_HTML_PARSER
+
+    def cleanup(self) -> None:
+        """清理资源"""
+        if self.session:
+            try:
+                self.session.close()
+            except Exception:
+                pass
+            self.session = None
@@ -6,10 +6,26 @@
 复用 TrendRadar 的关键词配置。
 """
 
+import os
 import re
-from typing import List, Dict, Tuple, Optional
+import sys
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Tuple, Optional, Set
 from .base import CrawlerNewsItem
 
+# 全局过滤词命中计数，批量过滤时按命中次数排序，常见过滤词优先检查
+_global_filter_hits: Counter = Counter()
+# 单个过滤词计数达到该值时所有计数减半，使排序随近期命中情况变化
+_GLOBAL_FILTER_DECAY_AT = 1024
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
 
 def filter_news_item(
     item: CrawlerNewsItem,
@@ -31,39 +47,77 @@ def filter_news_item(
     Returns:
         (是否通过, 匹配的关键词列表, 过滤原因)
     """
-    matched_keywords = []
+    return _filter_news_item(
+        item, word_groups, filter_words, _lower_global_filters(global_filters)
+    )
+
+
+def _lower_global_filters(global_filters: List[str]) -> List[Tuple[str, str]]:
+    """预处理全局过滤词：[(原词, 小写词)]，跳过空词"""
+    return [(word, word.lower()) for word in global_filters if word]
+
+
+def _record_global_filter_hit(filter_word_lc: str) -> None:
+    """记录全局过滤词命中，计数过大时整体衰减"""
+    hits = _global_filter_hits
+    hits[filter_word_lc] += 1
+    if hits[filter_word_lc] >= _GLOBAL_FILTER_DECAY_AT:
+        for word in list(hits):
+            hits[word] //= 2
+
+
+def _filter_news_item(
+    item: CrawlerNewsItem,
+    word_groups: List[Dict],
+    filter_words: List[str],
+    global_filters_lc: List[Tuple[str, str]],
+    keyword_index: Optional["_KeywordIndex"] = None,
+    global_automaton: Optional[Any] = None,
+) -> Tuple[bool, List[str], str]:
+    """三层过滤实现（全局过滤词已预先小写化，可选多模式匹配索引/全局过滤词自动机）"""
+    # dict 作为有序集合：O(1) 去重且保持首次匹配顺序
+    matched_keywords: Dict[str, None] = {}
     filter_reason = ""
 
     # 1. 检查全局过滤词（任一内容匹配则排除）
-    all_content = f"{item.title} {item.summary} {item.full_content}"
-    for filter_word in global_filters:
-        if filter_word and filter_word.lower() in all_content.lower():
-            return False, [], f"全局过滤词匹配: {filter_word}"
-
-    # 2. 三层关键词匹配
-    texts_to_check = [
-        ("title", item.title),
-        ("summary", item.summary),
-        ("full_content", item.full_content),
-    ]
-
-    for layer_name, text in texts_to_check:
+    if global_filters_lc:
+        all_content_lc = f"{item.title} {item.summary} {item.full_content}".lower()
+        # 有自动机时一次扫描得到出现的过滤词集合，再按（命中排序后的）配置顺序取第一个
+        if global_automaton is not None:
+            haystack = {word for _, word in global_automaton.iter(all_content_lc)}
+        else:
+            haystack = all_content_lc
+        if haystack:
+            for filter_word, filter_word_lc in global_filters_lc:
+                if filter_word_lc in haystack:
+                    _record_global_filter_hit(filter_word_lc)
+                    return False, [], f"全局过滤词匹配: {filter_word}"
+
+    # 2. 三层关键词匹配（各层独立判定，每层只小写化一次）
+    for text in (item.title, item.summary, item.full_content):
         if not text:
             continue
 
-        for group in word_groups:
-            match_result = _matches_word_group(text, group, filter_words)
-            if match_result:
-                keyword = group.get("display_name") or _get_group_name(group)
-                if keyword and keyword not in matched_keywords:
-                    matched_keywords.append(keyword)
+        text_lower = text.lower()
+        if keyword_index is not None:
+            matched_groups = keyword_index.match(text, text_lower)
+        else:
+            matched_groups = [
+                group for group in word_groups
+                if _matches_word_group(text, group, filter_words, text_lower)
+            ]
+
+        for group in matched_groups:
+            keyword = group.get("display_name") or _get_group_name(group)
+            if keyword:
+                matched_keywords[keyword] = None
 
     # 3. 判断是否通过
     passed = len(matched_keywords) > 0
     if not passed:
         filter_reason = "无匹配关键词"
 
-    return passed, matched_keywords, filter_reason
+    return passed, list(matched_keywords), filter_reason
 
 
 def filter_news_items(
@@ -88,10 +142,23 @@ def filter_news_items(
     """
     passed_items = []
     filtered_items = []
+    # 全局过滤词整批只小写化一次
+    global_filters_lc = _lower_global_filters(global_filters)
+    # 命中次数多的过滤词先检查（稳定排序，同计数保持配置顺序）
+    if len(global_filters_lc) > 1:
+        global_filters_lc.sort(key=lambda pair: -_global_filter_hits[pair[1]])
+
+    # 整批共用一个多模式匹配索引
+    keyword_index = _get_keyword_index(word_groups)
+    global_automaton = None
+    if AHOCORASICK_AVAILABLE and global_filters_lc:
+        global_automaton = _build_global_automaton(
+            frozenset(word_lc for _, word_lc in global_filters_lc)
+        )
 
     for item in items:
-        passed, keywords, reason = filter_news_item(
-            item, word_groups, filter_words, global_filters, match_mode
+        passed, keywords, reason = _filter_news_item(
+            item, word_groups, filter_words, global_filters_lc, keyword_index, global_automaton
         )
 
         item.matched_keywords = keywords
@@ -106,10 +173,39 @@ def filter_news_items(
     return passed_items, filtered_items
 
 
+# 最近一次构建的关键词索引：(word_groups, 索引)。只缓存元组形式的配置
+# （load_frequency_words_for_crawler 的不可变缓存结果），文件未变化时各轮轮询
+# 拿到同一个元组，直接复用已构建的自动机；列表可能被原地修改，每次重新构建
+_last_keyword_index: Optional[Tuple[Tuple[Dict, ...], "_KeywordIndex"]] = None
+
+
+def _get_keyword_index(word_groups: List[Dict]) -> "_KeywordIndex":
+    """获取关键词组的多模式匹配索引（配置未变化时复用）"""
+    global _last_keyword_index
+    cached = _last_keyword_index
+    if cached is not None and cached[0] is word_groups:
+        return cached[1]
+    index = _KeywordIndex(word_groups)
+    if isinstance(word_groups, tuple):
+        _last_keyword_index = (word_groups, index)
+    return index
+
+
+@lru_cache(maxsize=4)
+def _build_global_automaton(words_lc: frozenset) -> Any:
+    """为全局过滤词（已小写）构建 Aho-Corasick 自动机，按词集合缓存"""
+    automaton = ahocorasick.Automaton()
+    for word in words_lc:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
 def _matches_word_group(
     text: str,
     group: Dict,
-    filter_words: List[str]
+    filter_words: List[str],
+    text_lower: Optional[str] = None
 ) -> bool:
     """
     检查文本是否匹配关键词组
@@ -123,55 +219,184 @@ def _matches_word_group(
         "display_name": "显示名称"
     }
     """
-    text_lower = text.lower()
+    if "_words_lc" not in group:
+        _prepare_word_group(group)
+    if text_lower is None:
+        text_lower = text.lower()
 
     # 1. 检查排除词
-    excluded = group.get("excluded", [])
-    for ex in excluded:
-        word = ex.lstrip("!")
-        if word.lower() in text_lower:
+    for word in group["_excluded_lc"]:
+        if word in text_lower:
             return False
 
-    # 2. 检查必须词
-    required = group.get("required", [])
-    for req in required:
-        word = req.lstrip("+")
-        if word.lower() not in text_lower:
+    # 2. 检查必须词（全部匹配）
+    required = group["_required_lc"]
+    for word in required:
+        if word not in text_lower:
             return False
 
     # 3. 检查普通词（任一匹配）
-    words = group.get("words", [])
-    word_matched = False
+    words = group["_words_lc"]
     for word in words:
-        if word.lower() in text_lower:
-            word_matched = True
-            break
+        if word in text_lower:
+            return True
 
     # 4. 检查正则表达式
-    patterns = group.get("patterns", [])
-    pattern_matched = False
+    compiled_patterns = group["_compiled_patterns"]
+    for compiled in compiled_patterns:
+        if compiled.search(text_lower):
+            return True
+
+    # 5. 有普通词或正则时至少一个匹配；只有必须词时必须词已全部匹配
+    if words or group.get("patterns"):
+        return False
+    return len(required) > 0
+
+
+class _KeywordIndex:
+    """
+    关键词组多模式匹配索引
+
+    对每段文本做一次多模式扫描得到命中的普通词和必须词，再用为当前配置生成的
+    专用函数按组判定（见 _build_group_matcher）。判定结果与 _matches_word_group 一致。
+
+    安装 pyahocorasick 时使用 Aho-Corasick 自动机，否则使用一个零宽前瞻的
+    正则分支表达式：每个位置取最长命中词，再补上以同一位置开始的较短关键词
+    （即该词在关键词表中的前缀），保证与逐词子串判断等价。
+    """
+
+    def __init__(self, word_groups: List[Dict]):
+        self.word_groups = word_groups
+        keywords: Set[str] = set()
+        for group in word_groups:
+            if "_words_lc" not in group:
+                _prepare_word_group(group)
+            keywords.update(group["_words_lc"])
+            keywords.update(group["_required_lc"])
+
+        # 空关键词是任何文本的子串，单独处理
+        self._has_empty = "" in keywords
+        keywords.discard("")
+
+        self._matcher = _build_group_matcher(word_groups)
+        self._automaton = None
+        self._regex = None
+        self._prefixes: Dict[str, List[str]] = {}
+        if not keywords:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for word in keywords:
+                automaton.add_word(word, word)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # 长词优先，前瞻分支在每个位置命中最长的关键词
+            ordered = sorted(keywords, key=len, reverse=True)
+            self._regex = re.compile(
+                "(?=(" + "|".join(re.escape(word) for word in ordered) + "))"
+            )
+            self._prefixes = {
+                word: [word[:i] for i in range(1, len(word) + 1) if word[:i] in keywords]
+                for word in keywords
+            }
+
+    def find_keywords(self, text_lower: str) -> Set[str]:
+        """返回文本中出现的全部关键词（已小写）"""
+        hits: Set[str] = set()
+        if self._automaton is not None:
+            hits.update(word for _, word in self._automaton.iter(text_lower))
+        elif self._regex is not None:
+            prefixes = self._prefixes
+            for longest in set(self._regex.findall(text_lower)):
+                hits.update(prefixes[longest])
+        if self._has_empty:
+            hits.add("")
+        return hits
+
+    def match(self, text: str, text_lower: Optional[str] = None) -> List[Dict]:
+        """返回文本匹配的关键词组（保持配置顺序）"""
+        if text_lower is None:
+            text_lower = text.lower()
+        return self._matcher(text, text_lower, self.find_keywords(text_lower))
+
+
+def _build_group_matcher(word_groups: List[Dict]) -> Callable[[str, str, Set[str]], List[Dict]]:
+    """
+    为关键词配置生成专用的组判定函数
+
+    每个组的必须词/普通词/排除词以字面量内联（repr 转义），正则和组对象
+    通过命名空间引用，省去逐组的字典查找和通用循环。判定逻辑：
+    必须词全部命中；有普通词或正则时至少一个匹配（只有必须词时必须词已全部命中）；
+    排除词任一出现则排除。
+
+    生成的函数签名为 (text, text_lower, hits) -> 匹配的组列表。
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _match(text, text_lower, hits):", "    matched = []"]
+
+    for gid, group in enumerate(word_groups):
+        required = group["_required_lc"]
+        words = group["_words_lc"]
+        if not (words or group.get("patterns")) and not required:
+            # 既无普通词/正则也无必须词的组永远不匹配
+            continue
+
+        conditions = [f"{word!r} in hits" for word in dict.fromkeys(required)]
+        if words or group.get("patterns"):
+            alternatives = [f"{word!r} in hits" for word in dict.fromkeys(words)]
+            for pid, compiled in enumerate(group["_compiled_patterns"]):
+                name = f"_P{gid}_{pid}"
+                namespace[name] = compiled
+                alternatives.append(f"{name}.search(text_lower)")
+            conditions.append("(" + (" or ".join(alternatives) or "False") + ")")
+        for word in dict.fromkeys(group["_excluded_lc"]):
+            conditions.append(f"{word!r} not in text_lower")
+
+        namespace[f"_G{gid}"] = group
+        lines.append(f"    if {' and '.join(conditions)}:")
+        lines.append(f"        matched.append(_G{gid})")
+
+    lines.append("    return matched")
+    exec(compile("\n".join(lines), "<crawler-filter>", "exec"), namespace)
+    return namespace["_match"]
+
+
+def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """
+    编译正则表达式列表（去除 / 包裹，跳过无效表达式）
+
+    编译结果用于匹配已小写化的文本：不含大写字符的表达式在小写文本上
+    直接区分大小写匹配即等价于忽略大小写，省去正则引擎的大小写折叠；
+    含大写字符（如 [A-Z]、\\D）的表达式仍使用 re.IGNORECASE。
+    """
+    compiled = []
     for pattern in patterns:
-        # 去除 / 包裹
         if pattern.startswith("/") and pattern.endswith("/"):
             pattern = pattern[1:-1]
+        flags = 0 if pattern == pattern.lower() else re.IGNORECASE
         try:
-            if re.search(pattern, text, re.IGNORECASE):
-                pattern_matched = True
-                break
+            compiled.append(re.compile(pattern, flags))
         except re.error:
             continue
+    return compiled
 
-    # 5. 判断结果
-    # 如果有必须词，必须全部匹配
-    # 如果有普通词或正则，至少一个匹配
-    if required and not all(r.lstrip("+").lower() in text_lower for r in required):
-        return False
 
-    if words or patterns:
-        return word_matched or pattern_matched
+def _prepare_word_group(group: Dict) -> Dict:
+    """
+    预处理关键词组：小写化（并驻留）关键词、预编译正则
 
-    # 只有必须词的情况
-    return len(required) > 0
+    结果以下划线键缓存在组内，加载时调用一次；手工构造的组在首次匹配时补齐。
+    """
+    intern = sys.intern
+    group["_words_lc"] = [intern(w.lower()) for w in group.get("words", [])]
+    group["_required_lc"] = [intern(r.lstrip("+").lower()) for r in group.get("required", [])]
+    group["_excluded_lc"] = [intern(e.lstrip("!").lower()) for e in group.get("excluded", [])]
+    if isinstance(group.get("display_name"), str):
+        group["display_name"] = intern(group["display_name"])
+    group["_compiled_patterns"] = _compile_patterns(group.get("patterns", []))
+    return group
 
 
 def _get_group_name(group: Dict) -> str:
@@ -189,20 +414,37 @@ def _get_group_name(group: Dict) -> str:
 
 def load_frequency_words_for_crawler(
     filepath: str = "config/frequency_words.txt"
-) -> Tuple[List[Dict], List[str], List[str]]:
+) -> Tuple[Tuple[Dict, ...], Tuple[str, ...], Tuple[str, ...]]:
     """
     从 frequency_words.txt 加载关键词配置
 
-    复用 TrendRadar 的配置格式
+    复用 TrendRadar 的配置格式。解析结果按 (路径, 纳秒修改时间, 文件大小) 缓存，
+    文件未变化时只需一次 stat 即返回缓存；返回元组以防调用方修改缓存内容，
+    同一元组也让过滤时的关键词自动机得以复用。
 
     Returns:
         (word_groups, filter_words, global_filters)
     """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return (), (), ()
+    # 整数纳秒时间戳避免浮点精度损失，大小可识别同一时间粒度内的改写
+    return _load_frequency_words_cached(filepath, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_frequency_words_cached(
+    filepath: str,
+    mtime_ns: int,
+    size: int
+) -> Tuple[Tuple[Dict, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """解析关键词配置文件（mtime_ns/size 仅作为缓存键）"""
     try:
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
     except FileNotFoundError:
-        return [], [], []
+        return (), (), ()
 
     word_groups = []
     filter_words = []
@@ -275,7 +517,11 @@ def load_frequency_words_for_crawler(
         else:
             current_group["words"].append(line)
 
-    return word_groups, filter_words, global_filters
+    # 预处理每组的关键词和正则表达式
+    for group in word_groups:
+        _prepare_word_group(group)
+
+    return tuple(word_groups), tuple(filter_words), tuple(global_filters)
 
 
 def format_filter_result(
@@ -283,25 +529,29 @@ def format_filter_result(
     filtered_items: List[CrawlerNewsItem]
 ) -> str:
     """格式化过滤结果为文本"""
-    lines = []
-    lines.append(f"=== 过滤结果 ===")
-    lines.append(f"通过: {len(passed_items)} 条")
-    lines.append(f"过滤: {len(filtered_items)} 条")
-    lines.append("")
+    lines = [
+        "=== 过滤结果 ===",
+        f"通过: {len(passed_items)} 条",
+        f"过滤: {len(filtered_items)} 条",
+        "",
+    ]
 
     if passed_items:
         lines.append("--- 通过的条目 ---")
-        for item in passed_items[:10]:
-            keywords = ", ".join(item.matched_keywords) if item.matched_keywords else "无"
-            lines.append(f"  [{item.seq}] {item.title[:50]}... | 关键词: {keywords}")
+        lines.extend(
+            f"  [{item.seq}] {item.title[:50]}... | 关键词: {', '.join(item.matched_keywords) or '无'}"
+            for item in passed_items[:10]
+        )
         if len(passed_items) > 10:
             lines.append(f"  ... 还有 {len(passed_items) - 10} 条")
         lines.append("")
 
     if filtered_items:
         lines.append("--- 被过滤的条目 ---")
-        for item in filtered_items[:10]:
-            lines.append(f"  [{item.seq}] {item.title[:50]}... | 原因: {item.filter_reason}")
+        lines.extend(
+            f"  [{item.seq}] {item.title[:50]}... | 原因: {item.filter_reason}"
+            for item in filtered_items[:10]
+        )
         if len(filtered_items) > 10:
             lines.append(f"  ... 还有 {len(filtered_items) - 10} 条")
 
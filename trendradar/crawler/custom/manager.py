@@ -9,12 +9,27 @@ import asyncio
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Set
+from itertools import groupby
+from typing import Any, Deque, Dict, Iterable, List, Optional, Callable, Set, Tuple
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 import json
+import queue
 import sqlite3
+import sys
 from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+from trendradar.utils.time import fast_isoformat
 
 from .base import (
     BaseCrawler,
@@ -22,10 +37,126 @@ from .base import (
     CrawlResult,
     FetchStatus,
     ErrorLogEntry,
+    create_http_adapter,
+)
+
+
+# 连接级 PRAGMA（建立连接时执行一次）
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    # 读取走内存映射（最多 256 MB），get_items 等查询省去页面复制
+    "PRAGMA mmap_size=268435456",
 )
 
+# 预热已见条目时每批读取的行数
+_SEEN_FETCH_SIZE = 5000
+
+def _dumps(data: Any) -> str:
+    """序列化为 JSON 字符串（优先使用 orjson，列类型保持 TEXT）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+# get_items 可选字段：CrawlerNewsItem 字段 -> (数据库列, 读出转换)
+_ITEM_COLUMNS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "seq": ("seq", str),
+    "title": ("title", str),
+    "summary": ("summary", lambda v: v or ""),
+    "full_content": ("full_content", lambda v: v or ""),
+    "url": ("url", lambda v: v or ""),
+    "published_at": ("published_at", lambda v: v or ""),
+    "extra": ("extra_data", lambda v: _loads(v) if v else {}),
+    "content_fetched": ("content_fetched", bool),
+    "content_fetch_error": ("content_fetch_error", lambda v: v or ""),
+    "content_fetch_time": ("content_fetch_time", lambda v: v or ""),
+}
+
+_ERROR_COLUMNS = (
+    "timestamp, source_id, operation, url, error_type, "
+    "error_message, stack_trace, resolved, resolve_note"
+)
+
+
+# 后台写线程：队列容量、每批最多合并的写操作数、攒批等待时间（秒）
+_WRITE_QUEUE_SIZE = 10000
+_WRITE_BATCH_SIZE = 500
+_WRITE_BATCH_WAIT = 0.1
+
+# 写入语句统一定义为模块常量：SQL 文本固定，命中连接的预编译语句缓存
+_UPDATE_CONTENT_SQL = """
+    UPDATE crawler_raw SET
+        full_content = ?,
+        content_fetched = ?,
+        content_fetch_error = ?,
+        content_fetch_time = ?
+    WHERE source_id = ? AND seq = ?
+"""
+
+_INSERT_ERROR_PREFIX = """
+    INSERT INTO crawler_errors (
+        timestamp, source_id, operation, url,
+        error_type, error_message, stack_trace
+    ) VALUES """
+_INSERT_ERROR_ROW = "(?, ?, ?, ?, ?, ?, ?)"
+_INSERT_ERROR_SQL = _INSERT_ERROR_PREFIX + _INSERT_ERROR_ROW
+
+# 错误日志多行 INSERT 每条语句的行数（7 列 × 100 行，低于 SQLite 参数上限 999）
+_ERROR_INSERT_ROWS = 100
+_INSERT_ERRORS_SQL = _INSERT_ERROR_PREFIX + ", ".join([_INSERT_ERROR_ROW] * _ERROR_INSERT_ROWS)
+
+# 条目 UPSERT：已存在时只用非空的新值覆盖内容/过滤字段
+_UPSERT_ITEM_SQL = """
+    INSERT INTO crawler_raw (
+        source_id, source_name, seq, title, summary, full_content,
+        url, published_at, extra_data, crawl_time, first_seen,
+        last_seen, content_fetched, content_fetch_error, content_fetch_time,
+        filtered_out, matched_keywords, filter_tag, filter_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id, seq) DO UPDATE SET
+        title = excluded.title,
+        summary = excluded.summary,
+        full_content = CASE
+            WHEN excluded.full_content != '' THEN excluded.full_content
+            ELSE crawler_raw.full_content
+        END,
+        last_seen = excluded.last_seen,
+        content_fetched = CASE
+            WHEN excluded.content_fetched = 1 THEN 1
+            ELSE crawler_raw.content_fetched
+        END,
+        content_fetch_error = CASE
+            WHEN excluded.content_fetch_error != '' THEN excluded.content_fetch_error
+            ELSE crawler_raw.content_fetch_error
+        END,
+        content_fetch_time = CASE
+            WHEN excluded.content_fetch_time != '' THEN excluded.content_fetch_time
+            ELSE crawler_raw.content_fetch_time
+        END,
+        filtered_out = excluded.filtered_out,
+        matched_keywords = CASE
+            WHEN excluded.matched_keywords != '[]' THEN excluded.matched_keywords
+            ELSE crawler_raw.matched_keywords
+        END,
+        filter_tag = CASE
+            WHEN excluded.filter_tag != '' THEN excluded.filter_tag
+            ELSE crawler_raw.filter_tag
+        END,
+        filter_time = CASE
+            WHEN excluded.filter_time != '' THEN excluded.filter_time
+            ELSE crawler_raw.filter_time
+        END
+"""
+
 
-@dataclass
+@dataclass(slots=True)
 class CrawlerStats:
     """爬虫统计信息"""
     source_id: str
@@ -60,19 +191,36 @@ class CrawlerManager:
         self.config = config or {}
         self.crawlers: Dict[str, BaseCrawler] = {}
         self.stats: Dict[str, CrawlerStats] = {}
-        self.error_log: List[ErrorLogEntry] = []
-        self.seen_items: Dict[str, Set[str]] = {}  # {source_id: {seq1, seq2, ...}}
+        # {source_id: 最近见过的 seq（LRU，有序字典作有序集合）}
+        self.seen_items: Dict[str, "OrderedDict[str, None]"] = {}
 
         # 配置项
         self.poll_interval = self.config.get("poll_interval", 10)
+        self.crawl_workers = self.config.get("crawl_workers", 16)
         self.max_error_log = self.config.get("max_error_log", 1000)
+        self.seen_cache_size = self.config.get("seen_cache_size", 10000)
+        # 内存错误日志有界，超出时自动丢弃最旧的条目
+        self.error_log: Deque[ErrorLogEntry] = deque(maxlen=self.max_error_log)
         self.content_fetch_enabled = self.config.get("full_content", {}).get("enabled", True)
         self.content_fetch_async = self.config.get("full_content", {}).get("async_mode", True)
         self.content_fetch_delay = self.config.get("full_content", {}).get("fetch_delay", 0.3)
         self.content_fetch_timeout = self.config.get("full_content", {}).get("timeout", 10)
+        self.content_fetch_workers = self.config.get("full_content", {}).get("max_hosts", 8)
 
-        # 数据库
+        # 数据库（长连接跨线程共享，由 _db_lock 串行化访问）
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.RLock()
+        # 内容更新与错误日志等零散写入由单个后台线程攒批提交（首次写入时启动）
+        self._write_q: "queue.Queue[Optional[Tuple[str, tuple]]]" = queue.Queue(
+            maxsize=_WRITE_QUEUE_SIZE
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # cleanup() 开始后置位：进行中的内容获取处理完当前条目即退出
+        self._closed = False
+        # 写线程收到结束标记前置位（持 _writer_lock）：之后的写操作直接丢弃，不再重启写线程
+        self._writes_closed = False
         self._init_db()
 
         # 回调
@@ -80,14 +228,42 @@ class CrawlerManager:
         self._on_content_fetched_callbacks: List[Callable] = []
         self._on_error_callbacks: List[Callable] = []
 
+        # 列表请求线程池（多个数据源时按需创建）
+        self._fetch_pool: Optional[ThreadPoolExecutor] = None
+        # 完整内容线程池（首次获取内容时创建，跨调用复用）
+        self._content_pool: Optional[ThreadPoolExecutor] = None
+        # 各爬虫会话共享的连接池（首次注册时创建）：同一主机的连接和 TLS 会话跨爬虫复用
+        self._http_adapter = None
+
     def _init_db(self) -> None:
         """初始化数据库"""
         if not self.db_path:
             return
 
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._transaction() as conn:
+            self._create_tables(conn.cursor())
+        self._analyze()
+
+    def _analyze(self) -> None:
+        """刷新查询规划器统计信息，使其选用复合索引
+
+        首次启动时执行一次有采样上限的 ANALYZE，之后交给 PRAGMA optimize
+        按需更新，避免大库每次启动都全量统计。
+        """
+        with self._db_lock:
+            conn = self._get_connection()
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if has_stats:
+                conn.execute("PRAGMA optimize")
+            else:
+                conn.execute("PRAGMA analysis_limit = 1000")
+                conn.execute("ANALYZE")
+
+    def _create_tables(self, cursor: sqlite3.Cursor) -> None:
+        """建表、迁移旧表字段并创建索引"""
 
         # 新闻数据表（包含过滤状态）
         cursor.execute("""
@@ -174,16 +350,168 @@ class CrawlerManager:
         """)
 
         # 索引
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_raw_source ON crawler_raw(source_id)")
+        # (source_id, seq) 由 UNIQUE 约束的自动索引覆盖；按数据源取最新条目走
+        # (source_id, first_seen)，其前缀已覆盖原单列 source_id 索引
+        cursor.execute("DROP INDEX IF EXISTS idx_crawler_raw_source")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_crawler_raw_src_first_seen "
+            "ON crawler_raw(source_id, first_seen DESC)"
+        )
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_raw_time ON crawler_raw(crawl_time)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_raw_first_seen ON crawler_raw(first_seen)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_raw_filtered ON crawler_raw(filtered_out)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_raw_pushed ON crawler_raw(pushed)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_errors_time ON crawler_errors(timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawler_errors_resolved ON crawler_errors(resolved)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_crawler_errors_src_time "
+            "ON crawler_errors(source_id, timestamp DESC)"
+        )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """获取数据库长连接（首次调用时创建，调用方需持有 _db_lock）
+
+        连接使用自动提交模式，写操作通过 _transaction() 显式开启事务。
+        数据库切换为 WAL 模式：外部读取方（如推送脚本）读取快照时不阻塞
+        爬取写入，写入也不必等待读取结束；synchronous=NORMAL 下每次提交
+        只追加 WAL 而不强制刷盘，检查点时再同步。
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        """在单个写事务中执行（持有数据库锁，异常时回滚）"""
+        with self._db_lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _enqueue_write(self, sql: str, params: tuple) -> None:
+        """提交一条写操作到后台写线程（队列满时阻塞，形成背压）
+
+        入队与 cleanup() 的关闭标记在同一把锁内判断，保证结束标记之后
+        不会再有写操作入队；cleanup() 之后的写操作直接丢弃。
+        """
+        if threading.current_thread() is self._writer:
+            # 写线程内部（记录写入失败）不取 _writer_lock：其他线程可能正持锁
+            # 阻塞在满队列上等待本线程消费；也不能阻塞在自己消费的队列上，队列满时丢弃
+            if not self._writes_closed:
+                try:
+                    self._write_q.put_nowait((sql, params))
+                except queue.Full:
+                    pass
+            return
+
+        with self._writer_lock:
+            if self._writes_closed:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, daemon=True, name="crawler-db-writer"
+                )
+                self._writer.start()
+            self._write_q.put((sql, params))
 
-        conn.commit()
-        conn.close()
+    def _writer_loop(self) -> None:
+        """后台写循环
+
+        取到第一条写操作后，在 _WRITE_BATCH_WAIT 内继续收集至多
+        _WRITE_BATCH_SIZE 条，相邻的同类语句合并为 executemany，
+        整批在一个事务内提交。收到 None 时退出。
+        """
+        write_q = self._write_q
+        while True:
+            op = write_q.get()
+            if op is None:
+                write_q.task_done()
+                return
+
+            batch = [op]
+            stop = False
+            deadline = time.monotonic() + _WRITE_BATCH_WAIT
+            while len(batch) < _WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    op = write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if op is None:
+                    stop = True
+                    break
+                batch.append(op)
+
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in range(len(batch) + stop):
+                    write_q.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch: List[Tuple[str, tuple]]) -> None:
+        """在一个事务内执行一批写操作（保持提交顺序）
+
+        整批失败回滚后逐条重试，只丢失出错的那条写操作。
+        """
+        try:
+            with self._transaction() as conn:
+                for sql, ops in groupby(batch, key=lambda op: op[0]):
+                    rows = [params for _, params in ops]
+                    if sql is _INSERT_ERROR_SQL:
+                        self._insert_errors(conn, rows)
+                    else:
+                        conn.executemany(sql, rows)
+        except Exception as e:
+            if len(batch) > 1:
+                for op in batch:
+                    self._write_batch([op])
+                return
+            # 错误日志自身写入失败时不再记录，避免循环
+            if any(sql is not _INSERT_ERROR_SQL for sql, _ in batch):
+                self.log_error("", "db_write", "", str(e))
+
+    @staticmethod
+    def _insert_errors(conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        """错误日志按 _ERROR_INSERT_ROWS 行一条多行 INSERT 写入，余下的行逐条写入"""
+        full = len(rows) - len(rows) % _ERROR_INSERT_ROWS
+        for start in range(0, full, _ERROR_INSERT_ROWS):
+            conn.execute(
+                _INSERT_ERRORS_SQL,
+                [value for row in rows[start:start + _ERROR_INSERT_ROWS] for value in row]
+            )
+        if full < len(rows):
+            conn.executemany(_INSERT_ERROR_SQL, rows[full:])
+
+    def flush(self) -> None:
+        """等待后台写线程提交完所有已排队的写操作"""
+        if self._writer is not None:
+            self._write_q.join()
+
+    def _query(self, sql: str, params=(), row_factory=None) -> List[tuple]:
+        """执行只读查询并返回全部行
+
+        Args:
+            row_factory: 仅作用于本次查询的行工厂（如 sqlite3.Row）
+        """
+        with self._db_lock:
+            cursor = self._get_connection().cursor()
+            if row_factory is not None:
+                cursor.row_factory = row_factory
+            return cursor.execute(sql, params).fetchall()
 
     def register(self, crawler: BaseCrawler) -> None:
         """注册爬虫
@@ -191,10 +519,15 @@ class CrawlerManager:
         Args:
             crawler: 爬虫实例
         """
-        source_id = crawler.get_source_id()
+        # 驻留 source_id：各字典共用同一字符串对象，查找可走身份比较快路径
+        source_id = sys.intern(crawler.get_source_id())
         self.crawlers[source_id] = crawler
         self.stats[source_id] = CrawlerStats(source_id=source_id)
-        self.seen_items[source_id] = set()
+        self.seen_items[source_id] = OrderedDict()
+
+        if self._http_adapter is None:
+            self._http_adapter = create_http_adapter(self.config.get("pool_maxsize", 32))
+        crawler.use_http_adapter(self._http_adapter)
 
         # 从数据库加载已见过的 seq
         if self.db_path:
@@ -213,81 +546,180 @@ class CrawlerManager:
         self.seen_items.pop(source_id, None)
 
     def _load_seen_items(self, source_id: str) -> None:
-        """从数据库加载已见过的条目"""
+        """从数据库预热最近见过的条目（最多 seen_cache_size 条）"""
         if not self.db_path:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT seq FROM crawler_raw WHERE source_id = ?",
-                (source_id,)
-            )
-            for row in cursor.fetchall():
-                self.seen_items[source_id].add(row[0])
-            conn.close()
+            seen = self.seen_items[source_id]
+            with self._db_lock:
+                # 取最新的 seen_cache_size 条，按由旧到新分批读取，最新的条目位于 LRU 末尾
+                cursor = self._get_connection().execute(
+                    "SELECT seq FROM ("
+                    "  SELECT seq, first_seen FROM crawler_raw WHERE source_id = ?"
+                    "  ORDER BY first_seen DESC LIMIT ?"
+                    ") ORDER BY first_seen ASC",
+                    (source_id, self.seen_cache_size)
+                )
+                while True:
+                    rows = cursor.fetchmany(_SEEN_FETCH_SIZE)
+                    if not rows:
+                        break
+                    for row in rows:
+                        seen[row[0]] = None
         except Exception as e:
             self.log_error(source_id, "load_seen", "", str(e))
 
+    def _find_stored_seqs(self, source_id: str, seqs: List[str]) -> Set[str]:
+        """查询数据库中已存在的 seq（用于 LRU 未命中的条目）"""
+        if not self.db_path or not seqs:
+            return set()
+
+        stored: Set[str] = set()
+        try:
+            # 分块查询，避免超过 SQLite 参数数量上限
+            for start in range(0, len(seqs), 500):
+                chunk = seqs[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._query(
+                    f"SELECT seq FROM crawler_raw WHERE source_id = ? AND seq IN ({placeholders})",
+                    (source_id, *chunk)
+                )
+                stored.update(row[0] for row in rows)
+        except Exception as e:
+            self.log_error(source_id, "load_seen", "", str(e))
+        return stored
+
     def crawl_all(self) -> Dict[str, CrawlResult]:
         """执行所有已注册爬虫
 
+        各数据源的列表请求在线程池中并发执行（网络 IO 为主），
+        结果按注册顺序在当前线程中处理统计和增量检测；所有数据源的条目
+        在一个事务内批量写入数据库后，再触发新增条目回调。
+
         Returns:
             {source_id: CrawlResult} 字典
         """
-        results = {}
-        for source_id, crawler in self.crawlers.items():
-            try:
-                result = crawler.fetch_news_list()
-                results[source_id] = result
-
-                # 更新统计
-                stats = self.stats[source_id]
-                stats.total_fetches += 1
-                stats.last_fetch_time = datetime.now().isoformat()
-
-                if result.status == FetchStatus.SUCCESS:
-                    stats.successful_fetches += 1
-                    stats.last_success_time = datetime.now().isoformat()
-                    stats.total_items += len(result.items)
-
-                    # 检测新增
-                    new_items = self._detect_new_items(source_id, result.items)
-                    result.new_count = len(new_items)
-                    stats.new_items += len(new_items)
-
-                    # 保存到数据库
-                    if self.db_path:
-                        self._save_items(source_id, crawler.get_source_name(), result.items)
-
-                    # 触发回调
-                    if new_items and self._on_new_items_callbacks:
-                        for callback in self._on_new_items_callbacks:
-                            try:
-                                callback(source_id, new_items)
-                            except Exception:
-                                pass
-                else:
-                    stats.failed_fetches += 1
-                    stats.last_error = result.error_message
-                    self.log_error(source_id, "fetch_list", "", result.error_message)
-
-            except Exception as e:
-                error_msg = str(e)
-                self.log_error(source_id, "crawl", "", error_msg)
-                results[source_id] = CrawlResult(
-                    source_id=source_id,
-                    source_name=crawler.get_source_name(),
-                    items=[],
-                    status=FetchStatus.UNKNOWN_ERROR,
-                    error_message=error_msg,
-                )
-                self.stats[source_id].failed_fetches += 1
-                self.stats[source_id].last_error = error_msg
+        crawlers = list(self.crawlers.items())
+        if len(crawlers) > 1:
+            pool = self._get_fetch_pool()
+            futures = [
+                (source_id, crawler, pool.submit(crawler.fetch_news_list))
+                for source_id, crawler in crawlers
+            ]
+            fetches = [
+                (source_id, crawler, future.result) for source_id, crawler, future in futures
+            ]
+        else:
+            fetches = [
+                (source_id, crawler, crawler.fetch_news_list) for source_id, crawler in crawlers
+            ]
 
+        results = {}
+        pending_saves = []
+        pending_callbacks = []
+        for source_id, crawler, get_result in fetches:
+            result, new_items = self._crawl_one(source_id, crawler, get_result)
+            results[source_id] = result
+            if result.status == FetchStatus.SUCCESS and self.db_path:
+                pending_saves.append((source_id, crawler.get_source_name(), result.items))
+            if new_items:
+                pending_callbacks.append((source_id, new_items))
+
+        self._commit_crawl(pending_saves, pending_callbacks)
         return results
 
+    def _crawl_one(
+        self,
+        source_id: str,
+        crawler: BaseCrawler,
+        get_result: Callable[[], CrawlResult]
+    ) -> Tuple[CrawlResult, List[CrawlerNewsItem]]:
+        """获取单个数据源的结果，更新统计并检测新增条目
+
+        不写数据库、不触发回调，由调用方统一经 _commit_crawl 处理。
+
+        Args:
+            source_id: 数据源 ID
+            crawler: 爬虫实例
+            get_result: 返回 CrawlResult 的调用（直接请求或线程池 future）
+
+        Returns:
+            (CrawlResult, 新增条目列表)
+        """
+        stats = self.stats[source_id]
+        try:
+            result = get_result()
+
+            # 更新统计（同一次结果的各时间字段共用一个时间戳）
+            now = fast_isoformat()
+            stats.total_fetches += 1
+            stats.last_fetch_time = now
+
+            if result.status != FetchStatus.SUCCESS:
+                stats.failed_fetches += 1
+                stats.last_error = result.error_message
+                self.log_error(source_id, "fetch_list", "", result.error_message)
+                return result, []
+
+            stats.successful_fetches += 1
+            stats.last_success_time = now
+            stats.total_items += len(result.items)
+
+            # 检测新增
+            new_items = self._detect_new_items(source_id, result.items)
+            result.new_count = len(new_items)
+            stats.new_items += len(new_items)
+            return result, new_items
+
+        except Exception as e:
+            error_msg = str(e)
+            self.log_error(source_id, "crawl", "", error_msg)
+            stats.failed_fetches += 1
+            stats.last_error = error_msg
+            return CrawlResult(
+                source_id=source_id,
+                source_name=crawler.get_source_name(),
+                items=[],
+                status=FetchStatus.UNKNOWN_ERROR,
+                error_message=error_msg,
+            ), []
+
+    def _commit_crawl(
+        self,
+        pending_saves: List[Tuple[str, str, List[CrawlerNewsItem]]],
+        pending_callbacks: List[Tuple[str, List[CrawlerNewsItem]]]
+    ) -> None:
+        """批量保存条目，保存完成后再触发新增条目回调"""
+        if pending_saves:
+            self._save_batches(pending_saves)
+
+        callbacks = self._on_new_items_callbacks
+        if not callbacks:
+            return
+        for source_id, new_items in pending_callbacks:
+            for callback in callbacks:
+                try:
+                    callback(source_id, new_items)
+                except Exception:
+                    pass
+
+    def _get_content_pool(self) -> ThreadPoolExecutor:
+        """获取完整内容线程池（首次调用时创建，大小为 full_content.max_hosts）"""
+        if self._content_pool is None:
+            self._content_pool = ThreadPoolExecutor(
+                max_workers=max(1, self.content_fetch_workers), thread_name_prefix="content"
+            )
+        return self._content_pool
+
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        """获取列表请求线程池（首次调用时创建）"""
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(
+                max_workers=self.crawl_workers, thread_name_prefix="crawl"
+            )
+        return self._fetch_pool
+
     def crawl_single(self, source_id: str) -> Optional[CrawlResult]:
         """执行单个爬虫
 
@@ -297,9 +729,16 @@ class CrawlerManager:
         Returns:
             CrawlResult 或 None
         """
-        if source_id not in self.crawlers:
+        crawler = self.crawlers.get(source_id)
+        if crawler is None:
             return None
-        return self.crawl_all().get(source_id)
+
+        result, new_items = self._crawl_one(source_id, crawler, crawler.fetch_news_list)
+        saves = []
+        if result.status == FetchStatus.SUCCESS and self.db_path:
+            saves.append((source_id, crawler.get_source_name(), result.items))
+        self._commit_crawl(saves, [(source_id, new_items)] if new_items else [])
+        return result
 
     def _detect_new_items(
         self,
@@ -308,6 +747,9 @@ class CrawlerManager:
     ) -> List[CrawlerNewsItem]:
         """检测新增条目
 
+        内存中只保留每个数据源最近 seen_cache_size 个 seq（LRU），
+        未命中的条目再查询数据库确认，避免历史条目全部常驻内存。
+
         Args:
             source_id: 数据源 ID
             items: 条目列表
@@ -315,15 +757,32 @@ class CrawlerManager:
         Returns:
             新增条目列表
         """
-        seen = self.seen_items.get(source_id, set())
+        seen = self.seen_items.setdefault(source_id, OrderedDict())
+
+        # 1. 批次内去重（保持首次出现顺序），与 LRU 求交集得到命中项
+        batch = dict.fromkeys(item.seq for item in items)
+        hits = batch.keys() & seen.keys()
+        for seq in hits:
+            seen.move_to_end(seq)
+
+        # 2. LRU 未命中的条目批量查询数据库，确认是否早已入库
+        unknown = [seq for seq in batch if seq not in hits]
+        stored = self._find_stored_seqs(source_id, unknown)
+        seen.update(dict.fromkeys(unknown))
+
+        new_seqs = set(unknown)
+        new_seqs -= stored
         new_items = []
+        if new_seqs:
+            for item in items:
+                if item.seq in new_seqs:
+                    new_seqs.discard(item.seq)  # 同一批次内重复只取第一条
+                    new_items.append(item)
 
-        for item in items:
-            if item.seq not in seen:
-                new_items.append(item)
-                seen.add(item.seq)
+        # 3. 淘汰最久未见的条目，限制内存占用
+        while len(seen) > self.seen_cache_size:
+            seen.popitem(last=False)
 
-        self.seen_items[source_id] = seen
         return new_items
 
     def _save_items(
@@ -333,96 +792,65 @@ class CrawlerManager:
         items: List[CrawlerNewsItem]
     ) -> None:
         """保存条目到数据库"""
+        self._save_batches([(source_id, source_name, items)])
+
+    def _save_batches(
+        self,
+        batches: List[Tuple[str, str, List[CrawlerNewsItem]]]
+    ) -> None:
+        """在一个事务内保存多个数据源的条目
+
+        Args:
+            batches: [(source_id, source_name, items), ...]
+        """
         if not self.db_path:
             return
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            now = datetime.now().isoformat()
-
-            for item in items:
-                # 准备过滤相关字段
-                matched_keywords_json = json.dumps(
-                    item.matched_keywords if item.matched_keywords else [],
-                    ensure_ascii=False
-                )
-                # filter_tag: 通过时显示匹配的关键词，过滤时显示原因
-                if item.matched_keywords:
-                    filter_tag = "✓ " + ", ".join(item.matched_keywords)
-                elif item.filter_reason:
-                    filter_tag = "🚫 " + item.filter_reason
-                else:
-                    filter_tag = ""
-                filter_time = now if (item.filtered_out or item.matched_keywords) else ""
-
-                # 使用 UPSERT
-                cursor.execute("""
-                    INSERT INTO crawler_raw (
-                        source_id, source_name, seq, title, summary, full_content,
-                        url, published_at, extra_data, crawl_time, first_seen,
-                        last_seen, content_fetched, content_fetch_error, content_fetch_time,
-                        filtered_out, matched_keywords, filter_tag, filter_time
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(source_id, seq) DO UPDATE SET
-                        title = excluded.title,
-                        summary = excluded.summary,
-                        full_content = CASE
-                            WHEN excluded.full_content != '' THEN excluded.full_content
-                            ELSE crawler_raw.full_content
-                        END,
-                        last_seen = excluded.last_seen,
-                        content_fetched = CASE
-                            WHEN excluded.content_fetched = 1 THEN 1
-                            ELSE crawler_raw.content_fetched
-                        END,
-                        content_fetch_error = CASE
-                            WHEN excluded.content_fetch_error != '' THEN excluded.content_fetch_error
-                            ELSE crawler_raw.content_fetch_error
-                        END,
-                        content_fetch_time = CASE
-                            WHEN excluded.content_fetch_time != '' THEN excluded.content_fetch_time
-                            ELSE crawler_raw.content_fetch_time
-                        END,
-                        filtered_out = excluded.filtered_out,
-                        matched_keywords = CASE
-                            WHEN excluded.matched_keywords != '[]' THEN excluded.matched_keywords
-                            ELSE crawler_raw.matched_keywords
-                        END,
-                        filter_tag = CASE
-                            WHEN excluded.filter_tag != '' THEN excluded.filter_tag
-                            ELSE crawler_raw.filter_tag
-                        END,
-                        filter_time = CASE
-                            WHEN excluded.filter_time != '' THEN excluded.filter_time
-                            ELSE crawler_raw.filter_time
-                        END
-                """, (
-                    source_id,
-                    source_name,
-                    item.seq,
-                    item.title,
-                    item.summary,
-                    item.full_content,
-                    item.url,
-                    item.published_at,
-                    json.dumps(item.extra, ensure_ascii=False) if item.extra else "",
-                    now,
-                    now,
-                    now,
-                    1 if item.content_fetched else 0,
-                    item.content_fetch_error,
-                    item.content_fetch_time,
-                    1 if item.filtered_out else 0,
-                    matched_keywords_json,
-                    filter_tag,
-                    filter_time,
-                ))
-
-            conn.commit()
-            conn.close()
+            now = fast_isoformat()
+            rows = []
+
+            for source_id, source_name, items in batches:
+                for item in items:
+                    # 准备过滤相关字段
+                    matched_keywords_json = _dumps(item.matched_keywords or [])
+                    # filter_tag: 通过时显示匹配的关键词，过滤时显示原因
+                    if item.matched_keywords:
+                        filter_tag = "✓ " + ", ".join(item.matched_keywords)
+                    elif item.filter_reason:
+                        filter_tag = "🚫 " + item.filter_reason
+                    else:
+                        filter_tag = ""
+                    filter_time = now if (item.filtered_out or item.matched_keywords) else ""
+
+                    rows.append((
+                        source_id,
+                        source_name,
+                        item.seq,
+                        item.title,
+                        item.summary,
+                        item.full_content,
+                        item.url,
+                        item.published_at,
+                        _dumps(item.extra) if item.extra else "",
+                        now,
+                        now,
+                        now,
+                        1 if item.content_fetched else 0,
+                        item.content_fetch_error,
+                        item.content_fetch_time,
+                        1 if item.filtered_out else 0,
+                        matched_keywords_json,
+                        filter_tag,
+                        filter_time,
+                    ))
+
+            # 整批 UPSERT 在一个事务内完成
+            with self._transaction() as conn:
+                conn.executemany(_UPSERT_ITEM_SQL, rows)
         except Exception as e:
-            self.log_error(source_id, "save_items", "", str(e))
+            error_source = batches[0][0] if len(batches) == 1 else ""
+            self.log_error(error_source, "save_items", "", str(e))
 
     def fetch_full_content(
         self,
@@ -433,13 +861,16 @@ class CrawlerManager:
     ) -> None:
         """获取完整内容
 
+        不同主机的条目并发获取（最多 full_content.max_hosts 个主机同时进行），
+        同一主机的条目仍按 fetch_delay 间隔顺序请求。
+
         Args:
             source_id: 数据源 ID
             items: 条目列表
             async_mode: 是否异步模式
             callback: 回调函数
         """
-        if source_id not in self.crawlers:
+        if self._closed or source_id not in self.crawlers:
             return
 
         crawler = self.crawlers[source_id]
@@ -448,73 +879,87 @@ class CrawlerManager:
 
         async_mode = async_mode if async_mode is not None else self.content_fetch_async
 
-        def fetch_task():
-            for item in items:
-                if item.content_fetched:
-                    continue
-
+        def fetch_host(host_items: List[CrawlerNewsItem]):
+            """顺序获取同一主机的条目，条目之间保持请求间隔"""
+            # 循环内用到的属性和函数预先绑定为局部变量
+            fetch = crawler.fetch_full_content
+            update = self._update_item_content if self.db_path else None
+            content_cbs = self._on_content_fetched_callbacks
+            delay = self.content_fetch_delay
+            sleep = time.sleep
+            monotonic = time.monotonic
+            success = FetchStatus.SUCCESS
+            last = len(host_items) - 1
+
+            for index, item in enumerate(host_items):
+                if self._closed:
+                    # 管理器已清理：放弃剩余条目
+                    return
+                # 请求间隔从本次请求开始计时，请求本身的耗时计入间隔
+                next_start = monotonic() + delay
                 try:
-                    content, status = crawler.fetch_full_content(item)
+                    content, status = fetch(item)
                     item.full_content = content
-                    item.content_fetched = status == FetchStatus.SUCCESS
-                    item.content_fetch_time = datetime.now().isoformat()
-                    if status != FetchStatus.SUCCESS:
+                    item.content_fetched = status == success
+                    item.content_fetch_time = fast_isoformat()
+                    if status != success:
                         item.content_fetch_error = status.value
 
                     # 更新数据库
-                    if self.db_path:
-                        self._update_item_content(source_id, item)
+                    if update:
+                        update(source_id, item)
 
                     # 回调
                     if callback:
                         callback(item, content, status)
 
-                    for cb in self._on_content_fetched_callbacks:
+                    for cb in content_cbs:
                         try:
                             cb(source_id, item)
                         except Exception:
                             pass
 
-                    # 延迟
-                    time.sleep(self.content_fetch_delay)
-
                 except Exception as e:
                     item.content_fetch_error = str(e)
                     self.log_error(source_id, "fetch_content", item.url, str(e))
 
-        if async_mode:
-            thread = threading.Thread(target=fetch_task, daemon=True)
-            thread.start()
-        else:
-            fetch_task()
+                # 延迟（最后一条之后无需等待）
+                if index < last:
+                    wait = next_start - monotonic()
+                    if wait > 0:
+                        sleep(wait)
+
+        # 按主机分组：不同主机并发获取，同一主机内仍按 fetch_delay 间隔顺序请求
+        by_host: Dict[str, List[CrawlerNewsItem]] = {}
+        for item in items:
+            if not item.content_fetched:
+                by_host.setdefault(urlparse(item.url).netloc, []).append(item)
+
+        if not async_mode and (len(by_host) <= 1 or self.content_fetch_workers <= 1):
+            for host_items in by_host.values():
+                fetch_host(host_items)
+            return
+
+        # 每个主机一个任务提交到常驻线程池；异步模式提交后立即返回
+        pool = self._get_content_pool()
+        futures = [pool.submit(fetch_host, host_items) for host_items in by_host.values()]
+        if not async_mode:
+            for future in futures:
+                future.result()
 
     def _update_item_content(self, source_id: str, item: CrawlerNewsItem) -> None:
         """更新条目内容到数据库"""
         if not self.db_path:
             return
 
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE crawler_raw SET
-                    full_content = ?,
-                    content_fetched = ?,
-                    content_fetch_error = ?,
-                    content_fetch_time = ?
-                WHERE source_id = ? AND seq = ?
-            """, (
-                item.full_content,
-                1 if item.content_fetched else 0,
-                item.content_fetch_error,
-                item.content_fetch_time,
-                source_id,
-                item.seq,
-            ))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            self.log_error(source_id, "update_content", item.url, str(e))
+        self._enqueue_write(_UPDATE_CONTENT_SQL, (
+            item.full_content,
+            1 if item.content_fetched else 0,
+            item.content_fetch_error,
+            item.content_fetch_time,
+            source_id,
+            item.seq,
+        ))
 
     def log_error(
         self,
@@ -536,7 +981,7 @@ class CrawlerManager:
             stack_trace: 堆栈跟踪
         """
         entry = ErrorLogEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=fast_isoformat(),
             source_id=source_id,
             operation=operation,
             url=url,
@@ -545,34 +990,20 @@ class CrawlerManager:
             stack_trace=stack_trace,
         )
 
-        # 内存中保留
+        # 内存中保留（deque 有界，自动淘汰最旧条目）
         self.error_log.append(entry)
-        if len(self.error_log) > self.max_error_log:
-            self.error_log = self.error_log[-self.max_error_log:]
 
-        # 保存到数据库
+        # 保存到数据库（由后台写线程批量提交）
         if self.db_path:
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO crawler_errors (
-                        timestamp, source_id, operation, url,
-                        error_type, error_message, stack_trace
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    entry.timestamp,
-                    entry.source_id,
-                    entry.operation,
-                    entry.url,
-                    entry.error_type,
-                    entry.error_message,
-                    entry.stack_trace,
-                ))
-                conn.commit()
-                conn.close()
-            except Exception:
-                pass  # 避免循环记录错误
+            self._enqueue_write(_INSERT_ERROR_SQL, (
+                entry.timestamp,
+                entry.source_id,
+                entry.operation,
+                entry.url,
+                entry.error_type,
+                entry.error_message,
+                entry.stack_trace,
+            ))
 
         # 触发回调
         for callback in self._on_error_callbacks:
@@ -598,11 +1029,9 @@ class CrawlerManager:
             错误日志列表
         """
         if self.db_path:
+            self.flush()
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-
-                query = "SELECT * FROM crawler_errors WHERE 1=1"
+                query = f"SELECT {_ERROR_COLUMNS} FROM crawler_errors WHERE 1=1"
                 params = []
 
                 if source_id:
@@ -614,21 +1043,19 @@ class CrawlerManager:
                 query += " ORDER BY timestamp DESC LIMIT ?"
                 params.append(limit)
 
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                conn.close()
+                rows = self._query(query, params, row_factory=sqlite3.Row)
 
                 return [
                     ErrorLogEntry(
-                        timestamp=row[1],
-                        source_id=row[2],
-                        operation=row[3],
-                        url=row[4],
-                        error_type=row[5],
-                        error_message=row[6],
-                        stack_trace=row[7],
-                        resolved=bool(row[8]),
-                        resolve_note=row[9] or "",
+                        timestamp=row["timestamp"],
+                        source_id=row["source_id"],
+                        operation=row["operation"],
+                        url=row["url"],
+                        error_type=row["error_type"],
+                        error_message=row["error_message"],
+                        stack_trace=row["stack_trace"],
+                        resolved=bool(row["resolved"]),
+                        resolve_note=row["resolve_note"] or "",
                     )
                     for row in rows
                 ]
@@ -636,7 +1063,7 @@ class CrawlerManager:
                 pass
 
         # 回退到内存
-        result = self.error_log
+        result = list(self.error_log)
         if source_id:
             result = [e for e in result if e.source_id == source_id]
         if unresolved_only:
@@ -685,7 +1112,8 @@ class CrawlerManager:
         source_id: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-        filtered_only: bool = False
+        filtered_only: bool = False,
+        fields: Optional[Iterable[str]] = None
     ) -> List[CrawlerNewsItem]:
         """获取条目列表
 
@@ -694,6 +1122,8 @@ class CrawlerManager:
             limit: 返回数量限制
             offset: 偏移量
             filtered_only: 只返回过滤后的
+            fields: 需要读取的 CrawlerNewsItem 字段（seq、title 总会读取），
+                默认全部；列表视图可省略 full_content 以减少读取量
 
         Returns:
             条目列表
@@ -701,12 +1131,20 @@ class CrawlerManager:
         if not self.db_path:
             return []
 
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        if fields is None:
+            selected = list(_ITEM_COLUMNS)
+        else:
+            selected = list(dict.fromkeys(("seq", "title", *fields)))
+            unknown = [name for name in selected if name not in _ITEM_COLUMNS]
+            if unknown:
+                raise ValueError(f"未知字段: {', '.join(unknown)}")
+        columns = [(name, *_ITEM_COLUMNS[name]) for name in selected]
 
+        self.flush()
+        try:
             table = "crawler_filtered" if filtered_only else "crawler_raw"
-            query = f"SELECT * FROM {table} WHERE 1=1"
+            column_list = ", ".join(column for _, column, _ in columns)
+            query = f"SELECT {column_list} FROM {table} WHERE 1=1"
             params = []
 
             if source_id:
@@ -716,27 +1154,14 @@ class CrawlerManager:
             query += " ORDER BY first_seen DESC LIMIT ? OFFSET ?"
             params.extend([limit, offset])
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            conn.close()
-
-            items = []
-            for row in rows:
-                item = CrawlerNewsItem(
-                    seq=row[3],
-                    title=row[4],
-                    summary=row[5] or "",
-                    full_content=row[6] or "",
-                    url=row[7] or "",
-                    published_at=row[8] or "",
-                    extra=json.loads(row[9]) if row[9] else {},
-                    content_fetched=bool(row[12]) if len(row) > 12 else False,
-                    content_fetch_error=row[13] if len(row) > 13 else "",
-                    content_fetch_time=row[14] if len(row) > 14 else "",
-                )
-                items.append(item)
+            rows = self._query(query, params, row_factory=sqlite3.Row)
 
-            return items
+            return [
+                CrawlerNewsItem(**{
+                    name: convert(row[column]) for name, column, convert in columns
+                })
+                for row in rows
+            ]
         except Exception as e:
             self.log_error("", "get_items", "", str(e))
             return []
@@ -758,54 +1183,83 @@ class CrawlerManager:
         if not self.db_path:
             return 0
 
+        self.flush()
         deleted = 0
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # 按时间清理
-            if max_days > 0:
-                cutoff = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                from datetime import timedelta
-                cutoff = cutoff - timedelta(days=max_days)
-                cutoff_str = cutoff.isoformat()
-
-                cursor.execute(
-                    "DELETE FROM crawler_raw WHERE first_seen < ?",
-                    (cutoff_str,)
-                )
-                deleted += cursor.rowcount
-
-            # 按数量清理
-            if max_items > 0:
-                cursor.execute("SELECT COUNT(*) FROM crawler_raw")
-                count = cursor.fetchone()[0]
-                if count > max_items:
-                    cursor.execute(f"""
+            with self._transaction() as conn:
+                cursor = conn.cursor()
+
+                # 按时间清理
+                if max_days > 0:
+                    cutoff = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                    from datetime import timedelta
+                    cutoff = cutoff - timedelta(days=max_days)
+                    cutoff_str = cutoff.isoformat()
+
+                    cursor.execute(
+                        "DELETE FROM crawler_raw WHERE first_seen < ?",
+                        (cutoff_str,)
+                    )
+                    deleted += cursor.rowcount
+
+                # 按数量清理：跳过最新的 max_items 条，其余一次删除（无需先 COUNT）
+                if max_items > 0:
+                    cursor.execute("""
                         DELETE FROM crawler_raw WHERE id IN (
-                            SELECT id FROM crawler_raw ORDER BY first_seen ASC LIMIT ?
+                            SELECT id FROM crawler_raw
+                            ORDER BY first_seen DESC, id DESC LIMIT -1 OFFSET ?
                         )
-                    """, (count - max_items,))
+                    """, (max_items,))
                     deleted += cursor.rowcount
 
-            # 清理错误日志
-            cursor.execute(f"""
-                DELETE FROM crawler_errors WHERE id IN (
-                    SELECT id FROM crawler_errors ORDER BY timestamp ASC LIMIT ?
-                )
-            """, (max(0, len(self.error_log) - self.max_error_log),))
-
-            conn.commit()
-            conn.close()
+                # 清理错误日志：数据库中只保留最新的 max_error_log 条
+                cursor.execute("""
+                    DELETE FROM crawler_errors WHERE id NOT IN (
+                        SELECT id FROM crawler_errors ORDER BY timestamp DESC LIMIT ?
+                    )
+                """, (self.max_error_log,))
+            # 删除后截断 WAL 文件，回收磁盘空间（需在事务外执行）
+            with self._db_lock:
+                self._get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
         except Exception as e:
             self.log_error("", "cleanup", "", str(e))
 
         return deleted
 
     def cleanup(self) -> None:
-        """清理所有资源"""
+        """清理所有资源
+
+        先等待进行中的内容获取结束（各主机任务处理完当前条目即退出，
+        未开始的任务取消），再提交剩余写操作、停止写线程并关闭连接。
+        """
+        self._closed = True
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown(wait=False)
+            self._fetch_pool = None
+        if self._content_pool is not None:
+            self._content_pool.shutdown(wait=True, cancel_futures=True)
+            self._content_pool = None
+
         for crawler in self.crawlers.values():
             crawler.cleanup()
         self.crawlers.clear()
         self.stats.clear()
         self.seen_items.clear()
+
+        if self._http_adapter is not None:
+            self._http_adapter.close()
+            self._http_adapter = None
+
+        # 提交剩余写操作后停止后台写线程
+        with self._writer_lock:
+            self._writes_closed = True
+            writer = self._writer
+        if writer is not None:
+            self._write_q.put(None)
+            writer.join()
+            self._writer = None
+
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
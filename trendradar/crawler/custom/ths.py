@@ -7,12 +7,18 @@
 
 import json
 import re
-import time
 import requests
-from datetime import datetime
-from typing import Optional, Tuple, Dict, List
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, List, Mapping
 import pytz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from .base import (
     BaseCrawler,
     CrawlerNewsItem,
@@ -23,14 +29,62 @@ from .base import (
     ContentFetchError,
 )
 
-try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
-except ImportError:
-    HAS_BS4 = False
+from .content import THSContentMixin
+
+
+# 请求头（只读）
+_REQUEST_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "http://news.10jqka.com.cn/realtimenews.html",
+    # 要求缓存向源站重新验证，配合条件请求时未更新的列表返回 304
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+})
+
+# 响应头验证器 -> 条件请求头
+_VALIDATOR_HEADERS = (
+    ("ETag", "If-None-Match"),
+    ("Last-Modified", "If-Modified-Since"),
+)
+
+
+# JSONP 中未加引号的顶层属性名：{pubDate: 以及 ,latestNewsSeq: / ,counter: / ,item:
+_JSONP_KEY_RE = re.compile(r'\{\s*(pubDate):|,\s*(latestNewsSeq|counter|item):')
+
+# 条目扩展字段：(接口字段, extra 键)
+_EXTRA_FIELDS = (
+    ("stockCode", "stock_code"),
+    ("stocks", "stocks"),
+    ("category", "category"),
+    ("implevel", "importance_level"),
+)
+
+# 从 JSONP 起始处解码单个 JSON 对象，忽略其后的 "};" 等尾部内容
+_JSON_DECODER = json.JSONDecoder()
 
 
-class THSCrawler(BaseCrawler):
+def _quote_jsonp_key(match: "re.Match") -> str:
+    if match.group(1):
+        return f'{{"{match.group(1)}":'
+    return f',"{match.group(2)}":'
+
+
+def _loads_jsonp_object(json_str: str) -> Dict:
+    """解码以 JSON 对象开头的字符串
+
+    优先用 orjson 解码到最后一个 "}" 为止的部分；尾部还有其他脚本
+    导致失败时，回退到 raw_decode（在对象结束处停止）。
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(json_str[:json_str.rfind('}') + 1])
+        except orjson.JSONDecodeError:
+            pass
+    data, _ = _JSON_DECODER.raw_decode(json_str)
+    return data
+
+
+class THSCrawler(THSContentMixin, BaseCrawler):
     """同花顺7x24小时实时新闻爬虫
 
     数据源: http://stock.10jqka.com.cn/thsgd/realtimenews.js
@@ -42,11 +96,14 @@ class THSCrawler(BaseCrawler):
 
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
-        self.session = requests.Session()
-        self.session.headers.update(self.get_request_headers())
+        self.session = self.create_session()
         self.tz = pytz.timezone(config.get("timezone", "Asia/Shanghai") if config else "Asia/Shanghai")
         self.timeout = config.get("timeout", 10) if config else 10
         self.content_fetch_delay = config.get("content_fetch_delay", 0.3) if config else 0.3
+        # 条件请求：上次成功响应的验证器及其结果，304 时直接复用
+        self._conditional_headers: Dict[str, str] = {}
+        self._last_items: List[CrawlerNewsItem] = []
+        self._last_data_time = ""
 
     def get_source_id(self) -> str:
         return self.SOURCE_ID
@@ -54,22 +111,27 @@ class THSCrawler(BaseCrawler):
     def get_source_name(self) -> str:
         return self.SOURCE_NAME
 
-    def get_request_headers(self) -> Dict[str, str]:
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Referer": "http://news.10jqka.com.cn/realtimenews.html",
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        }
+    def get_request_headers(self) -> Mapping[str, str]:
+        return _REQUEST_HEADERS
 
     def fetch_news_list(self) -> CrawlResult:
         """获取新闻列表"""
         try:
-            # 带缓存绕过的请求
-            url = f"{self.BASE_URL}?v={int(time.time() * 1000)}"
-            resp = self.session.get(url, timeout=self.timeout)
-            resp.encoding = 'gbk'
+            # 条件请求代替 ?v= 时间戳缓存绕过：列表未更新时服务端/CDN 返回 304，无响应体
+            resp = self.session.get(
+                self.BASE_URL,
+                headers=self._conditional_headers or None,
+                timeout=self.timeout,
+            )
+
+            if resp.status_code == 304 and self._conditional_headers:
+                return CrawlResult(
+                    source_id=self.SOURCE_ID,
+                    source_name=self.SOURCE_NAME,
+                    items=list(self._last_items),
+                    status=FetchStatus.SUCCESS,
+                    data_time=self._last_data_time,
+                )
 
             if resp.status_code != 200:
                 return CrawlResult(
@@ -81,7 +143,9 @@ class THSCrawler(BaseCrawler):
                 )
 
             # 解析 JSONP 数据
-            data, parse_status, error_msg = self._parse_jsonp(resp.text)
+            data, parse_status, error_msg = self._parse_jsonp(
+                resp.content.decode('gbk', errors='replace')
+            )
             if parse_status != FetchStatus.SUCCESS:
                 return CrawlResult(
                     source_id=self.SOURCE_ID,
@@ -94,6 +158,7 @@ class THSCrawler(BaseCrawler):
             # 提取新闻条目
             items = self._extract_news_items(data)
             data_time = data.get("pubDate", "")
+            self._remember_response(resp, items, data_time)
 
             return CrawlResult(
                 source_id=self.SOURCE_ID,
@@ -129,6 +194,17 @@ class THSCrawler(BaseCrawler):
                 error_message=f"未知错误: {str(e)[:100]}",
             )
 
+    def _remember_response(self, resp, items: List[CrawlerNewsItem], data_time: str) -> None:
+        """记录响应验证器和解析结果，供下次条件请求使用"""
+        headers = resp.headers
+        self._conditional_headers = {
+            request_header: headers[response_header]
+            for response_header, request_header in _VALIDATOR_HEADERS
+            if headers.get(response_header)
+        }
+        self._last_items = items
+        self._last_data_time = data_time
+
     def _parse_jsonp(self, raw_data: str) -> Tuple[Optional[Dict], FetchStatus, str]:
         """解析 JSONP 数据
 
@@ -136,31 +212,15 @@ class THSCrawler(BaseCrawler):
             (解析后的数据, 状态, 错误信息)
         """
         try:
-            json_str = raw_data.strip()
-
             # 找到 JSON 起始位置
-            start = json_str.find('{')
+            start = raw_data.find('{')
             if start == -1:
                 return None, FetchStatus.PARSE_ERROR, "无法找到 JSON 起始位置"
 
-            # 找到 JSON 结束位置
-            end = json_str.rfind('};')
-            if end != -1:
-                json_str = json_str[start:end+1]
-            else:
-                end = json_str.rfind('}')
-                if end != -1:
-                    json_str = json_str[start:end+1]
-                else:
-                    json_str = json_str[start:]
-
-            # 修复 JSONP 格式：给属性名加双引号
-            json_str = re.sub(r'(\{)\s*(pubDate):', r'\1"\2":', json_str)
-            json_str = re.sub(r',\s*(latestNewsSeq):', r',"\1":', json_str)
-            json_str = re.sub(r',\s*(counter):', r',"\1":', json_str)
-            json_str = re.sub(r',\s*(item):', r',"\1":', json_str)
-
-            data = json.loads(json_str)
+            # 修复 JSONP 格式：给属性名加双引号（一次扫描处理全部属性）
+            json_str = _JSONP_KEY_RE.sub(_quote_jsonp_key, raw_data[start:])
+
+            data = _loads_jsonp_object(json_str)
             return data, FetchStatus.SUCCESS, ""
 
         except json.JSONDecodeError as e:
@@ -176,16 +236,12 @@ class THSCrawler(BaseCrawler):
             if not seq:
                 continue
 
-            # 提取扩展信息
+            # 提取扩展信息（每个字段只取一次，空值不写入）
             extra = {}
-            if item.get("stockCode"):
-                extra["stock_code"] = item.get("stockCode")
-            if item.get("stocks"):
-                extra["stocks"] = item.get("stocks")
-            if item.get("category"):
-                extra["category"] = item.get("category")
-            if item.get("implevel"):
-                extra["importance_level"] = item.get("implevel")
+            for key, extra_key in _EXTRA_FIELDS:
+                value = item.get(key)
+                if value:
+                    extra[extra_key] = value
 
             news_item = CrawlerNewsItem(
                 seq=str(seq),
@@ -200,141 +256,6 @@ class THSCrawler(BaseCrawler):
 
         return items
 
-    def fetch_full_content(self, item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
-        """获取新闻完整内容"""
-        if not HAS_BS4:
-            return "", FetchStatus.UNKNOWN_ERROR
-
-        if not item.url:
-            return "", FetchStatus.EMPTY_RESULT
-
-        # 尝试的 URL 列表
-        urls_to_try = [item.url]
-
-        # 如果是 news.10jqka.com.cn 域名，尝试转换为 stock.10jqka.com.cn
-        if 'news.10jqka.com.cn' in item.url:
-            alt_url = item.url.replace('news.10jqka.com.cn', 'stock.10jqka.com.cn')
-            urls_to_try.append(alt_url)
-
-        last_error = ""
-        for try_url in urls_to_try:
-            content, status = self._fetch_content_from_url(try_url)
-            if status == FetchStatus.SUCCESS and content:
-                return content, status
-            last_error = f"URL: {try_url}"
-
-        return "", FetchStatus.EMPTY_RESULT
-
-    def _fetch_content_from_url(self, url: str) -> Tuple[str, FetchStatus]:
-        """从指定 URL 获取内容"""
-        try:
-            resp = self.session.get(url, timeout=self.timeout)
-            resp.encoding = 'gbk'
-
-            soup = BeautifulSoup(resp.text, 'html.parser')
-
-            # 找正文容器
-            content_div = soup.find('div', class_='main-text')
-            if not content_div:
-                content_div = soup.find('div', class_='atc-content')
-
-            if not content_div:
-                return "", FetchStatus.PARSE_ERROR
-
-            # 移除脚本和样式
-            for tag in content_div.find_all(['script', 'style']):
-                tag.decompose()
-
-            # 提取段落文本
-            paragraphs = content_div.find_all('p')
-            if paragraphs:
-                texts = []
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    # 过滤广告和无关内容
-                    if text and not text.startswith('关注同花顺财经') and len(text) > 5:
-                        texts.append(text)
-
-                if texts:
-                    # 去重
-                    seen = set()
-                    unique_texts = []
-                    for t in texts:
-                        if t not in seen:
-                            seen.add(t)
-                            unique_texts.append(t)
-                    return '\n'.join(unique_texts), FetchStatus.SUCCESS
-
-            # 如果没有段落，直接提取文本
-            text = content_div.get_text(separator='\n', strip=True)
-            if text:
-                return text, FetchStatus.SUCCESS
-
-            return "", FetchStatus.EMPTY_RESULT
-
-        except requests.exceptions.Timeout:
-            return "", FetchStatus.TIMEOUT
-        except requests.exceptions.ConnectionError:
-            return "", FetchStatus.NETWORK_ERROR
-        except Exception as e:
-            return "", FetchStatus.UNKNOWN_ERROR
-
-    def fetch_full_content_batch(
-        self,
-        items: List[CrawlerNewsItem],
-        delay: float = None,
-        callback=None
-    ) -> Dict[str, Tuple[str, FetchStatus]]:
-        """批量获取完整内容
-
-        Args:
-            items: 新闻条目列表
-            delay: 请求间隔（秒）
-            callback: 每获取一条后的回调函数，接收 (item, content, status) 参数
-
-        Returns:
-            {seq: (content, status)} 字典
-        """
-        if not HAS_BS4:
-            return {item.seq: ("", FetchStatus.UNKNOWN_ERROR) for item in items}
-
-        delay = delay or self.content_fetch_delay
-        results = {}
-
-        for i, item in enumerate(items):
-            if item.content_fetched:
-                results[item.seq] = (item.full_content, FetchStatus.SUCCESS)
-                continue
-
-            if not item.url:
-                results[item.seq] = ("", FetchStatus.EMPTY_RESULT)
-                continue
-
-            content, status = self.fetch_full_content(item)
-            results[item.seq] = (content, status)
-
-            # 更新 item
-            item.full_content = content
-            item.content_fetched = status == FetchStatus.SUCCESS
-            item.content_fetch_time = datetime.now().isoformat()
-            if status != FetchStatus.SUCCESS:
-                item.content_fetch_error = status.value
-
-            # 回调
-            if callback:
-                callback(item, content, status)
-
-            # 延迟
-            if i < len(items) - 1 and delay > 0:
-                time.sleep(delay)
-
-        return results
-
-    def cleanup(self) -> None:
-        """清理资源"""
-        if self.session:
-            try:
-                self.session.close()
-            except Exception:
-                pass
-            self.session = None
+    def _decode_article(self, content: bytes, content_type: str) -> str:
+        """7x24 文章页固定为 GBK 编码"""
+        return content.decode('gbk', errors='replace')
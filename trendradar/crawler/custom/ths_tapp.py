@@ -14,9 +14,18 @@
 import time
 import requests
 from datetime import datetime
-from typing import Optional, Tuple, Dict, List
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping
 import pytz
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from .base import (
     BaseCrawler,
     CrawlerNewsItem,
@@ -24,14 +33,19 @@ from .base import (
     FetchStatus,
 )
 
-try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
-except ImportError:
-    HAS_BS4 = False
+from .content import THSContentMixin
+
 
+# 请求头（只读）
+_REQUEST_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://news.10jqka.com.cn/7x24/",
+    "Accept": "application/json, text/plain, */*",
+    "Cache-Control": "no-cache",
+})
 
-class THSTappCrawler(BaseCrawler):
+
+class THSTappCrawler(THSContentMixin, BaseCrawler):
     """同花顺 TAPP JSON API 爬虫
 
     使用原生 JSON API，比 JSONP 更稳定可靠。
@@ -43,12 +57,13 @@ class THSTappCrawler(BaseCrawler):
 
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
-        self.session = requests.Session()
-        self.session.headers.update(self.get_request_headers())
+        self.session = self.create_session()
         self.tz = pytz.timezone(config.get("timezone", "Asia/Shanghai") if config else "Asia/Shanghai")
         self.timeout = config.get("timeout", 10) if config else 10
         self.content_fetch_delay = config.get("content_fetch_delay", 0.3) if config else 0.3
         self.page_size = config.get("page_size", 100) if config else 100
+        # 上一轮构建的条目（seq -> 条目），下一轮相同 seq 直接复用
+        self._recent_items: Dict[str, CrawlerNewsItem] = {}
 
     def get_source_id(self) -> str:
         return self.SOURCE_ID
@@ -56,13 +71,8 @@ class THSTappCrawler(BaseCrawler):
     def get_source_name(self) -> str:
         return self.SOURCE_NAME
 
-    def get_request_headers(self) -> Dict[str, str]:
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Referer": "https://news.10jqka.com.cn/7x24/",
-            "Accept": "application/json, text/plain, */*",
-            "Cache-Control": "no-cache",
-        }
+    def get_request_headers(self) -> Mapping[str, str]:
+        return _REQUEST_HEADERS
 
     def fetch_news_list(self) -> CrawlResult:
         """获取新闻列表"""
@@ -88,7 +98,8 @@ class THSTappCrawler(BaseCrawler):
                     error_message=f"HTTP {resp.status_code}",
                 )
 
-            data = resp.json()
+            # orjson 直接解码字节，跳过 requests 的编码探测和一次解码复制
+            data = orjson.loads(resp.content) if ORJSON_AVAILABLE else resp.json()
 
             if data.get("code") != "200":
                 return CrawlResult(
@@ -138,30 +149,51 @@ class THSTappCrawler(BaseCrawler):
             )
 
     def _extract_news_items(self, data: Dict) -> List[CrawlerNewsItem]:
-        """从 API 响应提取新闻条目"""
-        items = []
+        """从 API 响应提取新闻条目
+
+        接口约 15 秒刷新一次，相邻两轮的列表大部分相同：上一轮已构建过的
+        seq 直接复用原条目，只为新出现的条目解析字段和创建对象。仍返回
+        整页条目，供管理器更新 last_seen。
+        """
+        keyed = []  # (ctime, 条目)，排序键在构建时计算一次
         news_list = data.get("data", {}).get("list", [])
+        recent = self._recent_items
+        current: Dict[str, CrawlerNewsItem] = {}
+
+        # 时区偏移每轮只计算一次，逐条用整数运算 + gmtime 格式化，
+        # 避免每条新闻都做 pytz 时区查找（同一页新闻时间相近，不跨夏令时切换）
+        tz_offset = int(datetime.now(self.tz).utcoffset().total_seconds())
+        gmtime, strftime = time.gmtime, time.strftime
 
         for item in news_list:
-            seq = item.get("seq")
+            get = item.get
+            seq = get("seq")
             if not seq:
                 continue
+            seq = str(seq)
+
+            news_item = recent.get(seq)
+            if news_item is not None:
+                current[seq] = news_item
+                keyed.append((news_item.extra["_ctime"], news_item))
+                continue
 
             # 转换时间戳
-            ctime = item.get("ctime", 0)
+            ctime = get("ctime", 0)
+            sort_key = 0
             published_at = ""
             if ctime:
                 try:
-                    dt = datetime.fromtimestamp(int(ctime), tz=self.tz)
-                    published_at = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, OSError):
+                    sort_key = int(ctime)
+                    published_at = strftime("%Y-%m-%d %H:%M:%S", gmtime(sort_key + tz_offset))
+                except (ValueError, OSError, OverflowError):
                     published_at = ""
 
             # 提取扩展信息
             extra = {}
 
             # 股票信息
-            stocks = item.get("stock", [])
+            stocks = get("stock")
             if stocks:
                 extra["stocks"] = [
                     {"name": s.get("name"), "code": s.get("stockCode"), "market": s.get("stockMarket")}
@@ -169,7 +201,7 @@ class THSTappCrawler(BaseCrawler):
                 ]
 
             # 板块信息
-            fields = item.get("field", [])
+            fields = get("field")
             if fields:
                 extra["fields"] = [
                     {"name": f.get("name"), "code": f.get("stockCode")}
@@ -177,12 +209,12 @@ class THSTappCrawler(BaseCrawler):
                 ]
 
             # 标签
-            tags = item.get("tags", [])
+            tags = get("tags")
             if tags:
                 extra["tags"] = [t.get("name") for t in tags]
 
             # 重要性等级 (0-3)
-            importance = item.get("import", 0)
+            importance = get("import", 0)
             try:
                 importance = int(importance) if importance else 0
             except (ValueError, TypeError):
@@ -191,7 +223,7 @@ class THSTappCrawler(BaseCrawler):
                 extra["importance"] = importance
 
             # 颜色标记 (1=普通, 2=重要)
-            color = item.get("color", 1)
+            color = get("color", 1)
             try:
                 color = int(color) if color else 1
             except (ValueError, TypeError):
@@ -200,150 +232,24 @@ class THSTappCrawler(BaseCrawler):
                 extra["highlight"] = True
 
             # 保存原始 ctime 用于排序
-            extra["_ctime"] = int(ctime) if ctime else 0
+            extra["_ctime"] = sort_key
 
             news_item = CrawlerNewsItem(
-                seq=str(seq),
-                title=item.get("title", "").strip(),
-                summary=item.get("digest", item.get("short", "")).strip(),
-                url=item.get("url", ""),
+                seq=seq,
+                title=get("title", "").strip(),
+                summary=(get("digest") if "digest" in item else get("short", "")).strip(),
+                url=get("url", ""),
                 published_at=published_at,
-                source=item.get("source", "") or "同花顺",
+                source=get("source", "") or "同花顺",
                 extra=extra,
             )
-            items.append(news_item)
-
-        # 按时间降序排序（最新的在前面）
-        items.sort(key=lambda x: x.extra.get("_ctime", 0), reverse=True)
-
-        return items
-
-    def fetch_full_content(self, item: CrawlerNewsItem) -> Tuple[str, FetchStatus]:
-        """获取新闻完整内容"""
-        if not HAS_BS4:
-            return "", FetchStatus.UNKNOWN_ERROR
-
-        if not item.url:
-            return "", FetchStatus.EMPTY_RESULT
+            current[seq] = news_item
+            keyed.append((sort_key, news_item))
 
-        # 尝试的 URL 列表
-        urls_to_try = [item.url]
+        self._recent_items = current
 
-        # 如果是 news.10jqka.com.cn 域名，尝试转换为 stock.10jqka.com.cn
-        if 'news.10jqka.com.cn' in item.url:
-            alt_url = item.url.replace('news.10jqka.com.cn', 'stock.10jqka.com.cn')
-            urls_to_try.append(alt_url)
+        # 按时间降序排序（最新的在前面）；接口通常已有序，此时跳过排序
+        if any(keyed[i][0] < keyed[i + 1][0] for i in range(len(keyed) - 1)):
+            keyed.sort(key=itemgetter(0), reverse=True)
 
-        for try_url in urls_to_try:
-            content, status = self._fetch_content_from_url(try_url)
-            if status == FetchStatus.SUCCESS and content:
-                return content, status
-
-        return "", FetchStatus.EMPTY_RESULT
-
-    def _fetch_content_from_url(self, url: str) -> Tuple[str, FetchStatus]:
-        """从指定 URL 获取内容"""
-        try:
-            resp = self.session.get(url, timeout=self.timeout)
-            resp.encoding = 'utf-8'
-
-            # 尝试检测编码
-            if 'charset=gbk' in resp.text.lower() or 'charset=gb2312' in resp.text.lower():
-                resp.encoding = 'gbk'
-
-            soup = BeautifulSoup(resp.text, 'html.parser')
-
-            # 找正文容器
-            content_div = soup.find('div', class_='main-text')
-            if not content_div:
-                content_div = soup.find('div', class_='atc-content')
-
-            if not content_div:
-                return "", FetchStatus.PARSE_ERROR
-
-            # 移除脚本和样式
-            for tag in content_div.find_all(['script', 'style']):
-                tag.decompose()
-
-            # 提取段落文本
-            paragraphs = content_div.find_all('p')
-            if paragraphs:
-                texts = []
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text and not text.startswith('关注同花顺财经') and len(text) > 5:
-                        texts.append(text)
-
-                if texts:
-                    seen = set()
-                    unique_texts = []
-                    for t in texts:
-                        if t not in seen:
-                            seen.add(t)
-                            unique_texts.append(t)
-                    return '\n'.join(unique_texts), FetchStatus.SUCCESS
-
-            # 如果没有段落，直接提取文本
-            text = content_div.get_text(separator='\n', strip=True)
-            if text:
-                return text, FetchStatus.SUCCESS
-
-            return "", FetchStatus.EMPTY_RESULT
-
-        except requests.exceptions.Timeout:
-            return "", FetchStatus.TIMEOUT
-        except requests.exceptions.ConnectionError:
-            return "", FetchStatus.NETWORK_ERROR
-        except Exception:
-            return "", FetchStatus.UNKNOWN_ERROR
-
-    def fetch_full_content_batch(
-        self,
-        items: List[CrawlerNewsItem],
-        delay: float = None,
-        callback=None
-    ) -> Dict[str, Tuple[str, FetchStatus]]:
-        """批量获取完整内容"""
-        if not HAS_BS4:
-            return {item.seq: ("", FetchStatus.UNKNOWN_ERROR) for item in items}
-
-        delay = delay or self.content_fetch_delay
-        results = {}
-
-        for i, item in enumerate(items):
-            if item.content_fetched:
-                results[item.seq] = (item.full_content, FetchStatus.SUCCESS)
-                continue
-
-            if not item.url:
-                results[item.seq] = ("", FetchStatus.EMPTY_RESULT)
-                continue
-
-            content, status = self.fetch_full_content(item)
-            results[item.seq] = (content, status)
-
-            # 更新 item
-            item.full_content = content
-            item.content_fetched = status == FetchStatus.SUCCESS
-            item.content_fetch_time = datetime.now().isoformat()
-            if status != FetchStatus.SUCCESS:
-                item.content_fetch_error = status.value
-
-            # 回调
-            if callback:
-                callback(item, content, status)
-
-            # 延迟
-            if i < len(items) - 1 and delay > 0:
-                time.sleep(delay)
-
-        return results
-
-    def cleanup(self) -> None:
-        """清理资源"""
-        if self.session:
-            try:
-                self.session.close()
-            except Exception:
-                pass
-            self.session = None
+        return [news_item for _, news_item in keyed]
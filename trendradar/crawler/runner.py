@@ -11,12 +11,9 @@
 - 推送通知
 """
 
-import time
 import threading
-from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
-import json
+from typing import Dict, List, Optional, Callable, Any, Tuple
 
 from trendradar.logging import get_logger
 from .custom import (
@@ -100,7 +97,15 @@ class CrawlerRunner:
         # 状态
         self._running = False
         self._poll_thread = None
+        self._stop_event = threading.Event()  # 停止信号，轮询间隔内可立即唤醒
         self._last_results: Dict[str, CrawlResult] = {}
+        self._new_seqs: frozenset = frozenset()  # 最近一次爬取的新增序号，每轮计算一次
+
+        # 展示列表缓存：(source_id, include_filtered, max_items) -> 条目字典列表。
+        # 每轮爬取或后台补全正文后失效（代数递增），构建期间失效的结果不写入缓存
+        self._display_cache: Dict[Tuple[Optional[str], bool, int], List[Dict[str, Any]]] = {}
+        self._display_cache_gen = 0
+        self.manager.on_content_fetched(lambda source_id, item: self._invalidate_display_cache())
         self._last_items: Dict[str, List[CrawlerNewsItem]] = {}  # 保存过滤后的条目（含过滤标记）
 
     def _register_crawlers(self, sources: List[Dict]) -> None:
@@ -143,8 +148,16 @@ class CrawlerRunner:
 
         results = self.manager.crawl_all()
         self._last_results = results
+        self._new_seqs = frozenset(
+            item.seq
+            for result in results.values()
+            if result.status == FetchStatus.SUCCESS
+            # 最新的条目视为新增
+            for item in result.items[:result.new_count]
+        )
 
-        # 处理每个结果
+        # 处理每个结果（过滤后的条目最后在一个事务内统一保存）
+        pending_saves = []
         for source_id, result in results.items():
             if result.status != FetchStatus.SUCCESS:
                 logger.warning("%s 获取失败: %s", source_id, result.error_message)
@@ -154,11 +167,7 @@ class CrawlerRunner:
 
             # 获取完整内容（新增条目）
             if self.content_enabled and result.new_count > 0:
-                new_items = [item for item in result.items if item.seq in
-                           (self.manager.seen_items.get(source_id, set()) -
-                            set(item.seq for item in self._get_old_items(source_id, result.items)))]
-
-                # 实际上获取所有未获取内容的条目
+                # 获取所有未获取内容的条目
                 items_to_fetch = [item for item in result.items if not item.content_fetched]
                 if items_to_fetch:
                     logger.info("开始获取 %d 条新闻的完整内容...", len(items_to_fetch))
@@ -178,17 +187,21 @@ class CrawlerRunner:
                     item.matched_keywords = []
 
             # 过滤后重新保存到数据库（更新过滤状态）
-            self.manager._save_items(source_id, result.source_name, result.items)
+            pending_saves.append((source_id, result.source_name, result.items))
 
             # 保存条目到内存（含过滤标记）
             self._last_items[source_id] = result.items
 
+        if pending_saves:
+            self.manager._save_batches(pending_saves)
+        self._invalidate_display_cache()
+
         return results
 
-    def _get_old_items(self, source_id: str, current_items: List[CrawlerNewsItem]) -> List[CrawlerNewsItem]:
-        """获取旧条目（用于计算新增）"""
-        # 简化实现：返回空列表，实际新增检测在 manager 中完成
-        return []
+    def _invalidate_display_cache(self) -> None:
+        """展示数据变化后清空展示列表缓存"""
+        self._display_cache_gen += 1
+        self._display_cache.clear()
 
     def _apply_filter(self, source_id: str, items: List[CrawlerNewsItem]) -> None:
         """应用过滤"""
@@ -230,9 +243,11 @@ class CrawlerRunner:
             return
 
         self._running = True
+        self._stop_event.clear()
+        stop_event = self._stop_event
 
         def poll_task():
-            while self._running:
+            while not stop_event.is_set():
                 try:
                     results = self.crawl_once()
                     if callback:
@@ -240,11 +255,8 @@ class CrawlerRunner:
                 except Exception as e:
                     logger.error("轮询错误: %s", e)
 
-                # 等待下一次
-                for _ in range(self.poll_interval):
-                    if not self._running:
-                        break
-                    time.sleep(1)
+                # 等待下一次：阻塞在停止信号上，不再逐秒唤醒检查
+                stop_event.wait(self.poll_interval)
 
         self._poll_thread = threading.Thread(target=poll_task, daemon=True)
         self._poll_thread.start()
@@ -253,8 +265,10 @@ class CrawlerRunner:
     def stop_polling(self) -> None:
         """停止轮询"""
         self._running = False
+        self._stop_event.set()
         if self._poll_thread:
             self._poll_thread.join(timeout=5)
+            self._poll_thread = None
         logger.info("停止轮询")
 
     def get_items_for_display(
@@ -275,9 +289,17 @@ class CrawlerRunner:
         """
         max_items = max_items or self.max_display_items
 
+        # 内存中的条目未变化时直接复用上次的转换结果（返回浅拷贝，调用方可修改）
+        cache_key = (source_id, include_filtered, max_items)
+        cached = self._display_cache.get(cache_key)
+        if cached is not None:
+            return [dict(item_dict) for item_dict in cached]
+        generation = self._display_cache_gen
+
         # 优先使用内存中的条目（含过滤标记）
         items = []
-        if self._last_items:
+        from_memory = bool(self._last_items)
+        if from_memory:
             if source_id:
                 items = self._last_items.get(source_id, [])
             else:
@@ -307,17 +329,14 @@ class CrawlerRunner:
             item_dict["filter_tag"] = self._get_filter_tag(item) if self.show_filter_tag else ""
             result.append(item_dict)
 
+        if from_memory and generation == self._display_cache_gen:
+            self._display_cache[cache_key] = result
+            return [dict(item_dict) for item_dict in result]
         return result
 
-    def _get_new_seqs(self) -> set:
-        """获取本次新增的序号集合"""
-        seqs = set()
-        for result in self._last_results.values():
-            if result.status == FetchStatus.SUCCESS:
-                # 最新的条目视为新增
-                for item in result.items[:result.new_count]:
-                    seqs.add(item.seq)
-        return seqs
+    def _get_new_seqs(self) -> frozenset:
+        """获取本次新增的序号集合（crawl_once 中每轮计算一次，展示时直接复用）"""
+        return self._new_seqs
 
     def _get_filter_tag(self, item: CrawlerNewsItem) -> str:
         """获取过滤标签"""
@@ -379,7 +398,8 @@ class CrawlerRunner:
                 "feed_name": "同花顺7x24",
                 "url": item.url,
                 "published_at": item.published_at,
-                "summary": item.summary or item.full_content[:200] if item.full_content else "",
+                # 无摘要时取正文前 200 字（切片只在摘要为空时发生）
+                "summary": item.summary or (item.full_content[:200] if item.full_content else ""),
                 "author": item.source,
                 "full_content": item.full_content,
                 # 过滤相关
@@ -41,6 +41,13 @@ def setup_logging(
     # 选择格式
     log_format = SIMPLE_FORMAT if format_style == "simple" else LOG_FORMAT
 
+    # 日志格式只用到时间、级别、名称和消息：关闭 LogRecord 中线程/进程信息的采集，
+    # 并跳过 findCaller 的调用栈回溯（文件名/行号/函数名不再填充）
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # 配置根日志器
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
@@ -12,7 +12,7 @@ from typing import List, Dict, Any, Optional
 from .base import BaseAnalysisResult, ToDictMixin
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsAnalysisResult(BaseAnalysisResult):
     """单条新闻分析结果
 
@@ -36,7 +36,7 @@ class NewsAnalysisResult(BaseAnalysisResult):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchAnalysisResult(BaseAnalysisResult):
     """批量新闻分析结果
 
@@ -55,7 +55,7 @@ class BatchAnalysisResult(BaseAnalysisResult):
     rss_count: int = 0                  # RSS 新闻数量
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult(ToDictMixin):
     """翻译结果
 
@@ -70,7 +70,7 @@ class TranslationResult(ToDictMixin):
     error: str = ""                     # 错误信息
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTranslationResult(ToDictMixin):
     """批量翻译结果"""
     results: List[TranslationResult] = field(default_factory=list)
@@ -8,8 +8,16 @@
 """
 
 from dataclasses import dataclass, field, fields, asdict
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+from trendradar.utils.time import fast_isoformat
+
+
+# 各 dataclass 的字段名元组（首次 to_dict 时按类缓存，避免每次调用 fields()）
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+# 无需转换的标量类型，按精确类型判断，跳过 hasattr 探测
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
 
 
 class ToDictMixin:
@@ -18,33 +26,43 @@ class ToDictMixin:
     自动将 dataclass 转换为字典，处理嵌套对象。
     """
 
+    # 空 __slots__：使用 slots=True 的子类实例不再带 __dict__
+    __slots__ = ()
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典
 
         Returns:
             包含所有字段的字典
         """
+        cls = type(self)
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+
         result = {}
-        for f in fields(self):
-            value = getattr(self, f.name)
-            if hasattr(value, 'to_dict'):
-                result[f.name] = value.to_dict()
+        for name in names:
+            value = getattr(self, name)
+            if type(value) in _SCALAR_TYPES:
+                result[name] = value
+            elif hasattr(value, 'to_dict'):
+                result[name] = value.to_dict()
             elif isinstance(value, list):
-                result[f.name] = [
+                result[name] = [
                     item.to_dict() if hasattr(item, 'to_dict') else item
                     for item in value
                 ]
             elif isinstance(value, dict):
-                result[f.name] = {
+                result[name] = {
                     k: v.to_dict() if hasattr(v, 'to_dict') else v
                     for k, v in value.items()
                 }
             else:
-                result[f.name] = value
+                result[name] = value
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseResult(ToDictMixin):
     """结果类基类
 
@@ -52,7 +70,7 @@ class BaseResult(ToDictMixin):
     """
     success: bool = True
     error: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=fast_isoformat)
 
     def mark_error(self, error_msg: str) -> None:
         """标记为错误状态"""
@@ -60,7 +78,7 @@ class BaseResult(ToDictMixin):
         self.error = error_msg
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseAnalysisResult(BaseResult):
     """AI 分析结果基类
 
@@ -68,10 +86,10 @@ class BaseAnalysisResult(BaseResult):
     """
     raw_response: str = ""              # 原始 AI 响应
     model_used: str = ""                # 使用的模型
-    analyzed_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    analyzed_at: str = field(default_factory=fast_isoformat)
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseNewsItem(ToDictMixin):
     """新闻条目基类
 
@@ -86,7 +104,8 @@ class BaseNewsItem(ToDictMixin):
 
     def __post_init__(self):
         if not self.crawl_time:
-            self.crawl_time = datetime.now().strftime("%H:%M")
+            # 取缓存的本地 ISO 时间中的 HH:MM，同一秒内创建的条目不再重复格式化
+            self.crawl_time = fast_isoformat()[11:16]
 
 
 # 字段名映射：camelCase → snake_case
@@ -99,6 +118,10 @@ FIELD_NAME_MAPPING = {
     "rankTimeline": "rank_timeline",
 }
 
+# (源字段, 目标字段) 对，模块加载时按两个方向各生成一次
+_TO_SNAKE_PAIRS = tuple(FIELD_NAME_MAPPING.items())
+_TO_CAMEL_PAIRS = tuple((snake, camel) for camel, snake in FIELD_NAME_MAPPING.items())
+
 
 def normalize_news_item(data: Dict[str, Any], to_snake_case: bool = True) -> Dict[str, Any]:
     """
@@ -116,16 +139,10 @@ def normalize_news_item(data: Dict[str, Any], to_snake_case: bool = True) -> Dic
 
     result = dict(data)
 
-    if to_snake_case:
-        # camelCase → snake_case
-        for camel, snake in FIELD_NAME_MAPPING.items():
-            if camel in result and snake not in result:
-                result[snake] = result.pop(camel)
-    else:
-        # snake_case → camelCase (反向映射)
-        for camel, snake in FIELD_NAME_MAPPING.items():
-            if snake in result and camel not in result:
-                result[camel] = result.pop(snake)
+    # 源字段存在且目标字段不存在时改名（两者都存在时保留原样）
+    for src, dst in _TO_SNAKE_PAIRS if to_snake_case else _TO_CAMEL_PAIRS:
+        if src in result and dst not in result:
+            result[dst] = result.pop(src)
 
     return result
 
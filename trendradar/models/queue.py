@@ -3,6 +3,7 @@
 队列任务数据模型
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict
@@ -31,39 +32,65 @@ class TaskStatus(Enum):
         return cls.COMPLETED
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueTask(ToDictMixin):
     """队列任务
 
     表示队列中的一个任务，包含状态追踪。
+
+    时间戳以 time.time() 浮点数存储，仅在读取 created_at/started_at/
+    completed_at 时格式化为 ISO 字符串（未设置时为空字符串）。
+
+    状态变更方法最后才写 status：其他线程不加锁读取时，看到 COMPLETED/FAILED
+    即可保证 result/error 和结束时间已经写好。
     """
     id: str
     data: Any
     status: TaskStatus = TaskStatus.PENDING
     result: Any = None
     error: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    started_at: str = ""
-    completed_at: str = ""
+    created_at_ts: float = field(default_factory=time.time)
+    started_at_ts: float = 0.0
+    completed_at_ts: float = 0.0
     retry_count: int = 0
     max_retries: int = 3
 
+    @staticmethod
+    def _format_ts(ts: float) -> str:
+        """将时间戳格式化为 ISO 字符串"""
+        return datetime.fromtimestamp(ts).isoformat() if ts else ""
+
+    @property
+    def created_at(self) -> str:
+        """创建时间（ISO 格式）"""
+        return self._format_ts(self.created_at_ts)
+
+    @property
+    def started_at(self) -> str:
+        """开始时间（ISO 格式）"""
+        return self._format_ts(self.started_at_ts)
+
+    @property
+    def completed_at(self) -> str:
+        """结束时间（ISO 格式）"""
+        return self._format_ts(self.completed_at_ts)
+
     def start(self) -> None:
         """标记任务开始"""
+        self.started_at_ts = time.time()
         self.status = TaskStatus.PROCESSING
-        self.started_at = datetime.now().isoformat()
 
     def complete(self, result: Any) -> None:
         """标记任务完成"""
-        self.status = TaskStatus.COMPLETED
         self.result = result
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at_ts = time.time()
+        self.status = TaskStatus.COMPLETED
 
     def fail(self, error: str) -> None:
         """标记任务失败"""
-        self.status = TaskStatus.FAILED
         self.error = error
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at_ts = time.time()
+        self.status = TaskStatus.FAILED
 
     def can_retry(self) -> bool:
         """是否可以重试"""
@@ -72,15 +99,16 @@ class QueueTask(ToDictMixin):
     def increment_retry(self) -> None:
         """增加重试次数"""
         self.retry_count += 1
-        self.status = TaskStatus.PENDING
         self.error = ""
+        self.status = TaskStatus.PENDING
 
     def to_dict(self) -> Dict:
-        """转换为字典"""
+        """转换为字典（结果对象有 to_dict 时一并转换）"""
+        result = self.result
         return {
             "id": self.id,
             "status": self.status.value,
-            "result": self.result,
+            "result": result.to_dict() if hasattr(result, "to_dict") else result,
             "error": self.error,
             "created_at": self.created_at,
             "started_at": self.started_at,
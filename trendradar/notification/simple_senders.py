@@ -11,8 +11,24 @@
 - 统一接口：所有函数签名一致，便于统一调用
 """
 
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Callable, Optional, Sequence, Tuple
+
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 from trendradar.logging import get_logger
 from trendradar.constants import Limits, Timeouts
@@ -20,11 +36,257 @@ from trendradar.constants import Limits, Timeouts
 logger = get_logger(__name__)
 
 
+# 仅重试明确表示未处理请求的限流/服务不可用，按退避（遵循 Retry-After）重试；
+# 500/502/504 时上游可能已处理，POST 重试会重复推送
+_RETRY_STATUS = (429, 503)
+
+
+def _create_session() -> requests.Session:
+    """创建模块级共享会话
+
+    同一 webhook 主机的连接保持复用，后续推送省去 TCP/TLS 握手。
+    重试建连失败和 _RETRY_STATUS 状态码；读超时不重试，避免重复推送。
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_TELEGRAM_URL = "https://api.telegram.org/bot{}/sendMessage".format
+
+
+def _dumps(payload: dict) -> bytes:
+    """序列化请求体（优先使用 orjson），多账号共用同一份字节串"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _post_json(channel: str, account_label: str, url: str, body: bytes) -> Optional[dict]:
+    """发送 JSON 请求体并解析响应
+
+    只有网络请求和 JSON 解析放在 try 中，异常分别按网络异常和响应格式错误记录。
+
+    Args:
+        channel: 渠道名称（用于日志）
+        account_label: 账号标签（用于日志）
+        url: 请求地址
+        body: 已序列化的请求体
+
+    Returns:
+        响应 JSON 对象；网络异常、非 200 或响应不是 JSON 对象时返回 None
+    """
+    try:
+        response = _SESSION.post(url, data=body, headers=_JSON_HEADERS,
+                                 timeout=Timeouts.HTTP_REQUEST)
+    except requests.RequestException as e:
+        logger.error("%s%s推送网络异常: %s", channel, account_label, e)
+        return None
+
+    if response.status_code != 200:
+        logger.warning("%s%s推送失败: HTTP %d", channel, account_label, response.status_code)
+        return None
+
+    try:
+        result = _loads(response.content) if response.content else {}
+    except ValueError:
+        logger.warning("%s%s推送失败: 响应不是有效 JSON", channel, account_label)
+        return None
+    if not isinstance(result, dict):
+        logger.warning("%s%s推送失败: 响应不是 JSON 对象", channel, account_label)
+        return None
+    return result
+
+
+@lru_cache(maxsize=64)
+def _split_urls(raw: str, limit: Optional[int] = None) -> Tuple[str, ...]:
+    """拆分分号分隔的多账号配置（按配置字符串缓存，daemon 反复推送时不再重复解析）
+
+    Args:
+        raw: 分号分隔的配置字符串
+        limit: 最多取前几个账号，None 表示全部；超出部分不再处理
+
+    Returns:
+        去除空白后的非空条目
+    """
+    return tuple(islice((stripped for part in raw.split(";") if (stripped := part.strip())), limit))
+
+
+# 多账号并发发送的总等待时长：单个账号卡住（含重试退避）时不再拖住整个推送
+_FAN_OUT_DEADLINE = Timeouts.HTTP_REQUEST * 1.5
+
+# 账号并发发送线程池（延迟创建，各渠道共享）
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """获取账号并发发送线程池（延迟创建）"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Limits.MAX_ACCOUNTS_PER_CHANNEL * 4,
+                    thread_name_prefix="simple-sender",
+                )
+    return _executor
+
+
+def _log_late_result(label: str, future: Future) -> None:
+    """记录超过总时限后才完成的账号推送结果（这些结果已不计入返回值）"""
+    if future.cancelled():
+        return
+    if future.exception() is None and future.result():
+        logger.info("账号%s推送在超时后完成，实际已送达", label)
+    else:
+        logger.warning("账号%s推送在超时后失败", label)
+
+
+def _fan_out(
+    send_one: Callable[[str, object], bool],
+    accounts: Sequence,
+    first_success_only: bool = False
+) -> bool:
+    """发送到各账号
+
+    默认并发发送：以网络等待为主，多账号耗时取最慢的一个而非之和。
+    单账号与多账号一样总等待不超过 _FAN_OUT_DEADLINE（单账号日志标签为空）；
+    超时未完成的账号不计入返回值，其请求仍在后台继续，完成后单独记录实际结果。
+    first_success_only 时在调用线程按顺序发送，首个账号成功即停止，其余账号作为备用；
+    该模式不设总时限，每个账号的等待由请求超时和重试次数限定。
+
+    Args:
+        send_one: 单账号发送函数，参数为 (账号标签, 账号)，返回是否成功
+        accounts: 账号列表
+        first_success_only: 是否在首个账号成功后停止
+
+    Returns:
+        是否至少有一个账号在总时限内发送成功
+    """
+    if len(accounts) == 1:
+        labels = [""]
+    else:
+        labels = [f"[{i}]" for i in range(1, len(accounts) + 1)]
+
+    if first_success_only:
+        return any(send_one(label, account) for label, account in zip(labels, accounts))
+
+    pool = _get_executor()
+    futures = {pool.submit(send_one, label, account): label for label, account in zip(labels, accounts)}
+    done, not_done = wait(futures, timeout=_FAN_OUT_DEADLINE)
+    if not_done:
+        logger.warning("%d 个账号推送超过 %.0fs 未完成，不再等待", len(not_done), _FAN_OUT_DEADLINE)
+        for future in not_done:
+            future.add_done_callback(partial(_log_late_result, futures[future]))
+    return any([future.result() for future in done])
+
+
+@dataclass(frozen=True)
+class _ChannelSpec:
+    """渠道描述：名称（用于日志）、响应成功判定、错误信息提取"""
+    name: str
+    is_ok: Callable[[dict], bool]
+    error_msg: Callable[[dict], str]
+
+
+_FEISHU = _ChannelSpec(
+    "飞书",
+    is_ok=lambda result: result.get("StatusCode") == 0 or result.get("code") == 0,
+    error_msg=lambda result: result.get("msg", "未知错误"),
+)
+_DINGTALK = _ChannelSpec(
+    "钉钉",
+    is_ok=lambda result: result.get("errcode") == 0,
+    error_msg=lambda result: result.get("errmsg", "未知错误"),
+)
+_WEWORK = _ChannelSpec(
+    "企业微信",
+    is_ok=lambda result: result.get("errcode") == 0,
+    error_msg=lambda result: result.get("errmsg", "未知错误"),
+)
+_TELEGRAM = _ChannelSpec(
+    "Telegram",
+    is_ok=lambda result: bool(result.get("ok")),
+    error_msg=lambda result: result.get("description", "未知错误"),
+)
+
+
+def _send_to_account(
+    spec: _ChannelSpec,
+    account_label: str,
+    url: str,
+    body: bytes,
+    verbose: bool
+) -> bool:
+    """发送到单个账号并按渠道规则判定结果"""
+    result = _post_json(spec.name, account_label, url, body)
+    if result is None:
+        return False
+
+    if spec.is_ok(result):
+        if verbose:
+            logger.debug("%s%s推送成功", spec.name, account_label)
+        return True
+    logger.warning("%s%s推送失败: %s", spec.name, account_label, spec.error_msg(result))
+    return False
+
+
+def _send_webhook(
+    spec: _ChannelSpec,
+    webhook_url: str,
+    payload: dict,
+    verbose: bool,
+    first_success_only: bool
+) -> bool:
+    """将同一请求体发送到 webhook 的各账号
+
+    Args:
+        spec: 渠道描述
+        webhook_url: Webhook URL，多个用分号分隔
+        payload: 请求体（各账号相同，只序列化一次）
+        verbose: 是否输出详细日志
+        first_success_only: 是否在首个账号成功后停止
+
+    Returns:
+        是否至少有一个账号发送成功
+    """
+    urls = _split_urls(webhook_url, Limits.MAX_ACCOUNTS_PER_CHANNEL)
+    body = _dumps(payload)
+
+    def send_one(account_label: str, url: str) -> bool:
+        return _send_to_account(spec, account_label, url, body, verbose)
+
+    return _fan_out(send_one, urls, first_success_only)
+
+
 def send_simple_feishu(
     webhook_url: str,
     subject: str,
     content: str,
-    verbose: bool = False
+    verbose: bool = False,
+    first_success_only: bool = False
 ) -> bool:
     """
     发送飞书 webhook 消息（支持多账号）
@@ -34,47 +296,25 @@ def send_simple_feishu(
         subject: 消息标题
         content: 消息内容
         verbose: 是否输出详细日志
+        first_success_only: 是否在首个账号成功后停止（其余账号作为备用）
 
     Returns:
         是否至少有一个账号发送成功
     """
-    urls = [url.strip() for url in webhook_url.split(";") if url.strip()]
-    success = False
-
-    for i, url in enumerate(urls[:Limits.MAX_ACCOUNTS_PER_CHANNEL]):
-        account_label = f"[{i+1}]" if len(urls) > 1 else ""
-        try:
-            payload = {
-                "msg_type": "text",
-                "content": {"text": f"{subject}\n\n{content}"}
-            }
-            response = requests.post(url, json=payload, timeout=Timeouts.HTTP_REQUEST)
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    if verbose:
-                        logger.debug("飞书%s推送成功", account_label)
-                    success = True
-                else:
-                    logger.warning("飞书%s推送失败: %s", account_label,
-                                   result.get("msg", "未知错误"))
-            else:
-                logger.warning("飞书%s推送失败: HTTP %d", account_label, response.status_code)
-
-        except requests.RequestException as e:
-            logger.error("飞书%s推送网络异常: %s", account_label, e)
-        except Exception as e:
-            logger.exception("飞书%s推送未预期异常", account_label)
-
-    return success
+    payload = {
+        "msg_type": "text",
+        "content": {"text": f"{subject}\n\n{content}"}
+    }
+
+    return _send_webhook(_FEISHU, webhook_url, payload, verbose, first_success_only)
 
 
 def send_simple_dingtalk(
     webhook_url: str,
     subject: str,
     content: str,
-    verbose: bool = False
+    verbose: bool = False,
+    first_success_only: bool = False
 ) -> bool:
     """
     发送钉钉 webhook 消息（支持多账号）
@@ -84,40 +324,17 @@ def send_simple_dingtalk(
         subject: 消息标题
         content: 消息内容
         verbose: 是否输出详细日志
+        first_success_only: 是否在首个账号成功后停止（其余账号作为备用）
 
     Returns:
         是否至少有一个账号发送成功
     """
-    urls = [url.strip() for url in webhook_url.split(";") if url.strip()]
-    success = False
-
-    for i, url in enumerate(urls[:Limits.MAX_ACCOUNTS_PER_CHANNEL]):
-        account_label = f"[{i+1}]" if len(urls) > 1 else ""
-        try:
-            payload = {
-                "msgtype": "markdown",
-                "markdown": {"title": subject, "text": f"## {subject}\n\n{content}"}
-            }
-            response = requests.post(url, json=payload, timeout=Timeouts.HTTP_REQUEST)
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    if verbose:
-                        logger.debug("钉钉%s推送成功", account_label)
-                    success = True
-                else:
-                    logger.warning("钉钉%s推送失败: %s", account_label,
-                                   result.get("errmsg", "未知错误"))
-            else:
-                logger.warning("钉钉%s推送失败: HTTP %d", account_label, response.status_code)
-
-        except requests.RequestException as e:
-            logger.error("钉钉%s推送网络异常: %s", account_label, e)
-        except Exception as e:
-            logger.exception("钉钉%s推送未预期异常", account_label)
-
-    return success
+    payload = {
+        "msgtype": "markdown",
+        "markdown": {"title": subject, "text": f"## {subject}\n\n{content}"}
+    }
+
+    return _send_webhook(_DINGTALK, webhook_url, payload, verbose, first_success_only)
 
 
 def send_simple_wework(
@@ -125,7 +342,8 @@ def send_simple_wework(
     subject: str,
     content: str,
     msg_type: str = "markdown",
-    verbose: bool = False
+    verbose: bool = False,
+    first_success_only: bool = False
 ) -> bool:
     """
     发送企业微信 webhook 消息（支持多账号）
@@ -136,41 +354,17 @@ def send_simple_wework(
         content: 消息内容
         msg_type: 消息类型 (markdown/text)
         verbose: 是否输出详细日志
+        first_success_only: 是否在首个账号成功后停止（其余账号作为备用）
 
     Returns:
         是否至少有一个账号发送成功
     """
-    urls = [url.strip() for url in webhook_url.split(";") if url.strip()]
-    success = False
-
-    for i, url in enumerate(urls[:Limits.MAX_ACCOUNTS_PER_CHANNEL]):
-        account_label = f"[{i+1}]" if len(urls) > 1 else ""
-        try:
-            if msg_type.lower() == "text":
-                payload = {"msgtype": "text", "text": {"content": f"{subject}\n\n{content}"}}
-            else:
-                payload = {"msgtype": "markdown", "markdown": {"content": f"## {subject}\n\n{content}"}}
-
-            response = requests.post(url, json=payload, timeout=Timeouts.HTTP_REQUEST)
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    if verbose:
-                        logger.debug("企业微信%s推送成功", account_label)
-                    success = True
-                else:
-                    logger.warning("企业微信%s推送失败: %s", account_label,
-                                   result.get("errmsg", "未知错误"))
-            else:
-                logger.warning("企业微信%s推送失败: HTTP %d", account_label, response.status_code)
-
-        except requests.RequestException as e:
-            logger.error("企业微信%s推送网络异常: %s", account_label, e)
-        except Exception as e:
-            logger.exception("企业微信%s推送未预期异常", account_label)
-
-    return success
+    if msg_type.lower() == "text":
+        payload = {"msgtype": "text", "text": {"content": f"{subject}\n\n{content}"}}
+    else:
+        payload = {"msgtype": "markdown", "markdown": {"content": f"## {subject}\n\n{content}"}}
+
+    return _send_webhook(_WEWORK, webhook_url, payload, verbose, first_success_only)
 
 
 def send_simple_telegram(
@@ -178,7 +372,8 @@ def send_simple_telegram(
     chat_id: str,
     subject: str,
     content: str,
-    verbose: bool = False
+    verbose: bool = False,
+    first_success_only: bool = False
 ) -> bool:
     """
     发送 Telegram 消息（支持多账号）
@@ -189,47 +384,32 @@ def send_simple_telegram(
         subject: 消息标题
         content: 消息内容
         verbose: 是否输出详细日志
+        first_success_only: 是否在首个账号成功后停止（其余账号作为备用）
 
     Returns:
         是否至少有一个账号发送成功
     """
-    tokens = [t.strip() for t in bot_token.split(";") if t.strip()]
-    chat_ids = [c.strip() for c in chat_id.split(";") if c.strip()]
+    tokens = _split_urls(bot_token)
+    chat_ids = _split_urls(chat_id)
 
     if len(tokens) != len(chat_ids):
         logger.error("Telegram 配置错误: bot_token 和 chat_id 数量不匹配 (%d vs %d)",
                      len(tokens), len(chat_ids))
         return False
 
-    success = False
-    for i, (token, cid) in enumerate(zip(tokens[:Limits.MAX_ACCOUNTS_PER_CHANNEL],
-                                          chat_ids[:Limits.MAX_ACCOUNTS_PER_CHANNEL])):
-        account_label = f"[{i+1}]" if len(tokens) > 1 else ""
-        try:
-            url = f"https://api.telegram.org/bot{token}/sendMessage"
-            payload = {
-                "chat_id": cid,
-                "text": f"<b>{subject}</b>\n\n{content}",
-                "parse_mode": "HTML",
-                "disable_web_page_preview": True
-            }
-            response = requests.post(url, json=payload, timeout=Timeouts.HTTP_REQUEST)
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    if verbose:
-                        logger.debug("Telegram%s推送成功", account_label)
-                    success = True
-                else:
-                    logger.warning("Telegram%s推送失败: %s", account_label,
-                                   result.get("description", "未知错误"))
-            else:
-                logger.warning("Telegram%s推送失败: HTTP %d", account_label, response.status_code)
-
-        except requests.RequestException as e:
-            logger.error("Telegram%s推送网络异常: %s", account_label, e)
-        except Exception as e:
-            logger.exception("Telegram%s推送未预期异常", account_label)
-
-    return success
+    text = f"<b>{subject}</b>\n\n{content}"
+
+    def send_one(account_label: str, account: tuple) -> bool:
+        token, cid = account
+        url = _TELEGRAM_URL(token)
+        body = _dumps({
+            "chat_id": cid,
+            "text": text,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True
+        })
+        return _send_to_account(_TELEGRAM, account_label, url, body, verbose)
+
+    accounts = list(zip(tokens[:Limits.MAX_ACCOUNTS_PER_CHANNEL],
+                        chat_ids[:Limits.MAX_ACCOUNTS_PER_CHANNEL]))
+    return _fan_out(send_one, accounts, first_success_only)
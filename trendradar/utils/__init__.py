@@ -9,6 +9,7 @@ from trendradar.utils.time import (
     format_time_filename,
     get_current_time_display,
     convert_time_for_display,
+    fast_isoformat,
 )
 from trendradar.utils.url import normalize_url, get_url_signature
 
@@ -18,6 +19,7 @@ __all__ = [
     "format_time_filename",
     "get_current_time_display",
     "convert_time_for_display",
+    "fast_isoformat",
     "normalize_url",
     "get_url_signature",
 ]
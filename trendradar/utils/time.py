@@ -3,8 +3,9 @@
 时间工具模块 - 统一时间处理函数
 """
 
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 import pytz
 
@@ -15,6 +16,33 @@ logger = get_logger(__name__)
 # 默认时区
 DEFAULT_TIMEZONE = "Asia/Shanghai"
 
+# 本地时间 ISO 前缀缓存：(整秒时间戳, "YYYY-MM-DDTHH:MM:SS")
+_ISO_CACHE: Tuple[int, str] = (0, "")
+
+
+def fast_isoformat() -> str:
+    """
+    获取本地当前时间的 ISO 格式字符串（带微秒）
+
+    等价于 datetime.now().isoformat()，同一秒内复用已格式化的前缀，
+    只拼接微秒部分，用于任务状态等高频时间戳。
+
+    Returns:
+        ISO 格式时间字符串，如 '2025-12-09T15:30:00.123456'
+    """
+    global _ISO_CACHE
+    t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _ISO_CACHE
+    if sec != cached_sec:
+        lt = time.localtime(sec)
+        prefix = (
+            f"{lt.tm_year:04}-{lt.tm_mon:02}-{lt.tm_mday:02}"
+            f"T{lt.tm_hour:02}:{lt.tm_min:02}:{lt.tm_sec:02}"
+        )
+        _ISO_CACHE = (sec, prefix)
+    return f"{prefix}.{int((t - sec) * 1_000_000):06}"
+
 
 def get_configured_time(timezone: str = DEFAULT_TIMEZONE) -> datetime:
     """